@@ -0,0 +1,94 @@
+"""Scaling of the integer minor-unit amounts of a BAI2 file by the exponent of their currency.
+
+BAI2 amounts have no decimal point, their implied number of decimals is the ISO 4217 exponent of the currency of the
+account, or of the group when the account has no currency. The conversion is done for a whole column at once:
+the currency codes are factorized, the exponent is looked up once per distinct currency and broadcast to the rows.
+"""
+
+__all__ = ["CURRENCY_EXPONENTS", "DEFAULT_EXPONENT", "currency_exponents", "to_decimals", "to_major_units"]
+
+import numpy as np
+import pandas as pd
+
+from decimal import Decimal
+from typing import Dict, List, Sequence
+
+# the currencies with an exponent other than 2, as per ISO 4217
+CURRENCY_EXPONENTS: Dict[str, int] = {
+    "BHD": 3,
+    "BIF": 0,
+    "CLF": 4,
+    "CLP": 0,
+    "DJF": 0,
+    "GNF": 0,
+    "IQD": 3,
+    "ISK": 0,
+    "JOD": 3,
+    "JPY": 0,
+    "KMF": 0,
+    "KRW": 0,
+    "KWD": 3,
+    "LYD": 3,
+    "OMR": 3,
+    "PYG": 0,
+    "RWF": 0,
+    "TND": 3,
+    "UGX": 0,
+    "UYI": 0,
+    "UYW": 4,
+    "VND": 0,
+    "VUV": 0,
+    "XAF": 0,
+    "XOF": 0,
+    "XPF": 0,
+}
+DEFAULT_EXPONENT = 2
+
+
+def currency_exponents(currency_codes: Sequence[str | None], exponents: Dict[str, int] | None = None) -> np.ndarray:
+    """Looks up the exponent of every currency code of a column
+    :param currency_codes: The currency code of every row, rows without a currency get the default exponent of 2
+    :param exponents: Exponents that override or extend `CURRENCY_EXPONENTS`
+    :return: The exponent of every row, as an int64 array
+    """
+    table = CURRENCY_EXPONENTS if exponents is None else {**CURRENCY_EXPONENTS, **exponents}
+    codes, uniques = pd.factorize(pd.Series(currency_codes, dtype=object), use_na_sentinel=True)
+
+    # one lookup per distinct currency, the last entry is the exponent of the rows without a currency (code -1)
+    unique_exponents = np.array(
+        [table.get(str(currency).upper(), DEFAULT_EXPONENT) for currency in uniques] + [DEFAULT_EXPONENT],
+        dtype=np.int64,
+    )
+    return unique_exponents[codes]
+
+
+def to_major_units(
+    amounts: Sequence[int] | np.ndarray,
+    currency_codes: Sequence[str | None],
+    exponents: Dict[str, int] | None = None,
+) -> np.ndarray:
+    """Scales a column of minor-unit amounts to float major units, e.g. cents to dollars
+    :param amounts: The minor-unit amounts, nulls (None or NaN) stay NaN
+    :param currency_codes: The currency code of every amount
+    :param exponents: Exponents that override or extend `CURRENCY_EXPONENTS`
+    :return: The amounts in major units, as a float64 array
+    """
+    scale = 10.0 ** currency_exponents(currency_codes, exponents)
+    return pd.to_numeric(pd.Series(amounts), errors="raise").to_numpy(dtype=np.float64, na_value=np.nan) / scale
+
+
+def to_decimals(
+    amounts: Sequence[int | None] | np.ndarray,
+    currency_codes: Sequence[str | None],
+    exponents: Dict[str, int] | None = None,
+) -> List[Decimal | None]:
+    """Converts a column of minor-unit amounts to exact `Decimal` values in major units
+    :param amounts: The minor-unit amounts, nulls stay None
+    :param currency_codes: The currency code of every amount
+    :param exponents: Exponents that override or extend `CURRENCY_EXPONENTS`
+    :return: The amounts in major units, as Decimals
+    """
+    return [
+        None if amount is None or amount != amount else Decimal(int(amount)).scaleb(-int(exponent))
+        for amount, exponent in zip(amounts, currency_exponents(currency_codes, exponents))
+    ]
@@ -0,0 +1,158 @@
+"""Balances table of the account status and summary fields of the '03' records.
+
+After the account number and currency, an account identifier record repeats groups of (type code, amount, item count,
+funds type) fields, the funds type being followed by its availability fields like in a transaction record. The groups
+of all the accounts are split into flat column lists, and the amounts and item counts are converted to numbers for
+whole columns at once. Records without an 'S', 'V' or 'D' funds type, which are nearly all of them, are split with
+list slices rather than group by group.
+"""
+
+__all__ = ["balance_columns", "balance_names", "balances_dataframe", "pivot_balances"]
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from typing import Any, Dict, List, Sequence
+
+from bai2_reader.src import amounts, type_codes as type_codes_table
+
+# funds types followed by a fixed number of availability fields
+_AVAILABILITY_FIELDS = {"S": 3, "V": 2}
+
+
+def balance_columns(status_fields: Sequence[List[Any]]) -> Dict[str, List[Any]]:
+    """Splits the status and summary fields of every account into flat columns, one row per type code
+    :param status_fields: The fields of every '03' record from its first type code on, followed by the fields of
+    its continuation records. The trailing '/' of the record is dropped.
+    :return: The columns `account_index`, `type_code`, `amount`, `item_count` and `funds_type`,
+    the amounts and item counts are left as they are in the file
+    """
+    columns: Dict[str, List[Any]] = {
+        "account_index": [],
+        "type_code": [],
+        "amount": [],
+        "item_count": [],
+        "funds_type": [],
+    }
+
+    for account_index, fields in enumerate(status_fields):
+        fields = _strip_terminator(fields)
+        start = len(columns["type_code"])
+
+        if not any(funds_type in ("S", "V", "D") for funds_type in fields[3::4]):
+            # no availability fields, every group is 4 fields long
+            fields = fields + [None] * (-len(fields) % 4)
+            columns["type_code"].extend(fields[0::4])
+            columns["amount"].extend(fields[1::4])
+            columns["item_count"].extend(fields[2::4])
+            columns["funds_type"].extend(fields[3::4])
+        else:
+            position = 0
+            while position < len(fields):
+                funds_type = fields[position + 3] if len(fields) > position + 3 else None
+                columns["type_code"].append(fields[position])
+                columns["amount"].append(fields[position + 1] if len(fields) > position + 1 else None)
+                columns["item_count"].append(fields[position + 2] if len(fields) > position + 2 else None)
+                columns["funds_type"].append(funds_type)
+
+                position += 4 + _AVAILABILITY_FIELDS.get(funds_type, 0)
+                if funds_type == "D":
+                    distributions = fields[position] if len(fields) > position else None
+                    position += 1 + 2 * (int(distributions) if distributions else 0)
+
+        columns["account_index"].extend([account_index] * (len(columns["type_code"]) - start))
+
+    # groups without a type code are empty padding, e.g. the ',,,' of a record without a first status
+    keep = [bool(type_code) for type_code in columns["type_code"]]
+    if not all(keep):
+        columns = {name: [value for value, kept in zip(values, keep) if kept] for name, values in columns.items()}
+    return columns
+
+
+def _strip_terminator(fields: List[Any]) -> List[Any]:
+    """Drops the '/' that ends a record from its last field"""
+    if fields and isinstance(fields[-1], str) and fields[-1].rstrip().endswith("/"):
+        return [*fields[:-1], fields[-1].rstrip()[:-1]]
+    return list(fields)
+
+
+def balances_dataframe(
+    status_fields: Sequence[List[Any]],
+    group_index: Sequence[int],
+    account_number: Sequence[str],
+    currency_code: Sequence[str | None],
+    major_units: bool = False,
+) -> pd.DataFrame:
+    """Balances table, one row per account per status or summary type code
+    :param status_fields: The status and summary fields of every account, see `balance_columns`
+    :param group_index: The index of the group of every account
+    :param account_number: The account number of every account
+    :param currency_code: The currency of every account, the currency of its group when the account has none
+    :param major_units: Whether to scale the amounts by the exponent of their currency, see `amounts`
+    :return: The balances, with nullable int64 `amount` and `item_count` columns, or a float64 `amount` in major units
+    """
+    columns = balance_columns(status_fields)
+    account_index = np.asarray(columns.pop("account_index"), dtype=np.int64)
+
+    balances = {
+        "group_index": np.asarray(group_index, dtype=np.int64)[account_index],
+        "account_index": account_index,
+        "account_number": np.asarray(account_number, dtype=object)[account_index],
+        "currency_code": np.asarray(currency_code, dtype=object)[account_index],
+        "type_code": columns["type_code"],
+        "amount": _to_integers(columns["amount"]),
+        "item_count": _to_integers(columns["item_count"]),
+        "funds_type": [funds_type or None for funds_type in columns["funds_type"]],
+    }
+    if major_units:
+        balances["amount"] = amounts.to_major_units(balances["amount"], balances["currency_code"])
+    return pd.DataFrame(balances)
+
+
+def _to_integers(values: List[Any]) -> pd.Series:
+    """Converts a column of numbers to a nullable int64 column, empty fields become nulls"""
+    return pd.to_numeric(pd.Series([None if value == "" else value for value in values], dtype=object)).astype("Int64")
+
+
+def balance_names(type_codes: Sequence[str]) -> Dict[str, str]:
+    """Column names of the type codes in the wide balances table, the snake case of their description
+    e.g. 'opening_ledger' for '010'. Unknown type codes and codes sharing a description are named 'type_code_{code}'.
+    :param type_codes: The type codes to be named
+    :return: The column name of every type code
+    """
+    table = type_codes_table.get_table()
+    names = {}
+    for type_code in type_codes:
+        details = table.get(type_code)
+        description = details.description if details is not None else None
+        name = re.sub(r"[^0-9a-z]+", "_", description.lower()).strip("_") if description else ""
+        names[type_code] = name if name and name[0].isalpha() else f"type_code_{type_code}"
+
+    taken = list(names.values())
+    return {
+        type_code: name if taken.count(name) == 1 else f"type_code_{type_code}" for type_code, name in names.items()
+    }
+
+
+def pivot_balances(balances: pd.DataFrame, values: str = "amount", names: bool = True) -> pd.DataFrame:
+    """Wide balances table, one row per account and one column per type code
+    :param balances: The balances table, see `balances_dataframe`
+    :param values: The column of the balances table to spread, defaults to the amounts
+    :param names: Whether to name the columns after the type codes descriptions, see `balance_names`,
+    otherwise the columns are the type codes
+    :return: The wide balances table, the last value wins when an account repeats a type code
+    """
+    index = ["group_index", "account_index", "account_number", "currency_code"]
+    wide = (
+        balances.drop_duplicates(["account_index", "type_code"], keep="last")
+        .pivot(index="account_index", columns="type_code", values=values)
+        .rename_axis(columns=None)
+    )
+
+    accounts = balances.drop_duplicates("account_index").set_index("account_index")[index[:1] + index[2:]]
+    wide = accounts.join(wide).reset_index()[index + list(wide.columns)]
+    if names:
+        wide = wide.rename(columns=balance_names(list(wide.columns[len(index) :])))
+    return wide
@@ -0,0 +1,213 @@
+"""Batch export of many BAI2 files, optionally in a pool of worker processes.
+
+Every file is read and written on its own, a failure in one file is recorded in its `ExportResult` and does not stop
+the other files. The output file names are decided up front from the input files, so they do not depend on the order
+in which the workers finish.
+"""
+
+__all__ = ["ExportResult", "ExportSummary", "export_file", "export_files", "output_file_names_for"]
+
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+from bai2_reader.src import enums, exceptions as exc, sources
+from bai2_reader.src.logger import log
+from bai2_reader.src.reader import BAI2Reader
+
+
+@dataclass
+class ExportResult:
+    """Outcome of the export of a single file"""
+
+    input_file: str
+    output_files: List[str] = field(default_factory=list)
+    records: int = 0
+    seconds: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class ExportSummary:
+    """Outcome of the export of a batch of files, the results are in the order of the input files"""
+
+    results: List[ExportResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def files(self) -> int:
+        """Number of files in the batch"""
+        return len(self.results)
+
+    @property
+    def records(self) -> int:
+        """Number of records read from the exported files"""
+        return sum(result.records for result in self.results)
+
+    @property
+    def failures(self) -> List[ExportResult]:
+        """Results of the files that failed to export"""
+        return [result for result in self.results if result.error is not None]
+
+    def __str__(self) -> str:
+        """One line summary of the batch, e.g. for the CLI"""
+        return (
+            f"files: {self.files}, records: {self.records}, seconds: {self.seconds:.2f}, failures: {len(self.failures)}"
+        )
+
+
+def output_file_names_for(
+    input_files: List[str],
+    output_format: enums.OutputFormat,
+    output_file_names: List[str] | None = None,
+) -> List[str]:
+    """Maps every input file to its output file name.
+    The default name is '{input file name without extension}_{batch start time in UTC}.{output format}',
+    input files with the same name get a '_{n}' suffix so they don't overwrite each other.
+    :param input_files: The input BAI2 files
+    :param output_format: The output format, used as the extension of the default names
+    :param output_file_names: Custom output file names, one per input file
+    :return: The output file names, in the order of the input files
+    """
+    if output_file_names:
+        if len(output_file_names) != len(input_files):
+            log.debug(f"input_files: {input_files} | output_file_names: {output_file_names}")
+            raise exc.Bai2ReaderException(
+                "Output filenames are passed but the count of output filenames doesnt match with input files passed"
+            )
+        return list(output_file_names)
+
+    batch_time = datetime.now(tz=timezone.utc)
+    names = []
+    seen: Dict[str, int] = {}
+    for input_file in input_files:
+        stem = Path(input_file).stem
+        seen[stem] = seen.get(stem, 0) + 1
+        suffix = f"_{seen[stem] - 1}" if seen[stem] > 1 else ""
+        names.append(f"{stem}{suffix}_{batch_time}.{output_format.extension}")
+
+    return names
+
+
+def export_file(
+    input_file: str,
+    output_file_name: str,
+    output_dir: str = "output",
+    output_format: enums.OutputFormat = enums.OutputFormat.CSV,
+    run_validation: bool = True,
+    encoding: str = "utf-8",
+    write_args: Dict | None = None,
+    writer_args: Dict | None = None,
+    layout: enums.Layout = enums.Layout.flat,
+) -> ExportResult:
+    """Reads a single BAI2 file and writes it to the output directory, errors are returned and not raised.
+    The formats with a streaming writer are written while the file is parsed, see `BAI2Reader.export_file`.
+    :param input_file: The BAI2 file to be exported, either plain or gzip/bz2/xz/zip compressed
+    :param output_file_name: The name of the output file, the files of a zip archive with more than one file
+    are written to '{output file name without extension}_{name of the file in the archive}.{extension}'.
+    :param output_dir: The directory where the output file will be saved, defaults to "output".
+    :param output_format: The format to write the output file in, defaults to CSV.
+    :param run_validation: Whether to validate the record counts in the trailers, defaults to True.
+    :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+    :param write_args: Write args that will be passed to pandas to_csv/to_json/to_parquet functions
+    :param writer_args: Args of the streaming writer of the output format, e.g. the row group size of parquet
+    :param layout: How the data is laid out, a flat table by default, or the normalized tables in a directory named
+    after the output file without its extension, see `BAI2Reader.write_data`
+    :return: The result of the export
+    """
+    result = ExportResult(input_file=input_file)
+    start = time.perf_counter()
+
+    try:
+        reader = BAI2Reader(
+            write_to_files=True,
+            run_validation=run_validation,
+            output_dir=output_dir,
+            output_format=output_format,
+            encoding=encoding,
+            layout=layout,
+        )
+
+        # every file of a zip archive is written to its own output file
+        members = sources.archive_members(input_file) or [None]
+        for member in members:
+            member_file_name = output_file_name
+            if len(members) > 1:
+                output_stem, output_suffix = Path(output_file_name).stem, Path(output_file_name).suffix
+                member_file_name = f"{output_stem}_{Path(member).stem}{output_suffix}"
+
+            output_abs = reader.export_file(
+                input_file,
+                output_file_name=member_file_name,
+                write_args=write_args,
+                writer_args=writer_args,
+                member=member,
+            )
+            result.output_files.append(str(output_abs))
+            result.records += sum(reader.stats.record_counts.values())
+    except Exception as e:
+        log.error(f"Failed to export input file: {input_file}. Error: {e}")
+        result.error = f"{type(e).__name__}: {e}"
+
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def export_files(
+    input_files: List[str],
+    output_file_names: List[str] | None = None,
+    workers: int | None = None,
+    output_dir: str = "output",
+    output_format: enums.OutputFormat = enums.OutputFormat.CSV,
+    run_validation: bool = True,
+    encoding: str = "utf-8",
+    write_args: Dict | None = None,
+    writer_args: Dict | None = None,
+    layout: enums.Layout = enums.Layout.flat,
+) -> ExportSummary:
+    """Exports a batch of BAI2 files, in a pool of worker processes if `workers` is more than 1
+    :param input_files: The BAI2 files to be exported
+    :param output_file_names: Custom output file names, one per input file
+    :param workers: Number of worker processes, by default the files are exported in the current process
+    :param output_dir: The directory where the output files will be saved, defaults to "output".
+    :param output_format: The format to write the output files in, defaults to CSV.
+    :param run_validation: Whether to validate the record counts in the trailers, defaults to True.
+    :param encoding: The encoding of the BAI2 files, defaults to "utf-8".
+    :param write_args: Write args that will be passed to pandas to_csv/to_json/to_parquet functions
+    :param writer_args: Args of the streaming writer of the output format, e.g. the row group size of parquet
+    :param layout: How the data is laid out, a flat table by default, see `export_file`
+    :return: The summary of the export, with one result per input file
+    """
+    output_file_names = output_file_names_for(input_files, output_format, output_file_names)
+    options = dict(
+        output_dir=output_dir,
+        output_format=output_format,
+        run_validation=run_validation,
+        encoding=encoding,
+        write_args=write_args,
+        writer_args=writer_args,
+        layout=layout,
+    )
+
+    start = time.perf_counter()
+    summary = ExportSummary()
+    if workers is not None and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(export_file, input_file, output_file_name, **options)
+                for input_file, output_file_name in zip(input_files, output_file_names)
+            ]
+            summary.results = [future.result() for future in futures]
+    else:
+        summary.results = [
+            export_file(input_file, output_file_name, **options)
+            for input_file, output_file_name in zip(input_files, output_file_names)
+        ]
+
+    summary.seconds = time.perf_counter() - start
+    log.info(f"Exported {summary}")
+    return summary
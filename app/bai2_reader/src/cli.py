@@ -1,15 +1,33 @@
 """BAI2 Reader CLI"""
 
 import json
+import os
+import sys
 import typer
 
-from bai2_reader.src import enums, exceptions as exc
-from bai2_reader.src.logger import log
+from pathlib import Path
+from typing import Dict
+
+from bai2_reader.src import batch, enums, exceptions as exc, sources
 from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src.logger import log
 
 app = typer.Typer(help="Utility to parse BAI2 files")
 
 
+def _json_option(name: str, value: str | None) -> Dict | None:
+    """Parses an option that is passed as a JSON object"""
+    if not value:
+        return None
+    try:
+        parsed = json.loads(value)
+    except json.JSONDecodeError as e:
+        raise exc.Bai2ReaderException(f"Failed to Parse the {name}: {value}.\n Exception: {e}")
+
+    log.debug(f"{name}: {parsed}")
+    return parsed
+
+
 @app.command(help="Export BAI2 file to structured formats")
 def export(
     input_files: str = typer.Option(
@@ -32,38 +50,109 @@ def export(
                     \n\nNote    : Make sure you wrap the strings in double quotes. :)
                     """,
     ),
+    writer_args: str = typer.Option(
+        None,
+        help="""Args of the streaming CSV/Parquet/Excel writers, used when no write args are passed
+                    \n\nExample : '{"row_group_size": 100000, "compression": "snappy"}' for parquet
+                    \n\nExample : '{"split_by": "account"}' for excel
+                    """,
+    ),
+    workers: int = typer.Option(
+        1, min=1, help="Number of worker processes to export the input files in parallel, one file per worker"
+    ),
+    output: str = typer.Option(
+        None,
+        help="""Output file of a single input file, instead of the output dir and file names.
+                    '-' writes CSV or JSONL to stdout, to pipe the export into other commands""",
+    ),
+    layout: enums.Layout = typer.Option(
+        enums.Layout.flat,
+        help="""'flat' writes a row per transaction, 'normalized' writes the files, groups, accounts, transactions
+                    and continuations tables linked by integer keys, to a directory named after the output file
+                    without its extension, or to a sheet per table for excel""",
+    ),
 ):
     """Export BAI2 file to structured formats"""
     input_files = input_files.split(",")
     output_file_names = output_file_names.split(",") if output_file_names else []
 
-    if len(input_files) > 1 and len(output_file_names) > 1 and len(input_files) != len(output_file_names):
-        log.debug(f"input_files: {input_files} | output_file_names: {output_file_names}")
-        raise exc.Bai2ReaderException(
-            "Output filenames are passed but the count of output filenames doesnt match with input files passed"
-        )
-
-    if write_args:
-        try:
-            write_args = json.loads(write_args)
-        except json.JSONDecodeError as e:
-            raise exc.Bai2ReaderException(f"Failed to Parse the write_args: {write_args}.\n Exception: {e}")
+    write_args = _json_option("write_args", write_args)
+    writer_args = _json_option("writer_args", writer_args)
 
-        log.debug(f"write_args: {write_args}")
-        exit()
+    if output:
+        if len(input_files) != 1:
+            raise exc.Bai2ReaderException("An output file can only be passed for a single input file")
+        if output == "-":
+            _export_to_stdout(input_files[0], output_format, run_validation, encoding, writer_args, layout)
+            return
+        output_dir, output_file_names = str(Path(output).parent), [Path(output).name]
 
-    reader = BAI2Reader(
-        write_to_files=True,
-        run_validation=run_validation,
+    summary = batch.export_files(
+        input_files,
+        output_file_names=output_file_names,
+        workers=workers,
         output_dir=output_dir,
         output_format=output_format,
+        run_validation=run_validation,
         encoding=encoding,
+        write_args=write_args,
+        writer_args=writer_args,
+        layout=layout,
     )
 
-    for cntr, input_file in enumerate(input_files):
-        reader.read_file(file_path=input_file).write_data(
-            output_file_name=output_file_names[cntr] if output_file_names else None, write_args=write_args
-        )
+    for result in summary.failures:
+        typer.echo(f"Failed: {result.input_file} | {result.error}", err=True)
+    typer.echo(f"Summary: {summary}")
+
+    if summary.failures:
+        raise typer.Exit(code=1)
+
+
+def _export_to_stdout(
+    input_file: str,
+    output_format: enums.OutputFormat,
+    run_validation: bool,
+    encoding: str,
+    writer_args: Dict | None,
+    layout: enums.Layout = enums.Layout.flat,
+) -> None:
+    """Exports a single file to stdout, the logs and errors go to stderr"""
+    reader = BAI2Reader(run_validation=run_validation, encoding=encoding, layout=layout)
+    try:
+        reader.export_file(input_file, output_format=output_format, writer_args=writer_args, output_stream=sys.stdout)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # the reading end was closed early, e.g. by `head`, the rest of the output is discarded
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        raise typer.Exit(code=1)
+    except Exception as e:
+        typer.echo(f"Failed: {input_file} | {type(e).__name__}: {e}", err=True)
+        raise typer.Exit(code=1)
+
+
+@app.command(help="Validate the record counts of BAI2 files, without exporting them")
+def validate(
+    input_files: str = typer.Option(
+        ...,
+        help="Input BAI2 file, if you have multiple files pass them as comma separated. ",
+    ),
+    encoding: str = typer.Option("utf-8", help="Input BAI2 file"),
+):
+    """Validate BAI2 files, the files are read into the model but no DataFrame is built"""
+    reader = BAI2Reader(run_validation=True, encoding=encoding)
+
+    failures = 0
+    for input_file in input_files.split(","):
+        try:
+            for member in sources.archive_members(input_file) or [None]:
+                reader.read_file(file_path=input_file, member=member)
+            typer.echo(f"Valid: {input_file}")
+        except Exception as e:
+            failures += 1
+            typer.echo(f"Invalid: {input_file} | {type(e).__name__}: {e}", err=True)
+
+    if failures:
+        raise typer.Exit(code=1)
 
 
 @app.callback()
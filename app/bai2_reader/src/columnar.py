@@ -0,0 +1,318 @@
+"""Columnar parse engine, which tokenizes a BAI2 file straight into per column buffers.
+
+The '16' and '88' records are never turned into pydantic models or dictionaries, their fields are appended to
+`array.array` buffers (amounts and indexes) and lists (texts) that are handed over to pandas or pyarrow as they are.
+The less frequent records ('01', '02', '03', '49', '98', '99') go through the regular handlers of `parser`,
+so the trailer counts are validated the same way as in `BAI2Reader.read_file`.
+"""
+
+__all__ = ["ColumnarData", "ColumnarParser", "read_columns"]
+
+import numpy as np
+import pandas as pd
+
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from bai2_reader.src import amounts, balances, continuations, enums, exceptions as exc, parser, sources
+
+
+@dataclass
+class ColumnarData:
+    """Per column buffers of a parsed BAI2 file, one table each for the groups, accounts and transactions.
+    Accounts point to their group with `group_index`, transactions point to their group and account with
+    `group_index` and `account_index`. Amounts are the implied decimal integers of the BAI2 file.
+    """
+
+    groups: Dict[str, Any] = field(
+        default_factory=lambda: {
+            "receiver": [],
+            "sender": [],
+            "as_of_date": [],
+            "as_of_time": [],
+            "currency_code": [],
+        }
+    )
+    accounts: Dict[str, Any] = field(
+        default_factory=lambda: {
+            "group_index": array("q"),
+            "account_number": [],
+            "currency_code": [],
+            "account_summary": [],
+            "status_fields": [],
+        }
+    )
+    transactions: Dict[str, Any] = field(
+        default_factory=lambda: {
+            "group_index": array("q"),
+            "account_index": array("q"),
+            "record_counter": array("q"),
+            "type_code": [],
+            "amount": array("q"),
+            "amount_is_null": bytearray(),
+            "funds_type": [],
+            "bank_reference_number": [],
+            "customer_reference_number": [],
+            "description": [],
+            "transaction_summary": [],
+        }
+    )
+    continuations: Dict[str, Any] = field(
+        default_factory=lambda: {
+            "transaction_index": array("q"),
+            "record": [],
+        }
+    )
+
+    def __len__(self) -> int:
+        """Number of transactions"""
+        return len(self.transactions["record_counter"])
+
+    def extend(self, other: "ColumnarData") -> None:
+        """Appends the rows of another `ColumnarData`, e.g. of the next segment of a file that is parsed in parallel.
+        The group, account and transaction indexes of its rows are shifted past the rows of this one.
+        :param other: The column buffers to append, they are not changed
+        """
+        offsets = {
+            "group_index": len(self.groups["receiver"]),
+            "account_index": len(self.accounts["account_number"]),
+            "transaction_index": len(self),
+        }
+        for table, other_table in (
+            (self.groups, other.groups),
+            (self.accounts, other.accounts),
+            (self.transactions, other.transactions),
+            (self.continuations, other.continuations),
+        ):
+            for name, values in other_table.items():
+                if name in offsets:
+                    table[name].frombytes((np.frombuffer(values, dtype=np.int64) + offsets[name]).tobytes())
+                else:
+                    table[name].extend(values)
+
+    def _transaction_columns(self) -> Dict[str, Any]:
+        """Transaction columns as numpy arrays, with the account number and currency code of their account"""
+        transactions = self.transactions
+        account_index = np.frombuffer(transactions["account_index"], dtype=np.int64)
+
+        return {
+            "group_index": np.frombuffer(transactions["group_index"], dtype=np.int64),
+            "account_index": account_index,
+            "account_number": np.asarray(self.accounts["account_number"], dtype=object)[account_index],
+            "currency_code": np.asarray(self.accounts["currency_code"], dtype=object)[account_index],
+            "record_counter": np.frombuffer(transactions["record_counter"], dtype=np.int64),
+            "type_code": transactions["type_code"],
+            "amount": np.frombuffer(transactions["amount"], dtype=np.int64),
+            "amount_is_null": np.frombuffer(transactions["amount_is_null"], dtype=np.bool_),
+            "funds_type": transactions["funds_type"],
+            "bank_reference_number": transactions["bank_reference_number"],
+            "customer_reference_number": transactions["customer_reference_number"],
+            "description": transactions["description"],
+            "transaction_summary": transactions["transaction_summary"],
+        }
+
+    def to_dataframe(self, major_units: bool = False, tags: Sequence[str] | None = None) -> pd.DataFrame:
+        """Transactions as a DataFrame, one row per '16' record
+        :param major_units: Whether to scale the amounts by the exponent of their currency, see `amounts`
+        :param tags: Tags of the continuation records to be extracted into 'transaction_summary_{tag}' columns,
+        e.g. `continuations.DEFAULT_TAGS`, by default no tag is extracted.
+        :return: The transactions, with a nullable int64 `amount` column, or a float64 one in major units
+        """
+        columns = self._transaction_columns()
+        amount_is_null = columns.pop("amount_is_null")
+        columns["amount"] = pd.arrays.IntegerArray(columns["amount"], amount_is_null)
+        if major_units:
+            columns["amount"] = amounts.to_major_units(columns["amount"], columns["currency_code"])
+        if tags:
+            tag_columns = continuations.extract_tags(
+                self.continuations["record"],
+                np.frombuffer(self.continuations["transaction_index"], dtype=np.int64),
+                len(self),
+                tags,
+            )
+            columns.update({f"transaction_summary_{column}": tag_columns[column] for column in tag_columns.columns})
+        return pd.DataFrame(columns)
+
+    def to_balances_dataframe(self, pivot: bool = False, major_units: bool = False) -> pd.DataFrame:
+        """Balances table of the status and summary fields of the account identifier records, see `balances`
+        :param pivot: Whether to return one row per account with one column per type code, e.g. 'opening_ledger'
+        :param major_units: Whether to scale the amounts by the exponent of their currency, see `amounts`
+        :return: The balances, one row per account per status or summary type code unless pivoted
+        """
+        accounts = self.accounts
+        df = balances.balances_dataframe(
+            accounts["status_fields"],
+            np.frombuffer(accounts["group_index"], dtype=np.int64),
+            accounts["account_number"],
+            accounts["currency_code"],
+            major_units,
+        )
+        return balances.pivot_balances(df) if pivot else df
+
+    def to_arrow(self):
+        """Transactions as a pyarrow Table, one row per '16' record, needs `pyarrow` to be installed"""
+        try:
+            import pyarrow as pa
+        except ModuleNotFoundError:
+            raise exc.Bai2ReaderException(
+                "pyarrow is required to export to arrow, install it with `pip install pyarrow`"
+            )
+
+        columns = self._transaction_columns()
+        amount_is_null = columns.pop("amount_is_null")
+        columns["amount"] = pa.array(columns["amount"], type=pa.int64(), mask=amount_is_null)
+        columns["type_code"] = pa.array(columns["type_code"], type=pa.string()).dictionary_encode()
+        return pa.table(columns)
+
+
+class ColumnarParser:
+    """Parses the lines of a BAI2 file into a `ColumnarData`"""
+
+    def __init__(
+        self,
+        run_validation: bool = True,
+        trusted: bool = False,
+        delimiter: str = ",",
+        amount_mode: enums.AmountMode = enums.AmountMode.float,
+    ):
+        """Initializer
+        :param run_validation: Whether to validate the record counts in the trailers, defaults to True.
+        :param trusted: Whether to skip the pydantic validation of the header and trailer records, defaults to False.
+        :param delimiter: The field delimiter, defaults to ","
+        :param amount_mode: How the amounts of the header and trailer records are parsed, defaults to floats.
+        The transaction amounts are always kept as the integer minor units of the file.
+        """
+        self.state = parser.ParserState(
+            run_validation=run_validation,
+            trusted=trusted,
+            delimiter=delimiter,
+            amount_type=parser.AMOUNT_TYPES[amount_mode],
+        )
+        self.data = ColumnarData()
+
+        self.handlers = {
+            **parser.RECORD_HANDLERS,
+            parser.GROUP_HEADER: self._parse_group_header,
+            parser.ACCOUNT_IDENTIFIER: self._parse_account_identifier,
+            parser.TRANSACTION: self._parse_transaction,
+            parser.CONTINUATION: self._parse_continuation,
+        }
+
+    def parse_line(self, line: str) -> None:
+        """Parses a single line of a BAI2 file into the column buffers
+        :param line: A single line of the BAI2 file
+        """
+        parser.parse_line(self.state, line, self.handlers)
+
+    def _parse_group_header(self, state: parser.ParserState, record: List[str], rest_of_record: str) -> None:
+        """Handler for the group header record, record code: '02'"""
+        group_header = parser.parse_group_header(state, record, rest_of_record)
+
+        groups = self.data.groups
+        groups["receiver"].append(group_header.receiver)
+        groups["sender"].append(group_header.sender)
+        groups["as_of_date"].append(group_header.as_of_date)
+        groups["as_of_time"].append(group_header.as_of_time)
+        groups["currency_code"].append(group_header.currency_code)
+
+    def _parse_account_identifier(self, state: parser.ParserState, record: List[str], rest_of_record: str) -> None:
+        """Handler for the account identifier record, record code: '03'"""
+        if not self.data.groups["receiver"]:
+            raise exc.Bai2ReaderException("Account identifier record found without a preceding group header record")
+
+        account_identifier = parser.parse_account_identifier(state, record, rest_of_record)
+
+        accounts = self.data.accounts
+        accounts["group_index"].append(len(self.data.groups["receiver"]) - 1)
+        accounts["account_number"].append(account_identifier.account_number)
+        # the account currency defaults to the currency of its group
+        accounts["currency_code"].append(account_identifier.currency_code or self.data.groups["currency_code"][-1])
+        accounts["account_summary"].append(None)
+        accounts["status_fields"].append(record[2:])
+
+    def _parse_transaction(self, state: parser.ParserState, record: List[str], rest_of_record: str) -> None:
+        """Handler for the transaction detail record, record code: '16'"""
+        # the account of the transaction is the last one, it has to be in the current group
+        account_groups = self.data.accounts["group_index"]
+        if not account_groups or account_groups[-1] != len(self.data.groups["receiver"]) - 1:
+            raise exc.Bai2ReaderException(
+                "Transaction record found without a preceding account identifier record in its group"
+            )
+
+        state.account_record_counter += 1
+        state.previous_rec_code = parser.TRANSACTION
+
+        type_code, amount, funds_type, bank_reference, customer_reference, text = parser.split_transaction(
+            record, state.delimiter
+        )
+
+        transactions = self.data.transactions
+        transactions["group_index"].append(len(self.data.groups["receiver"]) - 1)
+        transactions["account_index"].append(len(self.data.accounts["account_number"]) - 1)
+        transactions["record_counter"].append(state.total_records_counter)
+        transactions["type_code"].append(type_code)
+        if amount:
+            transactions["amount"].append(int(amount))
+            transactions["amount_is_null"].append(0)
+        else:
+            transactions["amount"].append(0)
+            transactions["amount_is_null"].append(1)
+        transactions["funds_type"].append(funds_type)
+        transactions["bank_reference_number"].append(bank_reference)
+        transactions["customer_reference_number"].append(customer_reference)
+        transactions["description"].append(text)
+        transactions["transaction_summary"].append(None)
+
+    def _parse_continuation(self, state: parser.ParserState, record: List[str], rest_of_record: str) -> None:
+        """Handler for the continuation record, record code: '88'"""
+        state.account_record_counter += 1
+
+        if state.previous_rec_code == parser.TRANSACTION:
+            summary = self.data.transactions["transaction_summary"]
+            self.data.continuations["transaction_index"].append(len(summary) - 1)
+            self.data.continuations["record"].append(rest_of_record)
+        elif state.previous_rec_code == parser.ACCOUNT_IDENTIFIER:
+            summary = self.data.accounts["account_summary"]
+            # the continuation of an account identifier carries more status and summary fields
+            self.data.accounts["status_fields"][-1].extend(record)
+        else:
+            raise exc.Bai2ReaderException(
+                "Continuation record found without a preceding account identifier or transaction record"
+            )
+
+        # same as the " ".join of the continuation records in `bai_to_json`
+        summary[-1] = rest_of_record if summary[-1] is None else f"{summary[-1]} {rest_of_record}"
+
+
+def read_columns(
+    file_path: str | Path,
+    run_validation: bool = True,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    trusted: bool = False,
+    member: str | None = None,
+    amount_mode: enums.AmountMode = enums.AmountMode.float,
+) -> ColumnarData:
+    """Reads a BAI2 file straight into per column buffers, without building a pydantic model per transaction
+    :param file_path: The path to the BAI2 file to be read.
+    :param run_validation: Whether to validate the record counts in the trailers, defaults to True.
+    :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+    :param delimiter: The field delimiter, defaults to ","
+    :param trusted: Whether to skip the pydantic validation of the header and trailer records, defaults to False.
+    :param member: The file to read from a zip archive, only needed if the archive has more than one file.
+    :param amount_mode: How the amounts of the header and trailer records are parsed, defaults to floats.
+    :return: The column buffers of the groups, accounts and transactions
+    """
+    if not Path(file_path).is_file():
+        raise exc.Bai2ReaderException(f"File not found: {file_path}")
+
+    columnar_parser = ColumnarParser(
+        run_validation=run_validation, trusted=trusted, delimiter=delimiter, amount_mode=amount_mode
+    )
+    with sources.open_text(file_path, encoding=encoding, member=member) as file:
+        for line in file:
+            columnar_parser.parse_line(line)
+
+    return columnar_parser.data
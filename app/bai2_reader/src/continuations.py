@@ -0,0 +1,79 @@
+"""Extraction of the tagged fields of the continuation records ('88') into columns.
+
+Banks put one tagged field per continuation record, e.g. '88,EREF: GS0DGZ0KMJ4QQPH' or '88,DBNM: XYZ Limited'.
+The continuation records of all the transactions are handled as one string column: the tags are split off with
+vectorized regexes, run by pyarrow when it is installed, a record without a tag continues the value of the previous
+record of the same transaction, and the values are scattered to one column per tag with numpy indexing.
+No regex is run per transaction.
+"""
+
+__all__ = ["DEFAULT_TAGS", "TAG_PATTERN", "extract_tags"]
+
+import numpy as np
+import pandas as pd
+
+from typing import Sequence
+
+from bai2_reader.src import exceptions as exc
+
+DEFAULT_TAGS = ("EREF", "DBNM", "CACT", "REMI")
+
+# an upper case tag of up to 8 characters followed by a colon, at the start of the record
+TAG_PATTERN = r"^\s*([A-Z][A-Z0-9]{1,7}):"
+
+
+def extract_tags(
+    records: Sequence[str],
+    rows: Sequence[int],
+    num_rows: int,
+    tags: Sequence[str] = DEFAULT_TAGS,
+) -> pd.DataFrame:
+    """Spreads the tagged fields of continuation records to one column per tag
+    :param records: The text of every continuation record, in file order
+    :param rows: The row, e.g. the transaction, that every continuation record belongs to
+    :param num_rows: Number of rows of the result, rows without continuation records are all nulls
+    :param tags: The tags to be extracted, defaults to `DEFAULT_TAGS`. A tag repeated within a row has its values
+    joined with a space.
+    :return: One row per `rows` value and one column per tag, named after the tag in lower case
+    """
+    if len(records) != len(rows):
+        raise exc.Bai2ReaderException(f"Got {len(records)} continuation records for {len(rows)} rows")
+
+    tags = list(tags)
+    wide = np.full(num_rows * len(tags), None, dtype=object)
+
+    if len(records):
+        records = pd.Series(records, dtype=_string_dtype())
+        rows = np.asarray(rows, dtype=np.int64)
+
+        tagged = records.str.match(TAG_PATTERN).to_numpy(dtype=bool)
+        tag = records.str.replace(f"{TAG_PATTERN}.*$", r"\1", regex=True).to_numpy(dtype=object)
+        value = records.str.replace(TAG_PATTERN, "", regex=True).str.strip().to_numpy(dtype=object)
+
+        tag[~tagged] = None
+        if not tagged.all():
+            # an untagged record continues the previous field of the same row
+            tag = pd.Series(tag, dtype=object).groupby(rows).ffill().to_numpy(dtype=object)
+
+        codes = pd.Index(tags, dtype=object).get_indexer(tag).astype(np.int64)
+        wanted = (codes >= 0) & (value != "")
+        keys, value = rows[wanted] * len(tags) + codes[wanted], value[wanted]
+
+        # the values of the same row and tag are joined in file order
+        order = np.argsort(keys, kind="stable")
+        keys, value = keys[order], value[order]
+        starts = np.flatnonzero(np.r_[len(keys) > 0, keys[1:] != keys[:-1]])
+        if len(starts) < len(keys):
+            value = pd.Series(np.add.reduceat(value + " ", starts), dtype=object).str[:-1].to_numpy(dtype=object)
+        wide[keys[starts]] = value
+
+    return pd.DataFrame(wide.reshape(num_rows, len(tags)), columns=[tag.lower() for tag in tags], dtype=object)
+
+
+def _string_dtype() -> pd.StringDtype:
+    """Arrow backed strings when pyarrow is installed, their regexes run in C over the whole column"""
+    try:
+        import pyarrow  # noqa: F401
+    except ModuleNotFoundError:
+        return pd.StringDtype()
+    return pd.StringDtype("pyarrow")
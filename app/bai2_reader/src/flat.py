@@ -0,0 +1,262 @@
+"""Flat rows of the transactions of a BAI2 file, without pandas.
+
+Every transaction is one tuple of the values of its file, group and account headers, its continuation records and
+the trailers of its account, group and file, in the column order of `reader.bai_to_flat_dataframe` (`FLAT_COLUMNS`).
+The rows are made in chunks, either from a Bai2Model (`model_rows`) or straight from the records of a file while it
+is parsed (`record_rows`), so a streaming writer never holds more than one chunk.
+
+The trailers come after the transactions in the file, so the streaming rows take them from a first pass over the file
+that only parses the trailer records (`scan_envelope`), which keeps the memory constant in the number of transactions.
+The first pass also finds the last file header, which is the one a Bai2Model keeps for the files that were
+concatenated into one, so both kinds of rows are the same.
+
+Keyed rows (`keyed=True`) start with the position of their group and account in the file (`KEY_COLUMNS`), for the
+writers that split the rows by group or account: two sections with the same values are still told apart.
+"""
+
+__all__ = [
+    "CHUNK_SIZE",
+    "COLUMN_KINDS",
+    "FLAT_COLUMNS",
+    "KEY_COLUMNS",
+    "Row",
+    "Envelope",
+    "model_rows",
+    "record_rows",
+    "record_values",
+    "scan_envelope",
+    "transaction_values",
+]
+
+from dataclasses import dataclass, field
+from enum import Enum
+from operator import attrgetter
+from pydantic import BaseModel
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Type, get_args
+
+from bai2_reader.src import models, parser
+
+CHUNK_SIZE = 10_000
+
+# one transaction, the values in the order of `FLAT_COLUMNS`
+Row = Tuple
+
+
+def _fields(model: Type[BaseModel]) -> Tuple[str, ...]:
+    """The exported fields of a record model, in declaration order, as in its `model_dump`"""
+    return tuple(name for name, info in model.model_fields.items() if not info.exclude)
+
+
+FILE_HEADER_FIELDS = _fields(models.FileHeader)
+GROUP_HEADER_FIELDS = _fields(models.GroupHeader)
+ACCOUNT_IDENTIFIER_FIELDS = _fields(models.AccountIdentifier)
+TRANSACTION_FIELDS = _fields(models.Transaction)
+ACCOUNT_TRAILER_FIELDS = _fields(models.AccountTrailer)
+GROUP_TRAILER_FIELDS = _fields(models.GroupTrailer)
+FILE_TRAILER_FIELDS = _fields(models.FileTrailer)
+
+FLAT_COLUMNS: Tuple[str, ...] = (
+    *(f"file_header_{name}" for name in FILE_HEADER_FIELDS),
+    *(f"group_header_{name}" for name in GROUP_HEADER_FIELDS),
+    *(f"account_identifier_{name}" for name in ACCOUNT_IDENTIFIER_FIELDS),
+    "account_summary",
+    "transaction_summary",
+    *(f"transaction_{name}" for name in TRANSACTION_FIELDS),
+    *(f"account_trailer_{name}" for name in ACCOUNT_TRAILER_FIELDS),
+    *(f"group_trailer_{name}" for name in GROUP_TRAILER_FIELDS),
+    *(f"file_trailer_{name}" for name in FILE_TRAILER_FIELDS),
+)
+
+
+def _kind(annotation) -> str:
+    """The kind of the values of a record field: amounts, integer counts, or texts for everything else"""
+    types = get_args(annotation) or (annotation,)
+    if float in types:
+        return "amount"
+    return "count" if int in types else "text"
+
+
+def _kinds(prefix: str, model: Type[BaseModel]) -> Dict[str, str]:
+    """The kinds of the columns of the exported fields of a record model"""
+    return {f"{prefix}{name}": _kind(model.model_fields[name].annotation) for name in _fields(model)}
+
+
+# the kind of the values of every column of `FLAT_COLUMNS`, "amount", "count" or "text", for typed writers
+COLUMN_KINDS: Dict[str, str] = {
+    **_kinds("file_header_", models.FileHeader),
+    **_kinds("group_header_", models.GroupHeader),
+    **_kinds("account_identifier_", models.AccountIdentifier),
+    "account_summary": "text",
+    "transaction_summary": "text",
+    **_kinds("transaction_", models.Transaction),
+    **_kinds("account_trailer_", models.AccountTrailer),
+    **_kinds("group_trailer_", models.GroupTrailer),
+    **_kinds("file_trailer_", models.FileTrailer),
+}
+
+# the columns before `FLAT_COLUMNS` in a keyed row: the 0-based positions of its group and account in the file
+KEY_COLUMNS = ("group_index", "account_index")
+
+_transaction_values = attrgetter(*TRANSACTION_FIELDS)
+_TRANSACTION_TYPE = TRANSACTION_FIELDS.index("transaction_type")
+
+
+@dataclass
+class Envelope:
+    """The records around the transactions of a file: its last file header and its trailers, the accounts and groups
+    without a trailer have None
+    """
+
+    header: models.FileHeader | None = None
+    accounts: List[models.AccountTrailer | None] = field(default_factory=list)
+    groups: List[models.GroupTrailer | None] = field(default_factory=list)
+    file: models.FileTrailer | None = None
+
+
+def record_values(record: BaseModel | None, fields: Tuple[str, ...]) -> Row:
+    """The values of the exported fields of a record, enums as their values, all None for a missing record"""
+    if record is None:
+        return (None,) * len(fields)
+    values = attrgetter(*fields)(record)
+    return tuple(value.value if isinstance(value, Enum) else value for value in values)
+
+
+def transaction_values(transaction: models.Transaction) -> Row:
+    """The values of the exported fields of a transaction record, the per row part of a flat row"""
+    values = _transaction_values(transaction)
+    if values[_TRANSACTION_TYPE] is not None:
+        return record_values(transaction, TRANSACTION_FIELDS)
+    return values
+
+
+def _get(records: List, position: int):
+    """The record at a position of a list of trailers, None past its end"""
+    return records[position] if position < len(records) else None
+
+
+def model_rows(bai_data: models.Bai2Model, chunk_size: int = CHUNK_SIZE, keyed: bool = False) -> Iterator[List[Row]]:
+    """The flat rows of the transactions of a Bai2Model, in chunks
+    :param bai_data: input data that is generated using Bai2Model
+    :param chunk_size: Number of rows per chunk, defaults to `CHUNK_SIZE`
+    :param keyed: Whether the rows start with the values of `KEY_COLUMNS`, defaults to False
+    :return: Iterator of lists of rows, in the order of `FLAT_COLUMNS`
+    """
+    file_values = record_values(bai_data.header, FILE_HEADER_FIELDS)
+    file_trailer_values = record_values(bai_data.file_trailer, FILE_TRAILER_FIELDS)
+
+    chunk: List[Row] = []
+    account_index = 0
+    for group_index, group in enumerate(bai_data.groups):
+        group_values = file_values + record_values(group.group_header, GROUP_HEADER_FIELDS)
+        group_trailer_values = record_values(group.group_trailer, GROUP_TRAILER_FIELDS) + file_trailer_values
+
+        for account in group.accounts:
+            prefix = (
+                ((group_index, account_index) if keyed else ())
+                + group_values
+                + record_values(account.account_identifier, ACCOUNT_IDENTIFIER_FIELDS)
+                + (" ".join([summary.record for summary in account.summary]),)
+            )
+            suffix = record_values(account.account_trailer, ACCOUNT_TRAILER_FIELDS) + group_trailer_values
+
+            for transaction in account.transactions:
+                summary = " ".join([continuation.record for continuation in transaction.summary])
+                chunk.append(prefix + (summary,) + transaction_values(transaction.transaction) + suffix)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            account_index += 1
+
+    if chunk:
+        yield chunk
+
+
+def scan_envelope(lines: Iterable[str], delimiter: str = ",", amount_type: Callable = float) -> Envelope:
+    """Parses only the file header and the trailer records of a file, the first pass of `record_rows`.
+    The trailers are not validated, the counts are checked when the records are parsed in the second pass.
+    :param lines: The lines of the BAI2 file
+    :param delimiter: The field delimiter, defaults to ","
+    :param amount_type: How the control totals are parsed, see `parser.AMOUNT_TYPES`
+    :return: The file header, and the trailers of every account and group of the file in file order
+    """
+    envelope = Envelope()
+    state = parser.ParserState(run_validation=False, trusted=True, delimiter=delimiter, amount_type=amount_type)
+
+    for line in lines:
+        record_code = line[:2]
+        if record_code == parser.ACCOUNT_IDENTIFIER:
+            envelope.accounts.append(None)
+        elif record_code == parser.GROUP_HEADER:
+            envelope.groups.append(None)
+        elif record_code == parser.ACCOUNT_TRAILER and envelope.accounts:
+            envelope.accounts[-1] = parser.parse_line(state, line)
+        elif record_code == parser.GROUP_TRAILER and envelope.groups:
+            envelope.groups[-1] = parser.parse_line(state, line)
+        elif record_code == parser.FILE_TRAILER:
+            envelope.file = parser.parse_line(state, line)
+        elif record_code == parser.FILE_HEADER:
+            envelope.header = parser.parse_line(state, line)
+
+    return envelope
+
+
+def record_rows(
+    records: Iterable[models.Record], envelope: Envelope, chunk_size: int = CHUNK_SIZE, keyed: bool = False
+) -> Iterator[List[Row]]:
+    """The flat rows of the transactions of a stream of records, in chunks, a transaction is a row once the record
+    after its last continuation record is read
+    :param records: The parsed records, as returned by `BAI2Reader.iter_records`
+    :param envelope: The file header and trailers of the same file, as returned by `scan_envelope`
+    :param chunk_size: Number of rows per chunk, defaults to `CHUNK_SIZE`
+    :param keyed: Whether the rows start with the values of `KEY_COLUMNS`, defaults to False
+    :return: Iterator of lists of rows, in the order of `FLAT_COLUMNS`
+    """
+    file_values = record_values(envelope.header, FILE_HEADER_FIELDS)
+    file_trailer_values = record_values(envelope.file, FILE_TRAILER_FIELDS)
+    group_values = file_values + record_values(None, GROUP_HEADER_FIELDS)
+    group_trailer_values = record_values(None, GROUP_TRAILER_FIELDS) + file_trailer_values
+    account_values = record_values(None, ACCOUNT_IDENTIFIER_FIELDS)
+    suffix = record_values(None, ACCOUNT_TRAILER_FIELDS) + group_trailer_values
+    prefix = None
+    account_summary: List[str] = []
+    num_groups = num_accounts = 0
+
+    chunk: List[Row] = []
+    transaction = None
+    summary: List[str] = []
+
+    for record in records:
+        record_code = record.record_code
+        if record_code == parser.CONTINUATION:
+            (summary if transaction is not None else account_summary).append(record.record)
+            continue
+
+        if transaction is not None:
+            chunk.append(prefix + (" ".join(summary),) + transaction_values(transaction) + suffix)
+            transaction = None
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+
+        if record_code == parser.TRANSACTION:
+            if prefix is None:
+                # the continuations of the account identifier are all read once its first transaction is
+                keys = (num_groups - 1, num_accounts - 1) if keyed else ()
+                prefix = keys + group_values + account_values + (" ".join(account_summary),)
+            transaction, summary = record, []
+        elif record_code == parser.ACCOUNT_IDENTIFIER:
+            account_values = record_values(record, ACCOUNT_IDENTIFIER_FIELDS)
+            suffix = record_values(_get(envelope.accounts, num_accounts), ACCOUNT_TRAILER_FIELDS) + group_trailer_values
+            num_accounts += 1
+            prefix, account_summary = None, []
+        elif record_code == parser.GROUP_HEADER:
+            group_values = file_values + record_values(record, GROUP_HEADER_FIELDS)
+            group_trailer_values = (
+                record_values(_get(envelope.groups, num_groups), GROUP_TRAILER_FIELDS) + file_trailer_values
+            )
+            num_groups += 1
+
+    if transaction is not None:
+        chunk.append(prefix + (" ".join(summary),) + transaction_values(transaction) + suffix)
+    if chunk:
+        yield chunk
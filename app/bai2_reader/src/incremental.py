@@ -0,0 +1,156 @@
+"""Incremental reader for BAI2 files that are appended to during the day.
+
+Every poll seeks to the byte offset of the saved `models.Checkpoint`, parses only the records that were appended
+since the last poll and yields the transactions that are complete. A transaction is complete once the record after
+its last '88' is read, so the checkpoint never moves past a transaction that may still get continuation records,
+and a line that is still being written (without its line ending) is left for the next poll. A line that fails to parse
+leaves the checkpoint and the running counters as they were before it, so it can be fixed and polled again.
+"""
+
+__all__ = ["IncrementalReader"]
+
+import dataclasses
+
+from pathlib import Path
+from typing import Iterator, Tuple
+
+from bai2_reader.src.logger import log
+from bai2_reader.src import enums, exceptions as exc, models, parser
+
+TRANSACTION = parser.TRANSACTION.encode()
+CONTINUATION = parser.CONTINUATION.encode()
+
+
+class IncrementalReader:
+    """Reads the records appended to a BAI2 file since the last poll"""
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        checkpoint: models.Checkpoint | None = None,
+        run_validation: bool = True,
+        encoding: str = "utf-8",
+        delimiter: str = ",",
+        trusted: bool = False,
+        amount_mode: enums.AmountMode = enums.AmountMode.float,
+    ):
+        """Initializer
+        :param file_path: The path to the BAI2 file to be read.
+        :param checkpoint: The checkpoint of a previous read to resume from, by default the file is read from the start.
+        :param run_validation: Whether to validate the record counts in the trailers, defaults to True.
+        :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+        :param delimiter: The field delimiter, defaults to ","
+        :param trusted: Whether to skip the pydantic validation of the records, defaults to False.
+        :param amount_mode: How the amounts are parsed, defaults to floats.
+        """
+        self.file_path = Path(file_path)
+        self.encoding = encoding
+        self.state = parser.ParserState(
+            run_validation=run_validation,
+            trusted=trusted,
+            delimiter=delimiter,
+            amount_type=parser.AMOUNT_TYPES[amount_mode],
+        )
+        self.offset = 0
+
+        self.group_header: models.GroupHeader | None = None
+        self.account_identifier: models.AccountIdentifier | None = None
+
+        if checkpoint is not None:
+            self._restore(checkpoint)
+
+    @property
+    def checkpoint(self) -> models.Checkpoint:
+        """The checkpoint of the records read so far, pass it to a new reader to resume from here"""
+        return models.Checkpoint(
+            offset=self.offset,
+            total_records_counter=self.state.total_records_counter,
+            group_record_counter=self.state.group_record_counter,
+            account_record_counter=self.state.account_record_counter,
+            previous_rec_code=self.state.previous_rec_code,
+            group_header=dict(self.group_header) if self.group_header is not None else None,
+            account_identifier=dict(self.account_identifier) if self.account_identifier is not None else None,
+        )
+
+    def _restore(self, checkpoint: models.Checkpoint) -> None:
+        """Restores the position, the running counters and the open group and account of a checkpoint"""
+        self.offset = checkpoint.offset
+        self.state.total_records_counter = checkpoint.total_records_counter
+        self.state.group_record_counter = checkpoint.group_record_counter
+        self.state.account_record_counter = checkpoint.account_record_counter
+        self.state.previous_rec_code = checkpoint.previous_rec_code
+
+        if checkpoint.group_header is not None:
+            self.group_header = models.GroupHeader(**checkpoint.group_header)
+        if checkpoint.account_identifier is not None:
+            self.account_identifier = models.AccountIdentifier(**checkpoint.account_identifier)
+
+    def poll(self) -> Iterator[Tuple[models.AccountIdentifier, models.TransactionSection]]:
+        """Parses the records appended since the last poll and yields the new complete transactions.
+        The checkpoint moves along with the yielded transactions, so it is safe to stop iterating at any point.
+        :return: Iterator of tuples of the account identifier and the transaction section that belongs to it
+        """
+        if not self.file_path.is_file():
+            raise exc.Bai2ReaderException(f"File not found: {self.file_path}")
+        if self.file_path.stat().st_size < self.offset:
+            raise exc.Bai2ReaderException(f"File was truncated since the checkpoint: {self.file_path}")
+
+        state = self.state
+        trusted = state.trusted
+        offset = self.offset
+        transaction = None
+        # position and counters before the '16' record of the transaction that is not complete yet
+        pending_offset, pending_state = offset, None
+
+        try:
+            with open(self.file_path, "rb") as file:
+                file.seek(offset)
+
+                for raw_line in file:
+                    if not raw_line.endswith(b"\n"):
+                        break  # the line is still being written
+
+                    line_offset = offset
+                    offset += len(raw_line)
+                    record_code = raw_line[:2]
+
+                    if transaction is not None and record_code != CONTINUATION and raw_line.strip():
+                        completed, transaction = transaction, None
+                        self.offset = line_offset
+                        yield self.account_identifier, completed
+
+                    # the counters before the line, a line that fails is parsed again from them on the next poll
+                    line_state = dataclasses.replace(state)
+                    if record_code == TRANSACTION:
+                        pending_offset, pending_state = line_offset, line_state
+
+                    try:
+                        record = parser.parse_line(state, raw_line.decode(self.encoding))
+                    except Exception:
+                        self.state = line_state
+                        raise
+
+                    if isinstance(record, models.Transaction):
+                        transaction = parser.build_model(
+                            trusted, models.TransactionSection, {"transaction": record, "summary": []}
+                        )
+                    elif isinstance(record, models.Continuation):
+                        if transaction is not None:
+                            transaction.summary.append(record)
+                    elif isinstance(record, models.AccountIdentifier):
+                        self.account_identifier = record
+                    elif isinstance(record, models.GroupHeader):
+                        self.group_header = record
+                    elif isinstance(record, models.AccountTrailer):
+                        self.account_identifier = None
+                    elif isinstance(record, models.GroupTrailer):
+                        self.group_header = None
+
+                    if transaction is None:
+                        self.offset = offset
+        finally:
+            if transaction is not None:
+                # the transaction may still get '88' records, it is parsed again on the next poll
+                self.offset, self.state = pending_offset, pending_state
+
+        log.debug(f"Polled {self.file_path.name} up to offset {self.offset}")
@@ -0,0 +1,245 @@
+"""Byte offset index of the groups and accounts of a BAI2 file, for random access to a single account.
+
+`build_index` scans the file once and only parses the '02' and '03' records, the index can be saved as a JSON sidecar
+file next to the BAI2 file. `read_account` then seeks straight to the account and parses only its records.
+"""
+
+__all__ = ["build_index", "get_index", "index_path", "is_up_to_date", "load_index", "read_account", "save_index"]
+
+import os
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+from bai2_reader.src.logger import log
+from bai2_reader.src import enums, exceptions as exc, models, parser, sources
+
+GROUP_HEADER = parser.GROUP_HEADER.encode()
+ACCOUNT_IDENTIFIER = parser.ACCOUNT_IDENTIFIER.encode()
+ACCOUNT_TRAILER = parser.ACCOUNT_TRAILER.encode()
+GROUP_TRAILER = parser.GROUP_TRAILER.encode()
+# records that belong to the account or group they follow
+ACCOUNT_RECORDS = {parser.TRANSACTION.encode(), parser.CONTINUATION.encode(), ACCOUNT_TRAILER}
+GROUP_RECORDS = {ACCOUNT_IDENTIFIER, *ACCOUNT_RECORDS, GROUP_TRAILER}
+
+INDEX_SUFFIX = ".index.json"
+
+
+def index_path(file_path: str | Path) -> Path:
+    """The path of the sidecar index file of a BAI2 file
+    :param file_path: The path to the BAI2 file
+    :return: The path of its index, the file path with '.index.json' appended
+    """
+    return Path(f"{file_path}{INDEX_SUFFIX}")
+
+
+def build_index(
+    file_path: str | Path,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    save: bool = False,
+) -> models.FileIndex:
+    """Scans a BAI2 file once and records the byte offset, length and record count of every group and account
+    :param file_path: The path to the BAI2 file
+    :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+    :param delimiter: The field delimiter, defaults to ","
+    :param save: Whether to save the index as a sidecar file next to the BAI2 file, defaults to False.
+    :return: The index of the file
+    """
+    if not Path(file_path).is_file():
+        raise exc.Bai2ReaderException(f"File not found: {file_path}")
+    if sources.detect_compression(file_path) is not None:
+        raise exc.InvalidFileFormatException(f"Compressed files can't be indexed, decompress it first: {file_path}")
+
+    stat = os.stat(file_path)
+    groups: List[Dict[str, Any]] = []
+    group = account = None
+    # only used to parse the '02' and '03' records, the records are not validated
+    scratch = parser.ParserState(run_validation=False, trusted=True, delimiter=delimiter)
+    offset = 0
+
+    def close_account(end: int) -> None:
+        nonlocal account
+        if account is not None:
+            account["length"] = end - account["offset"]
+            group["accounts"].append(models.AccountIndex(**account))
+            account = None
+
+    def close_group(end: int) -> None:
+        nonlocal group
+        close_account(end)
+        if group is not None:
+            group["length"] = end - group["offset"]
+            groups.append(group)
+            group = None
+
+    with open(file_path, "rb") as file:
+        for line in file:
+            line_offset = offset
+            offset += len(line)
+            if not line.strip():
+                continue
+
+            record_code = line[:2]
+            scratch.total_records_counter += 1
+
+            if account is not None and record_code not in ACCOUNT_RECORDS:
+                # an account without a '49' trailer ends at the next record that is not part of the account
+                close_account(line_offset)
+            if group is not None and record_code not in GROUP_RECORDS:
+                # a group without a '98' trailer ends at the next record that is not part of the group
+                close_group(line_offset)
+
+            if record_code == GROUP_HEADER:
+                _, rest_of_record, record = parser.split_record(line.decode(encoding), delimiter)
+                group_header = parser.parse_group_header(scratch, record, rest_of_record)
+                group = {
+                    "offset": line_offset,
+                    "record_counter": scratch.total_records_counter,
+                    "receiver": group_header.receiver,
+                    "sender": group_header.sender,
+                    "as_of_date": group_header.as_of_date,
+                    "currency_code": group_header.currency_code,
+                    "num_of_records": 0,
+                    "accounts": [],
+                }
+            elif record_code == ACCOUNT_IDENTIFIER and group is not None:
+                _, rest_of_record, record = parser.split_record(line.decode(encoding), delimiter)
+                account_identifier = parser.parse_account_identifier(scratch, record, rest_of_record)
+                account = {
+                    "offset": line_offset,
+                    "record_counter": scratch.total_records_counter,
+                    "account_number": account_identifier.account_number,
+                    "currency_code": account_identifier.currency_code or group["currency_code"],
+                    "num_of_records": 0,
+                }
+
+            if account is not None:
+                account["num_of_records"] += 1
+                if record_code == ACCOUNT_TRAILER:
+                    close_account(offset)
+            if group is not None:
+                group["num_of_records"] += 1
+                if record_code == GROUP_TRAILER:
+                    close_group(offset)
+
+    close_group(offset)
+    file_index = models.FileIndex(
+        file_size=stat.st_size,
+        file_mtime_ns=stat.st_mtime_ns,
+        groups=[models.GroupIndex(**group) for group in groups],
+    )
+    log.debug(f"Indexed {len(file_index.groups)} groups of {file_path}")
+
+    if save:
+        save_index(file_index, file_path)
+    return file_index
+
+
+def save_index(file_index: models.FileIndex, file_path: str | Path) -> Path:
+    """Saves the index as a JSON sidecar file next to the BAI2 file
+    :param file_index: The index of the file
+    :param file_path: The path to the BAI2 file
+    :return: The path of the saved index
+    """
+    path = index_path(file_path)
+    path.write_text(file_index.model_dump_json())
+    return path
+
+
+def load_index(file_path: str | Path) -> models.FileIndex | None:
+    """Loads the sidecar index of a BAI2 file
+    :param file_path: The path to the BAI2 file
+    :return: The index, or None if there is no sidecar index or the file has changed since it was indexed
+    """
+    path = index_path(file_path)
+    if not path.is_file():
+        return None
+
+    file_index = models.FileIndex.model_validate_json(path.read_bytes())
+    if not is_up_to_date(file_index, file_path):
+        log.debug(f"Ignoring stale index: {path}")
+        return None
+    return file_index
+
+
+def is_up_to_date(file_index: models.FileIndex, file_path: str | Path) -> bool:
+    """Whether an index is still the one of the file, i.e. the file has the size and modification time it was
+    indexed with
+    :param file_index: The index of the file
+    :param file_path: The path to the BAI2 file
+    :return: True if the file hasn't changed since it was indexed
+    """
+    stat = os.stat(file_path)
+    return (file_index.file_size, file_index.file_mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+
+
+def get_index(
+    file_path: str | Path,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    save: bool = False,
+) -> models.FileIndex:
+    """Loads the sidecar index of a BAI2 file, or builds the index if there is no up to date sidecar index
+    :param file_path: The path to the BAI2 file
+    :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+    :param delimiter: The field delimiter, defaults to ","
+    :param save: Whether to save a newly built index as a sidecar file, so that the next calls don't scan the file
+    again, defaults to False. The index is still returned if it can't be saved, e.g. in a read-only directory.
+    :return: The index of the file
+    """
+    if not Path(file_path).is_file():
+        raise exc.Bai2ReaderException(f"File not found: {file_path}")
+
+    file_index = load_index(file_path)
+    if file_index is None:
+        file_index = build_index(file_path, encoding=encoding, delimiter=delimiter)
+        if save:
+            try:
+                save_index(file_index, file_path)
+            except OSError as e:
+                log.warning(f"Could not save the index of {file_path}: {e}")
+    return file_index
+
+
+def read_account(
+    file_path: str | Path,
+    group: models.GroupIndex,
+    account: models.AccountIndex,
+    run_validation: bool = True,
+    trusted: bool = False,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    amount_mode: enums.AmountMode = enums.AmountMode.float,
+) -> models.AccountSection:
+    """Reads only the records of a single account, using its position in the index
+    :param file_path: The path to the BAI2 file
+    :param group: The index entry of the group of the account
+    :param account: The index entry of the account
+    :param run_validation: Whether to validate the record count in the account trailer, defaults to True.
+    :param trusted: Whether to skip the pydantic validation of the records, defaults to False.
+    :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+    :param delimiter: The field delimiter, defaults to ","
+    :param amount_mode: How the amounts are parsed, defaults to floats.
+    :return: The account section, with its transactions and trailer
+    """
+    with open(file_path, "rb") as file:
+        file.seek(group.offset)
+        group_header = file.readline().decode(encoding)
+        file.seek(account.offset)
+        data = file.read(account.length).decode(encoding)
+
+    # the account is parsed below its group header, with the record counters it has in the whole file
+    state = parser.ParserState(
+        run_validation=run_validation,
+        trusted=trusted,
+        delimiter=delimiter,
+        amount_type=parser.AMOUNT_TYPES[amount_mode],
+        total_records_counter=group.record_counter - 1,
+    )
+    records = [parser.parse_line(state, group_header)]
+    state.total_records_counter = account.record_counter - 1
+    records.extend(parser.parse_line(state, line) for line in data.splitlines())
+
+    bai_data = parser.build_bai2_model((record for record in records if record is not None), trusted=trusted)
+    return bai_data.groups[0].accounts[0]
@@ -1,7 +1,7 @@
 """Pydantic Models defining how the BAI file should look like"""
 
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from bai2_reader.src import enums
 
@@ -37,7 +37,7 @@ class FileHeader(Record):
 class FileTrailer(Record):
     """The file trailer record TransactionType.debit, which will be the last line of the file, record code: '99'"""
 
-    file_control_total: Optional[float] = Field(None, description="The file control total, which is optional")
+    file_control_total: Optional[int | float] = Field(None, description="The file control total, which is optional")
     num_of_groups: Optional[int] = Field(None, description="The number of groups for this file, which is optional")
     num_of_records: Optional[int] = Field(None, description="The number of records for this file, which is optional")
 
@@ -59,7 +59,7 @@ class GroupHeader(Record):
 class GroupTrailer(Record):
     """The group trailer record TransactionType.debit, which will be the last line of each group, record code: '98'"""
 
-    group_control_total: Optional[float] = Field(None, description="The group control total, which is optional")
+    group_control_total: Optional[int | float] = Field(None, description="The group control total, which is optional")
     num_of_accounts: Optional[int] = Field(None, description="The number of accounts for this group, which is optional")
     num_of_records: Optional[int] = Field(None, description="The number of records for this group, which is optional")
 
@@ -70,7 +70,7 @@ class AccountIdentifier(Record):
     account_number: str = Field(..., description="The account number")
     currency_code: Optional[str] = Field(None, description="The currency code, which is optional")
     type_code: Optional[str] = Field(None, description="The type code, which is optional")
-    opening_balance: Optional[float] = Field(None, description="The opening balance, which is optional")
+    opening_balance: Optional[int | float] = Field(None, description="The opening balance, which is optional")
     item_count: Optional[int] = Field(None, description="The item count, which is optional")
     fund_type: Optional[str] = Field(None, description="The fund type, which is optional")
     rest_of_record: Optional[str] = Field(
@@ -95,7 +95,7 @@ class Transaction(Record):
     """The transaction record which will be the line of each transaction. '16' record code"""
 
     type_code: str = Field(..., description="The type code for this transaction")
-    amount: float = Field(..., description="The amount for this transaction")
+    amount: int | float = Field(..., description="The amount for this transaction")
     funds_type: Optional[str] = Field(None, description="The funds type for this transaction, which is optional")
     bank_reference_number: Optional[str] = Field(
         None, description="The bank reference number for this transaction, which is optional"
@@ -104,7 +104,7 @@ class Transaction(Record):
         None, description="The customer reference number for this transaction, which is optional"
     )
     description: Optional[str] = Field(None, description="The text for this transaction, which is optional")
-    transaction_type: enums.TransactionType = Field(
+    transaction_type: enums.TransactionType | None = Field(
         None, description="The transaction type for this transaction, which is optional"
     )
     rest_of_record: Optional[str] = Field(
@@ -118,7 +118,9 @@ class Transaction(Record):
 class AccountTrailer(Record):
     """The account trailer record which will be the last line of each account, record code: '49'"""
 
-    account_control_total: Optional[float] = Field(None, description="The account control total, which is optional")
+    account_control_total: Optional[int | float] = Field(
+        None, description="The account control total, which is optional"
+    )
     num_of_records: Optional[int] = Field(None, description="The number of records for this account, which is optional")
 
 
@@ -158,7 +160,7 @@ class AccountSection(BaseModel):
         description="The transactions for this account, "
         "which is the list of transaction sections that follow the account identifier record",
     )
-    account_trailer: AccountTrailer = Field(
+    account_trailer: AccountTrailer | None = Field(
         None, description="The account trailer record for this account, record code: '49' "
     )
 
@@ -176,7 +178,9 @@ class GroupSection(BaseModel):
         description="The accounts for this group,"
         " which is the list of account sections that follow the group header record",
     )
-    group_trailer: GroupTrailer = Field(None, description="The group trailer record for this group, record code: '98' ")
+    group_trailer: GroupTrailer | None = Field(
+        None, description="The group trailer record for this group, record code: '98' "
+    )
 
 
 class Bai2Model(BaseModel):
@@ -187,4 +191,79 @@ class Bai2Model(BaseModel):
         default_factory=list,
         description="The groups for this file, which is the list of group sections that follow the header record",
     )
-    file_trailer: FileTrailer = Field(None, description="The file trailer record for this file, record code: '99' ")
+    file_trailer: FileTrailer | None = Field(
+        None, description="The file trailer record for this file, record code: '99' "
+    )
+
+
+class Checkpoint(BaseModel):
+    """The position of an incremental read of a BAI2 file, saved in between two polls of a growing file"""
+
+    offset: int = Field(0, description="The byte offset of the first record that is not read yet")
+    total_records_counter: int = Field(0, description="The number of records read so far")
+    group_record_counter: int = Field(0, description="The number of records read so far in the open group")
+    account_record_counter: int = Field(0, description="The number of records read so far in the open account")
+    previous_rec_code: str | None = Field(None, description="The record code of the last '03' or '16' record")
+    group_header: Dict[str, Any] | None = Field(
+        None, description="The fields of the open group header record, record code: '02'"
+    )
+    account_identifier: Dict[str, Any] | None = Field(
+        None, description="The fields of the open account identifier record, record code: '03'"
+    )
+
+
+class AccountIndex(BaseModel):
+    """The position of an account in a BAI2 file, from its '03' record up to and including its '49' record"""
+
+    offset: int = Field(..., description="The byte offset of the account identifier record")
+    length: int = Field(..., description="The number of bytes of the account")
+    record_counter: int = Field(..., description="The record counter of the account identifier record")
+    account_number: str = Field(..., description="The account number")
+    currency_code: Optional[str] = Field(None, description="The currency code of the account, or of its group")
+    num_of_records: int = Field(..., description="The number of records of the account")
+
+
+class GroupIndex(BaseModel):
+    """The position of a group in a BAI2 file, from its '02' record up to and including its '98' record"""
+
+    offset: int = Field(..., description="The byte offset of the group header record")
+    length: int = Field(..., description="The number of bytes of the group")
+    record_counter: int = Field(..., description="The record counter of the group header record")
+    receiver: str = Field(..., description="The receiver ID")
+    sender: str = Field(..., description="The sender ID")
+    as_of_date: str = Field(..., description="The as of date")
+    currency_code: Optional[str] = Field(None, description="The currency code of the group")
+    num_of_records: int = Field(..., description="The number of records of the group")
+    accounts: List[AccountIndex] = Field(default_factory=list, description="The accounts of the group, in file order")
+
+
+class FileIndex(BaseModel):
+    """Byte offset index of the groups and accounts of a BAI2 file, saved as a sidecar file next to it"""
+
+    file_size: int = Field(..., description="The size of the indexed file, used to detect a stale index")
+    file_mtime_ns: int = Field(
+        ..., description="The modification time of the indexed file, used to detect a stale index"
+    )
+    groups: List[GroupIndex] = Field(default_factory=list, description="The groups of the file, in file order")
+
+
+class ParseError(BaseModel):
+    """An error in a record of a BAI2 file, read with `OnError.collect`"""
+
+    line_number: int = Field(..., description="The line number of the bad record in the file, starting at 1")
+    record_code: str = Field(..., description="The record code of the bad record")
+    raw: str = Field(..., description="The text of the bad record")
+    error_type: str = Field(..., description="The type of the error, e.g. 'ValidationError'")
+    message: str = Field(..., description="The error message")
+    section: enums.Section = Field(..., description="The section of the file that was skipped with the bad record")
+    first_line: int = Field(..., description="The line number of the first record of the skipped section")
+    last_line: int = Field(..., description="The line number of the last record of the skipped section")
+
+
+class ErrorReport(BaseModel):
+    """The errors of a BAI2 file read with `OnError.collect`, the skipped sections are not in its Bai2Model"""
+
+    errors: List[ParseError] = Field(default_factory=list, description="The errors, in file order")
+    skipped_records: int = Field(0, description="The number of records of the skipped sections")
+    skipped_accounts: int = Field(0, description="The number of skipped accounts")
+    skipped_groups: int = Field(0, description="The number of skipped groups")
@@ -0,0 +1,277 @@
+"""Parallel parsing of a single BAI2 file, split at its group boundaries.
+
+The file is scanned once for the byte offsets of the '02' and '98' records, every group is then parsed in a worker
+process, and the groups are stitched back in file order. The scan also keeps the running record counters of the parser
+at the start of every segment, so the record counters and the trailer validations are the same as for a sequential
+read.
+`read_columns_parallel` is the one that scales: the workers send back the column buffers of `columnar`, flat arrays
+and lists of strings, which the parent appends to each other in about a tenth of the time of a sequential read.
+`read_file_parallel` stitches a Bai2Model, its workers send back trees of pydantic models which the parent unpickles
+one after another in about half the time of a sequential read, so it is never more than about 2x faster however
+many workers there are. On few CPUs both are slower than a sequential read, see `benchmarks/bench_parallel.py`.
+The encoding of the file has to be ASCII compatible (utf-8, latin-1, ...), as the scan works on the raw bytes.
+"""
+
+__all__ = ["Segment", "read_columns_parallel", "read_file_parallel", "scan_segments"]
+
+import io
+import pickle
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, List, NamedTuple, Tuple
+
+from bai2_reader.src.logger import log
+from bai2_reader.src import enums, exceptions as exc, models, parser, sources
+
+if TYPE_CHECKING:
+    from bai2_reader.src import columnar
+
+FILE_HEADER = parser.FILE_HEADER.encode()
+GROUP_HEADER = parser.GROUP_HEADER.encode()
+ACCOUNT_TRAILER = parser.ACCOUNT_TRAILER.encode()
+GROUP_TRAILER = parser.GROUP_TRAILER.encode()
+# records that are counted in the account record counter
+ACCOUNT_RECORDS = {code.encode() for code in (parser.ACCOUNT_IDENTIFIER, parser.TRANSACTION, parser.CONTINUATION)}
+# records that belong to the group they follow
+GROUP_RECORDS = {
+    code.encode()
+    for code in (
+        parser.ACCOUNT_IDENTIFIER,
+        parser.TRANSACTION,
+        parser.ACCOUNT_TRAILER,
+        parser.CONTINUATION,
+        parser.GROUP_TRAILER,
+    )
+}
+
+
+class Segment(NamedTuple):
+    """A byte range of the file, either a whole group ('02' to '98') or the records in between the groups,
+    with the running record counters of the parser at the start of the segment
+    """
+
+    start: int
+    end: int
+    total_records: int
+    group_records: int
+    account_records: int
+    is_group: bool
+
+
+def scan_segments(file_path: str | Path) -> List[Segment]:
+    """Scans the file once and splits it into segments at the group boundaries
+    :param file_path: The path to the BAI2 file
+    :return: The segments of the file, in file order
+    """
+    segments = []
+    segment_start = offset = 0
+    segment_counters = counters = (0, 0, 0)
+    in_group = False
+
+    def close_segment(end: int, is_group: bool) -> None:
+        # segments with blank lines only are skipped
+        if counters[0] > segment_counters[0]:
+            segments.append(Segment(segment_start, end, *segment_counters, is_group))
+
+    with open(file_path, "rb") as file:
+        for line in file:
+            if not line.strip():
+                offset += len(line)
+                continue
+
+            record_code = line[:2]
+            if record_code == GROUP_HEADER:
+                # a group without a '98' trailer ends at the next group header
+                close_segment(offset, in_group)
+                segment_start, segment_counters, in_group = offset, counters, True
+
+            elif in_group and record_code not in GROUP_RECORDS:
+                # a group without a '98' trailer ends at the next record that is not part of a group
+                close_segment(offset, True)
+                segment_start, segment_counters, in_group = offset, counters, False
+
+            offset += len(line)
+            counters = _count_record(counters, record_code)
+
+            if record_code == GROUP_TRAILER and in_group:
+                close_segment(offset, True)
+                segment_start, segment_counters, in_group = offset, counters, False
+
+    close_segment(offset, in_group)
+    return segments
+
+
+def _count_record(counters: Tuple[int, int, int], record_code: bytes) -> Tuple[int, int, int]:
+    """Updates the (total, group, account) record counters the same way the handlers of `parser` do"""
+    total_records, group_records, account_records = counters
+    total_records += 1
+    group_records += 1
+
+    if record_code in ACCOUNT_RECORDS:
+        account_records += 1
+    elif record_code == ACCOUNT_TRAILER:
+        account_records = 0
+    elif record_code in (GROUP_TRAILER, FILE_HEADER):
+        group_records = 0
+
+    return total_records, group_records, account_records
+
+
+def _parse_segment(
+    file_path: str | Path,
+    segment: Segment,
+    run_validation: bool,
+    trusted: bool,
+    encoding: str,
+    delimiter: str,
+    amount_mode: enums.AmountMode,
+) -> bytes:
+    """Parses one segment of the file into a Bai2Model that only holds the records of that segment.
+    The model is pickled here with the garbage collector paused, which is much faster than letting the executor do it.
+    """
+    state = parser.ParserState(
+        run_validation=run_validation,
+        trusted=trusted,
+        delimiter=delimiter,
+        amount_type=parser.AMOUNT_TYPES[amount_mode],
+        total_records_counter=segment.total_records,
+        group_record_counter=segment.group_records,
+        account_record_counter=segment.account_records,
+    )
+    lines = _segment_lines(file_path, segment, encoding)
+    records = (record for record in (parser.parse_line(state, line) for line in lines) if record is not None)
+
+    with parser.gc_paused():
+        return pickle.dumps(parser.build_bai2_model(records, trusted=trusted), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _parse_segment_columns(
+    file_path: str | Path,
+    segment: Segment,
+    run_validation: bool,
+    trusted: bool,
+    encoding: str,
+    delimiter: str,
+    amount_mode: enums.AmountMode,
+) -> "columnar.ColumnarData":
+    """Parses one segment of the file into column buffers that only hold the rows of that segment"""
+    from bai2_reader.src import columnar
+
+    columnar_parser = columnar.ColumnarParser(
+        run_validation=run_validation, trusted=trusted, delimiter=delimiter, amount_mode=amount_mode
+    )
+    state = columnar_parser.state
+    state.total_records_counter = segment.total_records
+    state.group_record_counter = segment.group_records
+    state.account_record_counter = segment.account_records
+
+    for line in _segment_lines(file_path, segment, encoding):
+        columnar_parser.parse_line(line)
+    return columnar_parser.data
+
+
+def _segment_lines(file_path: str | Path, segment: Segment, encoding: str) -> io.StringIO:
+    """The lines of a segment of the file"""
+    with open(file_path, "rb") as file:
+        file.seek(segment.start)
+        data = file.read(segment.end - segment.start)
+    return io.StringIO(data.decode(encoding), newline=None)
+
+
+def _scan(file_path: str | Path, max_workers: int | None) -> List[Segment]:
+    """The segments of a file that can be parsed in parallel"""
+    if not Path(file_path).is_file():
+        raise exc.Bai2ReaderException(f"File not found: {file_path}")
+    if sources.detect_compression(file_path) is not None:
+        raise exc.InvalidFileFormatException(f"Compressed files can't be split into segments: {file_path}")
+
+    segments = scan_segments(file_path)
+    log.debug(f"Parsing {len(segments)} segments of {file_path} with {max_workers or 'all'} workers")
+    return segments
+
+
+def read_columns_parallel(
+    file_path: str | Path,
+    max_workers: int | None = None,
+    run_validation: bool = True,
+    trusted: bool = False,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    amount_mode: enums.AmountMode = enums.AmountMode.float,
+) -> "columnar.ColumnarData":
+    """Reads a BAI2 file into column buffers by parsing its groups in parallel worker processes.
+    The workers send back flat arrays and lists of strings instead of model trees, so the work left to the parent is
+    small and this is the read that scales with the number of CPUs.
+    :param file_path: The path to the BAI2 file to be read.
+    :param max_workers: Number of worker processes, defaults to the number of CPUs.
+    :param run_validation: Whether to validate the record counts in the trailers, defaults to True.
+    :param trusted: Whether to skip the pydantic validation of the header and trailer records, defaults to False.
+    :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+    :param delimiter: The field delimiter, defaults to ","
+    :param amount_mode: How the amounts of the header and trailer records are parsed, defaults to floats.
+    :return: The column buffers of the whole file, same as the ones `columnar.read_columns` builds
+    """
+    from bai2_reader.src import columnar
+
+    segments = _scan(file_path, max_workers)
+
+    data = columnar.ColumnarData()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _parse_segment_columns, file_path, segment, run_validation, trusted, encoding, delimiter, amount_mode
+            )
+            for segment in segments
+        ]
+        for future in futures:
+            data.extend(future.result())
+
+    return data
+
+
+def read_file_parallel(
+    file_path: str | Path,
+    max_workers: int | None = None,
+    run_validation: bool = True,
+    trusted: bool = False,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    amount_mode: enums.AmountMode = enums.AmountMode.float,
+    pause_gc: bool = False,
+) -> models.Bai2Model:
+    """Reads a BAI2 file by parsing its groups in parallel worker processes.
+    The parent unpickles the model tree of every group one after another, so this is not the faster path, see the
+    module docstring. Use `read_columns_parallel` when the output is a table.
+    :param file_path: The path to the BAI2 file to be read.
+    :param max_workers: Number of worker processes, defaults to the number of CPUs.
+    :param run_validation: Whether to validate the record counts in the trailers, defaults to True.
+    :param trusted: Whether to skip the pydantic validation of the records, defaults to False.
+    :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+    :param delimiter: The field delimiter, defaults to ","
+    :param amount_mode: How the amounts are parsed, defaults to floats.
+    :param pause_gc: Whether to pause the garbage collector of this process while the segments are stitched, see
+    `BAI2Reader`. The collector of the worker processes is always paused while they pickle their segment.
+    :return: The Bai2Model of the whole file, same as the one `BAI2Reader.read_file` builds
+    """
+    segments = _scan(file_path, max_workers)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor, parser.gc_paused(pause_gc):
+        futures = [
+            executor.submit(
+                _parse_segment, file_path, segment, run_validation, trusted, encoding, delimiter, amount_mode
+            )
+            for segment in segments
+        ]
+
+        bai_data = parser.build_model(trusted, models.Bai2Model, {"header": None, "groups": [], "file_trailer": None})
+        for future in futures:
+            segment_data = pickle.loads(future.result())
+
+            if segment_data.header is not None:
+                bai_data.header = segment_data.header
+            bai_data.groups.extend(segment_data.groups)
+            if segment_data.file_trailer is not None:
+                bai_data.file_trailer = segment_data.file_trailer
+
+    return bai_data
@@ -0,0 +1,471 @@
+"""Record handlers that parse a single BAI2 line into its pydantic model.
+
+Every record type has one handler, and the handlers are looked up from `RECORD_HANDLERS` using the raw two character
+record code, so any engine that reads BAI2 lines can reuse them together with a `ParserState`.
+Nothing is logged per line, the account and group trailers log the record counts of their section at debug level.
+"""
+
+__all__ = [
+    "AMOUNT_TYPES",
+    "ParserState",
+    "RECORD_HANDLERS",
+    "SECTION_HEADERS",
+    "build_bai2_model",
+    "build_model",
+    "check_record_count",
+    "missing_section_header",
+    "gc_paused",
+    "parse_line",
+    "split_record",
+    "split_transaction",
+]
+
+import gc
+import logging
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pydantic import BaseModel
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple, Type, TypeVar
+
+from bai2_reader.src.logger import log
+from bai2_reader.src import enums, exceptions as exc, models
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_object_new = object.__new__
+_object_setattr = object.__setattr__
+
+# raw record codes, looked up once instead of on every line through the enum
+FILE_HEADER = enums.Record.file_header.value
+GROUP_HEADER = enums.Record.group_header.value
+ACCOUNT_IDENTIFIER = enums.Record.account_identifier.value
+TRANSACTION = enums.Record.transaction.value
+ACCOUNT_TRAILER = enums.Record.account_trailer.value
+CONTINUATION = enums.Record.continuation.value
+GROUP_TRAILER = enums.Record.group_trailer.value
+FILE_TRAILER = enums.Record.file_trailer.value
+
+# how the amounts are parsed in every amount mode
+AMOUNT_TYPES: Dict[enums.AmountMode, Callable[[str], int | float]] = {
+    enums.AmountMode.float: float,
+    enums.AmountMode.minor_units: int,
+}
+
+# the header record of the section of a record, it has to come before the record
+SECTION_HEADERS = {
+    ACCOUNT_IDENTIFIER: GROUP_HEADER,
+    GROUP_TRAILER: GROUP_HEADER,
+    TRANSACTION: ACCOUNT_IDENTIFIER,
+    CONTINUATION: ACCOUNT_IDENTIFIER,
+    ACCOUNT_TRAILER: ACCOUNT_IDENTIFIER,
+}
+
+
+@dataclass
+class ParserState:
+    """Running counters that are carried from one line to the next while parsing a BAI2 file"""
+
+    run_validation: bool = True
+    trusted: bool = False
+    delimiter: str = ","
+    # float, or int to keep the amounts as the implied decimal integers of the file (minor units)
+    amount_type: Callable[[str], int | float] = float
+    previous_rec_code: str | None = None
+    account_record_counter: int = 0
+    group_record_counter: int = 0
+    total_records_counter: int = 0
+    # time spent in the trailer count checks, see `ParseStats`
+    validation_seconds: float = 0.0
+    # set by the reader on the lines it samples, the split of the line is then added to `tokenize_seconds`
+    time_split: bool = False
+    tokenize_seconds: float = 0.0
+
+
+def build_model(trusted: bool, model: Type[ModelT], fields: Dict[str, Any]) -> ModelT:
+    """Builds a pydantic model from its fields, skipping the pydantic validation when the input is trusted.
+    Trusted models are built the same way as `model_construct` does, without the per call lookups of the defaults,
+    so `fields` must hold every field of the model in the order they are declared.
+    :param trusted: Whether the input is trusted, in which case the fields are not validated
+    :param model: The pydantic model class to build
+    :param fields: The fields of the model
+    :return: The model instance
+    """
+    if not trusted:
+        return model(**fields)
+
+    instance = _object_new(model)
+    _object_setattr(instance, "__dict__", fields)
+    _object_setattr(instance, "__pydantic_fields_set__", set(fields))
+    _object_setattr(instance, "__pydantic_extra__", None)
+    _object_setattr(instance, "__pydantic_private__", None)
+    return instance
+
+
+@contextmanager
+def gc_paused(pause: bool = True) -> Iterator[None]:
+    """Pauses the cyclic garbage collector while a model tree is built.
+    The tree has no reference cycles, but every collection walks all the objects built so far,
+    which on big files costs as much time as the parsing itself.
+    The collector is process wide, so it is paused for every thread of the process until the block is left.
+    :param pause: Whether to pause the collector, the block runs with the collector as it is otherwise
+    """
+    if not pause:
+        yield
+        return
+
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def split_record(line: str, delimiter: str = ",") -> Tuple[str, str, List[str]]:
+    """Splits a BAI2 line into its record code, the rest of the record and the fields of the rest of the record
+    :param line: A single line of the BAI2 file
+    :param delimiter: The field delimiter, defaults to ","
+    :return: tuple of record code, rest of record (without the trailing '/') and the list of fields
+    """
+    rest_of_record = line[3:].strip()
+
+    # if EOL has '/' the remove it
+    if rest_of_record and rest_of_record.endswith("/"):
+        rest_of_record = rest_of_record[:-1]
+
+    return line[:2], rest_of_record, rest_of_record.split(delimiter)
+
+
+def split_transaction(record: List[str], delimiter: str = ",") -> Tuple[str | None, ...]:
+    """Splits the fields of a transaction detail record, record code: '16'.
+    The funds type decides how many availability fields follow it ('S': 3, 'V': 2, 'D': 1 + 2 per distribution),
+    and the text is the rest of the record as it can contain the delimiter itself.
+    :param record: The fields of the record, as returned by `split_record`
+    :param delimiter: The field delimiter, defaults to ","
+    :return: tuple of type code, amount, funds type, bank reference number, customer reference number and text
+    """
+    funds_type = record[2] if len(record) > 2 else None
+
+    position = 3
+    if funds_type == "S":
+        position += 3
+    elif funds_type == "V":
+        position += 2
+    elif funds_type == "D":
+        position += 1 + 2 * (int(record[3]) if len(record) > 3 and record[3] else 0)
+
+    return (
+        record[0] if len(record) > 0 else None,
+        record[1] if len(record) > 1 else None,
+        funds_type,
+        record[position] if len(record) > position else None,
+        record[position + 1] if len(record) > position + 1 else None,
+        delimiter.join(record[position + 2 :]) if len(record) > position + 2 else None,
+    )
+
+
+def check_record_count(trailer: str, expected: int, got: int | None) -> None:
+    """Raises when the record count of a trailer doesn't match the number of records that were read
+    :param trailer: Name of the trailer, used in the error message
+    :param expected: Number of records that were read
+    :param got: Number of records in the trailer record
+    """
+    if expected != got:
+        raise exc.Bai2ReaderException(f"{trailer} trailer record count mismatch: expected {expected}, got {got}")
+
+
+def missing_section_header(record_code: str, groups: int, accounts: int) -> str | None:
+    """The header record that is missing before a record, e.g. the '02' record of an '03' record before any group
+    :param record_code: The record code of the record
+    :param groups: Number of groups opened so far
+    :param accounts: Number of accounts opened so far in the last group
+    :return: The record code of the missing header, None if the section of the record is open
+    """
+    header = SECTION_HEADERS.get(record_code)
+    if header is not None and (groups if header == GROUP_HEADER else accounts) == 0:
+        return header
+    return None
+
+
+def _validate_record_count(state: ParserState, trailer: str, expected: int, got: int | None) -> None:
+    """Checks the record count of a trailer when the validation is on, and adds its time to the parser state"""
+    if state.run_validation:
+        start = perf_counter()
+        try:
+            check_record_count(trailer, expected, got)
+        finally:
+            state.validation_seconds += perf_counter() - start
+
+
+def parse_file_header(state: ParserState, record: List[str], rest_of_record: str) -> models.FileHeader:
+    """Handler for the file header record, record code: '01'"""
+    _rec = build_model(
+        state.trusted,
+        models.FileHeader,
+        {
+            "record_code": FILE_HEADER,
+            "record_counter": state.total_records_counter,
+            "sender": record[0],
+            "receiver": record[1],
+            "file_date": record[2],
+            "file_time": record[3],
+            "file_id": record[4],
+            "record_length": record[5] if len(record) > 5 else None,
+            "block_size": record[6] if len(record) > 6 else None,
+            "version_number": record[7] if len(record) > 7 else None,
+        },
+    )
+
+    state.group_record_counter = 0  # file header is not part of any group, so reset the group record counter
+    return _rec
+
+
+def parse_group_header(state: ParserState, record: List[str], rest_of_record: str) -> models.GroupHeader:
+    """Handler for the group header record, record code: '02'"""
+    return build_model(
+        state.trusted,
+        models.GroupHeader,
+        {
+            "record_code": GROUP_HEADER,
+            "record_counter": state.total_records_counter,
+            "receiver": record[0],
+            "sender": record[1],
+            "group_status": enums.GroupStatus(record[2]) if len(record) > 2 and record[2] else None,
+            "as_of_date": record[3],
+            "as_of_time": record[4],
+            "currency_code": record[5],
+            "as_of_date_modifier": enums.AsOfDateModifier(record[6]) if len(record) > 6 and record[6] else None,
+        },
+    )
+
+
+def parse_account_identifier(state: ParserState, record: List[str], rest_of_record: str) -> models.AccountIdentifier:
+    """Handler for the account identifier record, record code: '03'"""
+    state.account_record_counter += 1
+    state.previous_rec_code = ACCOUNT_IDENTIFIER
+
+    return build_model(
+        state.trusted,
+        models.AccountIdentifier,
+        {
+            "record_code": ACCOUNT_IDENTIFIER,
+            "record_counter": state.total_records_counter,
+            "account_number": record[0],
+            "currency_code": record[1] if len(record) > 1 else None,
+            "type_code": record[2] if len(record) > 2 else None,
+            "opening_balance": state.amount_type(record[3]) if len(record) > 3 and record[3] else None,
+            "item_count": int(record[4]) if len(record) > 4 and record[4] else None,
+            "fund_type": record[5] if len(record) > 5 else None,
+            "rest_of_record": state.delimiter.join(record[6:]) if len(record) > 6 else None,
+        },
+    )
+
+
+def parse_transaction(state: ParserState, record: List[str], rest_of_record: str) -> models.Transaction:
+    """Handler for the transaction detail record, record code: '16'"""
+    state.account_record_counter += 1
+    state.previous_rec_code = TRANSACTION
+
+    type_code, amount, funds_type, bank_reference, customer_reference, text = split_transaction(record, state.delimiter)
+    return build_model(
+        state.trusted,
+        models.Transaction,
+        {
+            "record_code": TRANSACTION,
+            "record_counter": state.total_records_counter,
+            "type_code": type_code,
+            "amount": state.amount_type(amount) if amount else None,
+            "funds_type": funds_type,
+            "bank_reference_number": bank_reference,
+            "customer_reference_number": customer_reference,
+            "description": text,
+            "transaction_type": None,
+            "rest_of_record": None,
+        },
+    )
+
+
+def parse_account_trailer(state: ParserState, record: List[str], rest_of_record: str) -> models.AccountTrailer:
+    """Handler for the account trailer record, record code: '49'"""
+    state.account_record_counter += 1  # the count of the trailer includes the '03' and the '49' records
+
+    _rec = build_model(
+        state.trusted,
+        models.AccountTrailer,
+        {
+            "record_code": ACCOUNT_TRAILER,
+            "record_counter": state.total_records_counter,
+            "account_control_total": state.amount_type(record[0]) if len(record) > 0 and record[0] else None,
+            "num_of_records": int(record[1]) if len(record) > 1 and record[1] else None,
+        },
+    )
+
+    _validate_record_count(state, "Account", state.account_record_counter, _rec.num_of_records)
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(f"Account trailer at line {state.total_records_counter}: {state.account_record_counter} records")
+
+    state.account_record_counter = 0  # reset account record counter for the next account
+    return _rec
+
+
+def parse_continuation(state: ParserState, record: List[str], rest_of_record: str) -> models.Continuation:
+    """Handler for the continuation record, record code: '88'"""
+    state.account_record_counter += 1
+
+    _rec = build_model(
+        state.trusted,
+        models.Continuation,
+        {"record_code": CONTINUATION, "record_counter": state.account_record_counter, "record": rest_of_record},
+    )
+
+    if state.previous_rec_code not in (ACCOUNT_IDENTIFIER, TRANSACTION):
+        raise exc.Bai2ReaderException(
+            "Continuation record found without a preceding account identifier or transaction record"
+        )
+    return _rec
+
+
+def parse_group_trailer(state: ParserState, record: List[str], rest_of_record: str) -> models.GroupTrailer:
+    """Handler for the group trailer record, record code: '98'"""
+    _rec = build_model(
+        state.trusted,
+        models.GroupTrailer,
+        {
+            "record_code": GROUP_TRAILER,
+            "record_counter": state.total_records_counter,
+            "group_control_total": state.amount_type(record[0]) if len(record) > 0 and record[0] else None,
+            "num_of_accounts": int(record[1]) if len(record) > 1 and record[1] else None,
+            "num_of_records": int(record[2]) if len(record) > 2 and record[2] else None,
+        },
+    )
+
+    _validate_record_count(state, "Group", state.group_record_counter, _rec.num_of_records)
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(f"Group trailer at line {state.total_records_counter}: {state.group_record_counter} records")
+
+    state.group_record_counter = 0
+    return _rec
+
+
+def parse_file_trailer(state: ParserState, record: List[str], rest_of_record: str) -> models.FileTrailer:
+    """Handler for the file trailer record, record code: '99'"""
+    _rec = build_model(
+        state.trusted,
+        models.FileTrailer,
+        {
+            "record_code": FILE_TRAILER,
+            "record_counter": state.total_records_counter,
+            "file_control_total": state.amount_type(record[0]) if len(record) > 0 and record[0] else None,
+            "num_of_groups": int(record[1]) if len(record) > 1 and record[1] else None,
+            "num_of_records": int(record[2]) if len(record) > 2 and record[2] else None,
+        },
+    )
+
+    _validate_record_count(state, "File", state.total_records_counter, _rec.num_of_records)
+    return _rec
+
+
+RECORD_HANDLERS: Dict[str, Callable[[ParserState, List[str], str], models.Record]] = {
+    FILE_HEADER: parse_file_header,
+    GROUP_HEADER: parse_group_header,
+    ACCOUNT_IDENTIFIER: parse_account_identifier,
+    TRANSACTION: parse_transaction,
+    ACCOUNT_TRAILER: parse_account_trailer,
+    CONTINUATION: parse_continuation,
+    GROUP_TRAILER: parse_group_trailer,
+    FILE_TRAILER: parse_file_trailer,
+}
+
+
+def parse_line(state: ParserState, line: str, handlers: Dict[str, Callable] | None = None) -> Any:
+    """Parses a single line of a BAI2 file using the handler of its record code, and updates the running counters
+    :param state: The parser state that is carried from one line to the next
+    :param line: A single line of the BAI2 file
+    :param handlers: The handler table to dispatch the record codes with, defaults to `RECORD_HANDLERS`
+    :return: What the handler returns, the parsed record for `RECORD_HANDLERS`, or None if the line is empty
+    """
+    if not line.strip():
+        return None
+
+    state.total_records_counter += 1
+    state.group_record_counter += 1
+
+    if state.time_split:
+        start = perf_counter()
+        record_code, rest_of_record, record = split_record(line, state.delimiter)
+        state.tokenize_seconds += perf_counter() - start
+    else:
+        record_code, rest_of_record, record = split_record(line, state.delimiter)
+
+    handler = (RECORD_HANDLERS if handlers is None else handlers).get(record_code)
+    if handler is None:
+        raise exc.UnknownValueException(f"Unknown record code '{record_code}' in record: {line.strip()}")
+
+    try:
+        return handler(state, record, rest_of_record)
+    except Exception as e:
+        raise exc.Bai2ReaderException(f"Error parsing record: {line.strip()}\nError: {str(e)}") from e
+
+
+def _record_text(record: models.Record) -> str:
+    """The record code and the fields of a parsed record, in the order of its line, for the error messages"""
+    values = record.model_dump(mode="json").values()
+    return ",".join([record.record_code, *("" if value is None else str(value) for value in values)])
+
+
+def build_bai2_model(records: Iterable[models.Record], trusted: bool = False) -> models.Bai2Model:
+    """Builds the nested Bai2Model tree from the parsed records, in the order they are read from the file
+    :param records: The parsed records, as returned by `parse_line`
+    :param trusted: Whether to skip the pydantic validation of the sections, defaults to False
+    :return: The Bai2Model with all the records placed in their groups, accounts and transactions
+    """
+    bai_data = build_model(trusted, models.Bai2Model, {"header": None, "groups": [], "file_trailer": None})
+
+    for record in records:
+        try:
+            if isinstance(record, models.FileHeader):
+                bai_data.header = record
+            elif isinstance(record, models.GroupHeader):
+                group = build_model(
+                    trusted, models.GroupSection, {"group_header": record, "accounts": [], "group_trailer": None}
+                )
+                bai_data.groups.append(group)
+            elif isinstance(record, models.AccountIdentifier):
+                account = build_model(
+                    trusted,
+                    models.AccountSection,
+                    {"account_identifier": record, "summary": [], "transactions": [], "account_trailer": None},
+                )
+                bai_data.groups[-1].accounts.append(account)
+            elif isinstance(record, models.Transaction):
+                transaction = build_model(trusted, models.TransactionSection, {"transaction": record, "summary": []})
+                bai_data.groups[-1].accounts[-1].transactions.append(transaction)
+            elif isinstance(record, models.Continuation):
+                account = bai_data.groups[-1].accounts[-1]
+                if account.transactions:
+                    # append the continuation record to the summary of the last transaction record
+                    account.transactions[-1].summary.append(record)
+                else:
+                    # append the continuation record to the summary of the last account identifier record
+                    account.summary.append(record)
+            elif isinstance(record, models.AccountTrailer):
+                bai_data.groups[-1].accounts[-1].account_trailer = record
+            elif isinstance(record, models.GroupTrailer):
+                bai_data.groups[-1].group_trailer = record
+            elif isinstance(record, models.FileTrailer):
+                bai_data.file_trailer = record
+        except IndexError as e:
+            # the section of the record was never opened, it is only looked up once the tree can't take the record
+            groups = len(bai_data.groups)
+            header = missing_section_header(
+                record.record_code, groups, len(bai_data.groups[-1].accounts) if groups else 0
+            )
+            error = f"No '{header}' record before the '{record.record_code}' record" if header else str(e)
+            raise exc.Bai2ReaderException(f"Error parsing record: {_record_text(record)}\nError: {error}") from e
+
+    return bai_data
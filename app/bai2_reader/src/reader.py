@@ -1,13 +1,54 @@
-"""Core BAI reader script which read and parses the BAI files and converts to a pydantic model"""
+"""Core BAI reader script which read and parses the BAI files and converts to a pydantic model
 
-import pandas as pd
+pandas and the modules built on it (`columnar`, `balances`, `continuations`) are imported by the methods that return
+or write a DataFrame, so reading and validating a file doesn't pay for their import.
 
+The reader collects the statistics of every read and export in `stats`, see `stats.ParseStats` for how the phases are
+timed without a timer per line.
+"""
+
+import asyncio
+import sys
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import suppress
 from datetime import datetime, timezone
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Self, List
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Self, Sequence, TextIO, Tuple
 
 from bai2_reader.src.logger import log
-from bai2_reader.src import enums, exceptions as exc, models
+from bai2_reader.src import (
+    enums,
+    exceptions as exc,
+    flat,
+    index,
+    models,
+    parallel,
+    parser,
+    recovery,
+    sources,
+    stats as parse_stats,
+    tables,
+    writers,
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from bai2_reader.src import columnar
+
+# the output formats written by a streaming writer, see `writers`
+STREAMING_FORMATS = (
+    enums.OutputFormat.CSV,
+    enums.OutputFormat.JSONL,
+    enums.OutputFormat.PARQUET,
+    enums.OutputFormat.EXCEL,
+)
+# the streaming formats that can be written to an open text stream, e.g. stdout
+TEXT_FORMATS = (enums.OutputFormat.CSV, enums.OutputFormat.JSONL)
 
 
 class BAI2Reader:
@@ -21,24 +62,96 @@ class BAI2Reader:
         output_format: enums.OutputFormat = enums.OutputFormat.CSV,
         encoding: str = "utf-8",
         delimiter: str = ",",
+        trusted: bool = False,
+        amount_mode: enums.AmountMode = enums.AmountMode.float,
+        executor: Executor | None = None,
+        concurrency_limit: int | asyncio.Semaphore | None = None,
+        stats_hook: parse_stats.StatsHook | None = None,
+        stats_sample_every: int = 64,
+        log_every: int = 100_000,
+        on_error: enums.OnError | str = enums.OnError.raise_,
+        layout: enums.Layout | str = enums.Layout.flat,
+        pause_gc: bool = False,
     ):
-        """Initializer"""
+        """Initializer
+        :param trusted: Set this for files from trusted sources, the records are then built without the pydantic
+        validation, which is about 10% faster. Trailer counts are still validated when `run_validation` is set.
+        :param amount_mode: How the amounts and control totals are parsed, as floats (default) or as the implied
+        decimal integers of the file (`AmountMode.minor_units`), see `amounts` to scale them by their currency.
+        :param executor: Executor that runs the parsing and writing of the async methods, defaults to the default
+        executor of the event loop. Only `aread_file` can run on a process pool, the other async methods need threads.
+        :param concurrency_limit: Max number of async calls that run on the executor at the same time, either a number
+        or a semaphore that is shared with other readers. By default the calls are not limited.
+        :param stats_hook: Called with the `stats` of the reader after every read and export, e.g. to send them to a
+        metrics system with `ParseStats.to_dict`.
+        :param stats_sample_every: The per phase times of the parsing are measured on one line out of this many.
+        :param log_every: Number of lines between two progress messages of a read at debug level. Nothing is logged
+        per line, the statistics of every read and export are logged as one summary event, see `_emit_stats`.
+        :param on_error: How `read_file` handles a bad record, it raises on the first one by default. With
+        `OnError.collect` the account or group of a bad record is skipped and the read goes on, the errors are in
+        `error_report`, see `recovery`.
+        :param layout: How the written data is laid out, a flat table of the transactions by default. With
+        `Layout.normalized` every record level is a table of its own, linked by integer keys, see `tables`.
+        :param pause_gc: Whether `read_file` pauses the garbage collector while it builds the Bai2Model, which makes
+        the read of big files about 30% faster. The collector is process wide, so it is then paused for all the threads
+        of the process during the read, e.g. the other reads of a service. Off by default.
+        """
         self.encoding = encoding
         self.run_validation = run_validation
         self.write_to_files = write_to_files
         self.output_dir = output_dir
         self.output_format = output_format
         self.delimiter = delimiter
+        self.trusted = trusted
+        self.amount_mode = enums.AmountMode(amount_mode)
+        self.executor = executor
+        self.concurrency_limit = (
+            asyncio.Semaphore(concurrency_limit) if isinstance(concurrency_limit, int) else concurrency_limit
+        )
+
+        self.stats_hook = stats_hook
+        self.stats_sample_every = stats_sample_every
+        self.log_every = log_every
+        self.on_error = enums.OnError(on_error)
+        self.layout = enums.Layout(layout)
+        self.pause_gc = pause_gc
 
         self.source_filename: Path | None = None
         self.bai_data: models.Bai2Model | None = None
+        self.stats = parse_stats.ParseStats(sample_every=stats_sample_every)
+        self.error_report: models.ErrorReport | None = None
+        # the indexes built by `read_account`, by file path
+        self._file_indexes: Dict[Path, models.FileIndex] = {}
 
-    def read_file(self, file_path: str | Path, run_validation: bool | None = None, encoding: str | None = None) -> Self:
+    def read_file(
+        self,
+        file_path: str | Path,
+        run_validation: bool | None = None,
+        encoding: str | None = None,
+        trusted: bool | None = None,
+        workers: int | None = None,
+        member: str | None = None,
+        on_error: enums.OnError | str | None = None,
+        pause_gc: bool | None = None,
+    ) -> Self:
         """Reads a BAI2 file and returns a Bai2Model object containing the parsed data.
         If any of the parameters are not provided, it will use the default values set in the constructor.
         :param file_path: The path to the BAI2 file to be read.
         :param run_validation: Whether to run validation on the parsed data, defaults to True.
         :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+        :param trusted: Whether to skip the pydantic validation of the records, defaults to False.
+        :param workers: Number of worker processes to parse the groups of the file in parallel,
+        by default the file is parsed in the current process. Compressed files are always parsed in the current process.
+        The model trees of the groups are unpickled one after another in this process, which caps the speedup well
+        below the number of workers and makes it slower than a sequential read on few CPUs, see `read_columns` for a
+        parallel read that scales.
+        :param member: The file to read from a zip archive, only needed if the archive has more than one file.
+        :param on_error: How a bad record is handled, defaults to the `on_error` of the reader. With `OnError.collect`
+        the partial Bai2Model is in `bai_data` and the errors are in `error_report`, the file is then always parsed in
+        the current process.
+        :param pause_gc: Whether to pause the garbage collector of the process during the read, defaults to the
+        `pause_gc` of the reader.
+        The statistics of the read are in `stats`, the parallel read only gets the bytes read and its total time.
         """
         if not Path(file_path).is_file():
             raise exc.Bai2ReaderException(f"File not found: {file_path}")
@@ -46,218 +159,660 @@ class BAI2Reader:
 
         log.info(f"Reading input file: {self.source_filename.name}")
 
-        run_validation = self.run_validation if run_validation is None else run_validation
-        encoding = self.encoding if encoding is None else encoding
+        stats = self.stats = parse_stats.ParseStats(sample_every=self.stats_sample_every)
+        start = perf_counter()
 
-        with open(self.source_filename, encoding=encoding) as file:
-            lines = file.readlines()
+        on_error = self.on_error if on_error is None else enums.OnError(on_error)
+        collector = recovery.ErrorCollector() if on_error is enums.OnError.collect else None
+        self.error_report = None
+        pause_gc = self.pause_gc if pause_gc is None else pause_gc
 
-        previous_rec_code = None
-        account_record_counter = 0
-        group_record_counter = 0
-        total_records_counter = 0
+        if collector is None and workers is not None and workers > 1 and sources.detect_compression(file_path) is None:
+            self.bai_data = parallel.read_file_parallel(
+                self.source_filename,
+                max_workers=workers,
+                run_validation=self.run_validation if run_validation is None else run_validation,
+                trusted=self.trusted if trusted is None else trusted,
+                encoding=self.encoding if encoding is None else encoding,
+                delimiter=self.delimiter,
+                amount_mode=self.amount_mode,
+                pause_gc=pause_gc,
+            )
+            stats.bytes_read = self.source_filename.stat().st_size
+            stats.seconds["model"] = perf_counter() - start
+            self._emit_stats("read")
+            return self
 
-        bai_data = models.Bai2Model()
+        records = self._iter_records(
+            stats,
+            self.source_filename,
+            run_validation=run_validation,
+            encoding=encoding,
+            trusted=trusted,
+            member=member,
+            collector=collector,
+        )
+        with parser.gc_paused(pause_gc):
+            bai_data = parser.build_bai2_model(records, trusted=self.trusted if trusted is None else trusted)
 
-        for line in lines:
-            if not line.strip():
-                continue
+        if collector is not None:
+            self.error_report = collector.report()
+            collector.prune(bai_data)
 
-            total_records_counter += 1
-            group_record_counter += 1
+        # the tree is built in between the records, so the model construction is the rest of the time of the read
+        parsing = stats.seconds["io"] + stats.seconds["tokenize"] + stats.seconds["validation"]
+        stats.seconds["model"] = max(perf_counter() - start - parsing, 0.0)
+        stats.peak_allocated_blocks = max(stats.peak_allocated_blocks, sys.getallocatedblocks())
 
-            record_code = enums.Record(line[:2])
-            rest_of_record = line[3:].strip()
+        self.bai_data = bai_data
+        self._emit_stats("read")
+        return self
 
-            log.debug(f"Reading line: {total_records_counter}, record_code: {record_code.name} ")
+    def iter_records(
+        self,
+        file_path: str | Path,
+        run_validation: bool | None = None,
+        encoding: str | None = None,
+        trusted: bool | None = None,
+        member: str | None = None,
+    ) -> Iterator[models.Record]:
+        """Reads a BAI2 file line by line and yields every parsed record as soon as it is read.
+        Only the current line and the running record counters are held in memory, so this can be used
+        for files that are too big to be loaded with `read_file`.
+        Trailer record counts are validated the same way as in `read_file`.
+        :param file_path: The path to the BAI2 file to be read, either plain or gzip/bz2/xz/zip compressed.
+        :param run_validation: Whether to run validation on the parsed data, defaults to True.
+        :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+        :param trusted: Whether to skip the pydantic validation of the records, defaults to False.
+        :param member: The file to read from a zip archive, only needed if the archive has more than one file.
+        :return: Iterator of the parsed records, one of the `models.Record` subclasses
+        """
+        self.stats = parse_stats.ParseStats(sample_every=self.stats_sample_every)
+        try:
+            yield from self._iter_records(
+                self.stats, file_path, run_validation=run_validation, encoding=encoding, trusted=trusted, member=member
+            )
+        finally:
+            self._emit_stats("read")
 
-            # if EOL has '/' the remove it
-            if rest_of_record and rest_of_record.endswith("/"):
-                rest_of_record = rest_of_record[:-1]
+    def _iter_records(
+        self,
+        stats: parse_stats.ParseStats,
+        file_path: str | Path,
+        run_validation: bool | None = None,
+        encoding: str | None = None,
+        trusted: bool | None = None,
+        member: str | None = None,
+        collector: recovery.ErrorCollector | None = None,
+    ) -> Iterator[models.Record]:
+        """`iter_records` that collects the statistics of the parsing into `stats`, see `stats.ParseStats`.
+        The lines are parsed by the `collector` when one is given, to skip the sections of the bad records.
+        """
+        if not Path(file_path).is_file():
+            raise exc.Bai2ReaderException(f"File not found: {file_path}")
 
-            record = rest_of_record.split(self.delimiter)
+        run_validation = self.run_validation if run_validation is None else run_validation
+        encoding = self.encoding if encoding is None else encoding
+        trusted = self.trusted if trusted is None else trusted
+
+        state = parser.ParserState(
+            run_validation=run_validation,
+            trusted=trusted,
+            delimiter=self.delimiter,
+            amount_type=parser.AMOUNT_TYPES[self.amount_mode],
+        )
 
+        parse_line = parser.parse_line if collector is None else collector.parse_line
+        sample_every = stats.sample_every
+        counts: Dict[str, int] = {}
+        lines = sampled = 0
+        progress_at = self.log_every
+        io_seconds = tokenize_seconds = model_seconds = 0.0
+
+        with sources.open_text(file_path, encoding=encoding, member=member) as file:
+            readline = file.readline
             try:
-                if record_code == enums.Record.file_header:
-                    bai_data.header = models.FileHeader(
-                        record_code=record_code,
-                        sender=record[0],
-                        receiver=record[1],
-                        file_date=record[2],
-                        file_time=record[3],
-                        file_id=record[4],
-                        record_length=record[5] if len(record) > 5 else None,
-                        block_size=record[6] if len(record) > 6 else None,
-                        version_number=record[7] if len(record) > 7 else None,
-                        record_counter=total_records_counter,
-                    )
+                while True:
+                    # every line of small files is sampled, the first `sample_every` lines of big ones
+                    if lines % sample_every and lines > sample_every:
+                        line = readline()
+                        if not line:
+                            break
+                        record = parse_line(state, line)
+                    else:
+                        # the sampled line is read and parsed under separate timers, the parser times its split
+                        start = perf_counter()
+                        line = readline()
+                        read = perf_counter()
+                        if not line:
+                            break
+                        split_seconds = state.tokenize_seconds
+                        state.time_split = True
+                        record = parse_line(state, line)
+                        state.time_split = False
+                        parsed = perf_counter()
+                        split_seconds = state.tokenize_seconds - split_seconds
 
-                    group_record_counter = 0  # file header is not part of any group, so reset the group record counter
-
-                elif record_code == enums.Record.group_header:
-                    group = models.GroupSection()
-                    bai_data.groups.append(group)
-                    bai_data.groups[-1].group_header = models.GroupHeader(
-                        record_code=record_code,
-                        receiver=record[0],
-                        sender=record[1],
-                        group_status=enums.GroupStatus(record[2]) if len(record) > 2 and record[2] else None,
-                        as_of_date=record[3],
-                        as_of_time=record[4],
-                        currency_code=record[5],
-                        as_of_date_modifier=enums.AsOfDateModifier(record[6])
-                        if len(record) > 6 and record[6]
-                        else None,
-                        record_counter=total_records_counter,
-                    )
+                        sampled += 1
+                        io_seconds += read - start
+                        tokenize_seconds += split_seconds
+                        model_seconds += parsed - read - split_seconds
+                        stats.peak_allocated_blocks = max(stats.peak_allocated_blocks, sys.getallocatedblocks())
 
-                elif record_code == enums.Record.account_identifier:
-                    account_record_counter += 1
-                    previous_rec_code = record_code
-
-                    _rec = models.AccountIdentifier(
-                        record_code=record_code,
-                        account_number=record[0],
-                        currency_code=record[1] if len(record) > 1 else None,
-                        type_code=record[2] if len(record) > 2 else None,
-                        opening_balance=float(record[3]) if len(record) > 3 and record[3] else None,
-                        item_count=int(record[4]) if len(record) > 4 and record[4] else None,
-                        fund_type=record[5] if len(record) > 5 else None,
-                        rest_of_record=record[6] if len(record) > 6 else None,
-                        record_counter=total_records_counter,
-                    )
+                        # the progress is only checked on the sampled lines, so it costs nothing per line
+                        if lines >= progress_at:
+                            progress_at += self.log_every
+                            log.debug(f"Read {lines} lines, {counts.get(parser.TRANSACTION, 0)} transactions")
 
-                    accounts_section = models.AccountSection(account_identifier=_rec)
-                    bai_data.groups[-1].accounts.append(accounts_section)
-
-                elif record_code == enums.Record.transaction:
-                    account_record_counter += 1
-                    previous_rec_code = record_code
-
-                    _rec = models.Transaction(
-                        record_code=record_code,
-                        type_code=record[0] if len(record) > 0 else None,
-                        amount=float(record[1]) if len(record) > 1 and record[1] else None,
-                        fund_type=record[2] if len(record) > 2 else None,
-                        reference_number=record[3] if len(record) > 3 else None,
-                        text=record[4] if len(record) > 4 else None,
-                        record_counter=total_records_counter,
-                    )
-                    transaction_section = models.TransactionSection(transaction=_rec)
-                    bai_data.groups[-1].accounts[-1].transactions.append(transaction_section)
-
-                elif record_code == enums.Record.account_trailer:
-                    _rec = models.AccountTrailer(
-                        record_code=record_code,
-                        account_control_total=float(record[0]) if len(record) > 0 and record[0] else None,
-                        num_of_records=int(record[1]) if len(record) > 1 and record[1] else None,
-                        record_counter=total_records_counter,
-                    )
+                    lines += 1
+                    if record is not None:
+                        counts[record.record_code] = counts.get(record.record_code, 0) + 1
+                        yield record
+            finally:
+                scale = lines / sampled if sampled else 0.0
+                stats.lines += lines
+                stats.bytes_read += _position(file)
+                stats.seconds["io"] += io_seconds * scale
+                stats.seconds["tokenize"] += tokenize_seconds * scale
+                stats.seconds["model"] += max(model_seconds * scale, 0.0)
+                stats.seconds["validation"] += state.validation_seconds
+                for record_code, count in counts.items():
+                    stats.count(record_code, count)
 
-                    if run_validation and account_record_counter != _rec.num_of_records:
-                        raise exc.Bai2ReaderException(
-                            "Account trailer record count mismatch:"
-                            f" expected {account_record_counter}, got {_rec.num_of_records}"
-                        )
-                    bai_data.groups[-1].accounts[-1].account_trailer = _rec
+    def iter_transactions(
+        self,
+        file_path: str | Path,
+        run_validation: bool | None = None,
+        encoding: str | None = None,
+        trusted: bool | None = None,
+        member: str | None = None,
+    ) -> Iterator[Tuple[models.AccountIdentifier, models.TransactionSection]]:
+        """Reads a BAI2 file line by line and yields (account identifier, transaction section) pairs.
+        A transaction is yielded as soon as it is complete, i.e. once the record after its last '88' is read.
+        :param file_path: The path to the BAI2 file to be read.
+        :param run_validation: Whether to run validation on the parsed data, defaults to True.
+        :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+        :param trusted: Whether to skip the pydantic validation of the records, defaults to False.
+        :param member: The file to read from a zip archive, only needed if the archive has more than one file.
+        :return: Iterator of tuples of the account identifier and the transaction section that belongs to it
+        """
+        trusted = self.trusted if trusted is None else trusted
+        account = None
+        transaction = None
 
-                    account_record_counter = 0  # reset account record counter for the next account
+        records = self.iter_records(
+            file_path, run_validation=run_validation, encoding=encoding, trusted=trusted, member=member
+        )
+        for record in records:
+            if isinstance(record, models.Continuation):
+                if transaction is not None:
+                    transaction.summary.append(record)
+                continue
 
-                elif record_code == enums.Record.continuation:
-                    account_record_counter += 1
+            if transaction is not None:
+                yield account, transaction
+                transaction = None
 
-                    _rec = models.Continuation(
-                        record_code=record_code, record=rest_of_record, record_counter=account_record_counter
-                    )
+            if isinstance(record, models.AccountIdentifier):
+                account = record
+            elif isinstance(record, models.Transaction):
+                transaction = parser.build_model(
+                    trusted, models.TransactionSection, {"transaction": record, "summary": []}
+                )
 
-                    if previous_rec_code not in [enums.Record.account_identifier, enums.Record.transaction]:
-                        raise exc.Bai2ReaderException(
-                            "Continuation record found without a preceding account identifier or transaction record"
-                        )
-
-                    if previous_rec_code == enums.Record.account_identifier:
-                        # append the continuation record to the summary of the last account identifier record
-                        bai_data.groups[-1].accounts[-1].summary.append(_rec)
-                    elif previous_rec_code == enums.Record.transaction:
-                        # append the continuation record to the summary of the last transaction record
-                        bai_data.groups[-1].accounts[-1].transactions[-1].summary.append(_rec)
-
-                elif record_code == enums.Record.group_trailer:
-                    _rec = models.GroupTrailer(
-                        record_code=record_code,
-                        group_control_total=float(record[0]) if len(record) > 0 and record[0] else None,
-                        num_of_accounts=int(record[1]) if len(record) > 1 and record[1] else None,
-                        num_of_records=int(record[2]) if len(record) > 2 and record[2] else None,
-                        record_counter=total_records_counter,
-                    )
+        if transaction is not None:
+            yield account, transaction
 
-                    if run_validation and group_record_counter != _rec.num_of_records:
-                        raise exc.Bai2ReaderException(
-                            f"Group trailer record count mismatch: "
-                            f"expected {group_record_counter}, got {_rec.num_of_records}"
-                        )
-
-                    bai_data.groups[-1].group_trailer = _rec
-                    group_record_counter = 0
-
-                elif record_code == enums.Record.file_trailer:
-                    _rec = models.FileTrailer(
-                        record_code=record_code,
-                        file_control_total=float(record[0]) if len(record) > 0 and record[0] else None,
-                        num_of_groups=int(record[1]) if len(record) > 1 and record[1] else None,
-                        num_of_records=int(record[2]) if len(record) > 2 and record[2] else None,
-                        record_counter=total_records_counter,
+    def read_account(
+        self,
+        file_path: str | Path,
+        account_number: str,
+        run_validation: bool | None = None,
+        encoding: str | None = None,
+        trusted: bool | None = None,
+        save_index: bool = False,
+    ) -> models.AccountSection:
+        """Reads a single account of a BAI2 file, without parsing the rest of the file.
+        The sidecar index of the file is used if it is up to date (see `index.build_index`),
+        otherwise the file is indexed first. The reader keeps the index, so the next reads of the file don't scan it
+        again as long as it doesn't change.
+        :param file_path: The path to the BAI2 file to be read.
+        :param account_number: The account number, the first account with this number is read.
+        :param run_validation: Whether to validate the record count in the account trailer, defaults to True.
+        :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+        :param trusted: Whether to skip the pydantic validation of the records, defaults to False.
+        :param save_index: Whether to also save the index as a sidecar file next to the BAI2 file when the file is
+        indexed, so that other readers and processes don't scan it again, defaults to False.
+        :return: The account section, with its transactions and trailer
+        """
+        encoding = self.encoding if encoding is None else encoding
+        file_index = self._file_indexes.get(Path(file_path))
+        if file_index is None or not index.is_up_to_date(file_index, file_path):
+            file_index = index.get_index(file_path, encoding=encoding, delimiter=self.delimiter, save=save_index)
+            self._file_indexes[Path(file_path)] = file_index
+
+        for group in file_index.groups:
+            for account in group.accounts:
+                if account.account_number == account_number:
+                    return index.read_account(
+                        file_path,
+                        group,
+                        account,
+                        run_validation=self.run_validation if run_validation is None else run_validation,
+                        trusted=self.trusted if trusted is None else trusted,
+                        encoding=encoding,
+                        delimiter=self.delimiter,
+                        amount_mode=self.amount_mode,
                     )
 
-                    if run_validation and total_records_counter != _rec.num_of_records:
-                        raise exc.Bai2ReaderException(
-                            f"File trailer record count mismatch: "
-                            f"expected {total_records_counter}, got {_rec.num_of_records}"
-                        )
+        raise exc.Bai2ReaderException(f"Account {account_number} not found in: {file_path}")
 
-                    bai_data.file_trailer = _rec
+    async def _run_in_executor(self, func: Callable, *args, **kwargs) -> Any:
+        """Runs a blocking function on the executor of the reader, within the concurrency limit"""
+        loop = asyncio.get_running_loop()
+        call = partial(func, *args, **kwargs)
 
-            except Exception as e:
-                raise exc.Bai2ReaderException(f"Error parsing record: {line.strip()}\nError: {str(e)}")
+        if self.concurrency_limit is None:
+            return await loop.run_in_executor(self.executor, call)
+        async with self.concurrency_limit:
+            return await loop.run_in_executor(self.executor, call)
 
-        self.bai_data = bai_data
+    async def aread_file(
+        self,
+        file_path: str | Path,
+        run_validation: bool | None = None,
+        encoding: str | None = None,
+        trusted: bool | None = None,
+        workers: int | None = None,
+        member: str | None = None,
+        on_error: enums.OnError | str | None = None,
+        pause_gc: bool | None = None,
+    ) -> Self:
+        """Async version of `read_file`, the file is read and parsed on the executor of the reader,
+        so the event loop is not blocked.
+        :param file_path: The path to the BAI2 file to be read.
+        :param run_validation: Whether to run validation on the parsed data, defaults to True.
+        :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+        :param trusted: Whether to skip the pydantic validation of the records, defaults to False.
+        :param workers: Number of worker processes to parse the groups of the file in parallel, see `read_file`.
+        :param member: The file to read from a zip archive, only needed if the archive has more than one file.
+        :param on_error: How a bad record is handled, defaults to the `on_error` of the reader, see `read_file`.
+        :param pause_gc: Whether to pause the garbage collector of the process during the read, defaults to the
+        `pause_gc` of the reader. The executor threads share the collector with the event loop, see `BAI2Reader`.
+        """
+        if not Path(file_path).is_file():
+            raise exc.Bai2ReaderException(f"File not found: {file_path}")
+
+        self.bai_data, self.stats, self.error_report = await self._run_in_executor(
+            _read_bai_data,
+            file_path,
+            run_validation=self.run_validation if run_validation is None else run_validation,
+            encoding=self.encoding if encoding is None else encoding,
+            trusted=self.trusted if trusted is None else trusted,
+            delimiter=self.delimiter,
+            amount_mode=self.amount_mode,
+            stats_sample_every=self.stats_sample_every,
+            pause_gc=self.pause_gc if pause_gc is None else pause_gc,
+            workers=workers,
+            member=member,
+            on_error=self.on_error if on_error is None else enums.OnError(on_error),
+            log_every=self.log_every,
+        )
+        self.source_filename = Path(file_path)
+        self._emit_stats("read")
         return self
 
-    def write_data(
+    async def awrite_data(
         self,
         output_dir: str | Path | None = None,
         output_file_name: str | None = None,
         output_format: enums.OutputFormat | str | None = None,
         write_args: Dict | None = None,
+        writer_args: Dict | None = None,
+        layout: enums.Layout | str | None = None,
     ) -> None:
-        """Write the BAI2 data to files
+        """Async version of `write_data`, the data is converted and written on the executor of the reader.
+        The executor has to be a thread pool, as the data and the statistics of the reader are not copied to another
+        process and back.
         :param write_args: Write args that will be passed to pandas to_csv or to_json functions, this is optional
+        :param writer_args: Args of the streaming writer of the output format, e.g. the row group size and the
+        compression of `writers.write_parquet`, this is optional
         :param output_dir: The directory where the output files will be saved, defaults to "output".
         :param output_file_name: The Filename  will be saved, defaults to "bai2_output.<typeof export>".
         :param output_format: The format to write the output files in, defaults to CSV.
-        :return:
+        :param layout: How the data is laid out, defaults to the layout of the reader.
         """
-        output_dir = self.output_dir if output_dir is None else output_dir
-        output_format = self.output_format if output_format is None else output_format
-        if output_format is None:
-            output_format = self.output_format
+        if isinstance(self.executor, ProcessPoolExecutor):
+            raise exc.Bai2ReaderException("awrite_data needs a thread pool executor, not a process pool")
+
+        await self._run_in_executor(
+            self.write_data,
+            output_dir=output_dir,
+            output_file_name=output_file_name,
+            output_format=output_format,
+            write_args=write_args,
+            writer_args=writer_args,
+            layout=layout,
+        )
+
+    async def aiter_transactions(
+        self,
+        file_path: str | Path,
+        run_validation: bool | None = None,
+        encoding: str | None = None,
+        trusted: bool | None = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Tuple[models.AccountIdentifier, models.TransactionSection]]:
+        """Async version of `iter_transactions`. The file is read and parsed on the executor of the reader,
+        `chunk_size` transactions at a time, so the event loop gets control back after every chunk.
+        The executor has to be a thread pool, as the file stays open in between the chunks.
+        :param file_path: The path to the BAI2 file to be read.
+        :param run_validation: Whether to run validation on the parsed data, defaults to True.
+        :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+        :param trusted: Whether to skip the pydantic validation of the records, defaults to False.
+        :param chunk_size: Number of transactions that are parsed per call on the executor, defaults to 1000.
+        :return: Async iterator of tuples of the account identifier and the transaction section that belongs to it
+        """
+        if isinstance(self.executor, ProcessPoolExecutor):
+            raise exc.Bai2ReaderException("aiter_transactions needs a thread pool executor, not a process pool")
+        if not Path(file_path).is_file():
+            raise exc.Bai2ReaderException(f"File not found: {file_path}")
+
+        transactions = self.iter_transactions(
+            file_path, run_validation=run_validation, encoding=encoding, trusted=trusted
+        )
+        try:
+            while chunk := await self._run_in_executor(_next_chunk, transactions, chunk_size):
+                for transaction in chunk:
+                    yield transaction
+        finally:
+            transactions.close()
+
+    def read_columns(
+        self,
+        file_path: str | Path,
+        run_validation: bool | None = None,
+        encoding: str | None = None,
+        trusted: bool | None = None,
+        member: str | None = None,
+        workers: int | None = None,
+    ) -> "columnar.ColumnarData":
+        """Reads a BAI2 file straight into per column buffers of the groups, accounts and transactions,
+        without building the Bai2Model. Use `to_dataframe` or `to_arrow` on the result to export the transactions.
+        :param file_path: The path to the BAI2 file to be read.
+        :param run_validation: Whether to run validation on the parsed data, defaults to True.
+        :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+        :param trusted: Whether to skip the pydantic validation of the header and trailer records, defaults to False.
+        :param member: The file to read from a zip archive, only needed if the archive has more than one file.
+        :param workers: Number of worker processes to parse the groups of the file in parallel, see
+        `parallel.read_columns_parallel`. By default the file is parsed in the current process, and compressed files
+        always are.
+        :return: The column buffers of the parsed file
+        """
+        from bai2_reader.src import columnar
+
+        log.info(f"Reading input file: {Path(file_path).name}")
+
+        if workers is not None and workers > 1 and sources.detect_compression(file_path) is None:
+            return parallel.read_columns_parallel(
+                file_path,
+                max_workers=workers,
+                run_validation=self.run_validation if run_validation is None else run_validation,
+                trusted=self.trusted if trusted is None else trusted,
+                encoding=self.encoding if encoding is None else encoding,
+                delimiter=self.delimiter,
+                amount_mode=self.amount_mode,
+            )
+
+        return columnar.read_columns(
+            file_path,
+            run_validation=self.run_validation if run_validation is None else run_validation,
+            encoding=self.encoding if encoding is None else encoding,
+            delimiter=self.delimiter,
+            trusted=self.trusted if trusted is None else trusted,
+            member=member,
+            amount_mode=self.amount_mode,
+        )
+
+    def write_data(
+        self,
+        output_dir: str | Path | None = None,
+        output_file_name: str | None = None,
+        output_format: enums.OutputFormat | str | None = None,
+        write_args: Dict | None = None,
+        writer_args: Dict | None = None,
+        layout: enums.Layout | str | None = None,
+    ) -> Path:
+        """Write the BAI2 data to files.
+        Without write args, CSV, JSON Lines, Parquet and Excel are written by a streaming writer straight from the
+        Bai2Model, see `writers`.
+        The normalized tables are written to a directory named after the output file without its extension, one file
+        per table, e.g. 'transactions.csv', except for Excel which writes a sheet per table to the output file.
+        :param write_args: Write args that will be passed to pandas to_csv or to_json functions, this is optional
+        :param writer_args: Args of the streaming writer of the output format, e.g. the row group size and the
+        compression of `writers.write_parquet`, this is optional
+        :param output_dir: The directory where the output files will be saved, defaults to "output".
+        :param output_file_name: The Filename  will be saved, defaults to "bai2_output.<typeof export>".
+        :param output_format: The format to write the output files in, defaults to CSV.
+        :param layout: How the data is laid out, defaults to the layout of the reader.
+        :return: The path of the output file, or of the output directory of the normalized tables
+        """
+        output_format = self._output_format(output_format)
+        layout = self.layout if layout is None else enums.Layout(layout)
+        output_abs = self._output_path(output_dir, output_file_name, output_format, layout)
+
+        if output_format in STREAMING_FORMATS and write_args is None:
+            start = perf_counter()
+            if layout == enums.Layout.normalized:
+                self._write_tables(partial(tables.model_tables, self.bai_data), output_abs, output_format, writer_args)
+            else:
+                self._write_rows(partial(flat.model_rows, self.bai_data), output_abs, output_format, writer_args)
+            self.stats.seconds["write"] += perf_counter() - start
+        elif layout == enums.Layout.normalized:
+            self._write_table_dataframes(output_abs, output_format, write_args)
+        else:
+            self._write_dataframe(self.to_flat_dataframe(), output_abs, output_format, write_args)
+
+        self._emit_stats("write")
+        log.info(f"Exported input file: {self.source_filename} to: {output_abs}")
+        log.debug(f"Write args: {write_args}")
+        return output_abs
 
+    def export_file(
+        self,
+        file_path: str | Path,
+        output_dir: str | Path | None = None,
+        output_file_name: str | None = None,
+        output_format: enums.OutputFormat | str | None = None,
+        write_args: Dict | None = None,
+        writer_args: Dict | None = None,
+        run_validation: bool | None = None,
+        encoding: str | None = None,
+        trusted: bool | None = None,
+        member: str | None = None,
+        output_stream: TextIO | None = None,
+        layout: enums.Layout | str | None = None,
+    ) -> Path | None:
+        """Exports a BAI2 file straight from the parser to the output file, the rows are written in chunks while the
+        file is parsed, without building the Bai2Model or a DataFrame, so the memory is constant in the file size.
+        The file is read twice for the flat layout, the first pass only parses the trailer records, see
+        `flat.record_rows`, and once for the normalized layout, see `tables.record_tables`.
+        The formats without a streaming writer, or with write args, are read with `read_file` and written with
+        `write_data`. The output file, or the table files, are removed if the export fails.
+        The text formats (`TEXT_FORMATS`) can be written to an open stream instead, e.g. `sys.stdout` for a pipe,
+        the rows written before a failure are then left in the stream.
+        :param file_path: The path to the BAI2 file to be exported, either plain or gzip/bz2/xz/zip compressed.
+        :param output_dir: The directory where the output files will be saved, defaults to "output".
+        :param output_file_name: The Filename  will be saved, defaults to "bai2_output.<typeof export>".
+        :param output_format: The format to write the output files in, defaults to CSV.
+        :param write_args: Write args that will be passed to pandas to_csv or to_json functions, this is optional
+        :param writer_args: Args of the streaming writer of the output format, e.g. the row group size and the
+        compression of `writers.write_parquet`, this is optional
+        :param run_validation: Whether to run validation on the parsed data, defaults to True.
+        :param encoding: The encoding of the BAI2 file, defaults to "utf-8".
+        :param trusted: Whether to skip the pydantic validation of the records, defaults to False.
+        :param member: The file to read from a zip archive, only needed if the archive has more than one file.
+        :param output_stream: The text stream to write to instead of an output file, this is optional
+        :param layout: How the data is laid out, defaults to the layout of the reader. The normalized tables can't be
+        written to a stream.
+        :return: The path of the output file or directory, None if it was written to the output stream
+        """
+        output_format = self._output_format(output_format)
+        layout = self.layout if layout is None else enums.Layout(layout)
+        if output_stream is not None and layout == enums.Layout.normalized:
+            raise exc.Bai2ReaderException("The normalized tables can't be written to a stream")
+        if output_stream is not None and (output_format not in TEXT_FORMATS or write_args is not None):
+            raise exc.Bai2ReaderException(
+                f"Only {', '.join(f.value for f in TEXT_FORMATS)} can be written to a stream, without write args"
+            )
+        if output_format not in STREAMING_FORMATS or write_args is not None:
+            self.read_file(file_path, run_validation=run_validation, encoding=encoding, trusted=trusted, member=member)
+            return self.write_data(output_dir, output_file_name, output_format, write_args, writer_args, layout)
+
+        if not Path(file_path).is_file():
+            raise exc.Bai2ReaderException(f"File not found: {file_path}")
+        self.source_filename = Path(file_path)
+        self.bai_data = None
+        encoding = self.encoding if encoding is None else encoding
+        output_abs = (
+            None
+            if output_stream is not None
+            else self._output_path(output_dir, output_file_name, output_format, layout)
+        )
+
+        log.info(f"Exporting input file: {self.source_filename.name}")
+
+        stats = self.stats = parse_stats.ParseStats(sample_every=self.stats_sample_every)
+        start = perf_counter()
+
+        records = self._iter_records(
+            stats, file_path, run_validation=run_validation, encoding=encoding, trusted=trusted, member=member
+        )
+        try:
+            if layout == enums.Layout.normalized:
+                self._write_tables(partial(tables.record_tables, records), output_abs, output_format, writer_args)
+            else:
+                with sources.open_text(file_path, encoding=encoding, member=member) as file:
+                    envelope = flat.scan_envelope(
+                        file, delimiter=self.delimiter, amount_type=parser.AMOUNT_TYPES[self.amount_mode]
+                    )
+                stats.seconds["io"] += perf_counter() - start
+
+                output = output_abs if output_stream is None else output_stream
+                self._write_rows(partial(flat.record_rows, records, envelope), output, output_format, writer_args)
+        except BaseException:
+            if output_abs is not None:
+                _remove_output(output_abs, output_format)
+            raise
+
+        # the parsing is timed on the sampled lines, the rest of the time is the making and the writing of the rows
+        parsing = sum(stats.seconds[phase] for phase in ("io", "tokenize", "model", "validation"))
+        stats.seconds["write"] = max(perf_counter() - start - parsing, 0.0)
+        stats.peak_allocated_blocks = max(stats.peak_allocated_blocks, sys.getallocatedblocks())
+
+        self._emit_stats("write")
+        log.info(f"Exported input file: {self.source_filename} to: {output_abs or output_stream}")
+        return output_abs
+
+    def _output_format(self, output_format: enums.OutputFormat | str | None) -> enums.OutputFormat:
+        """The output format to write, the one of the reader by default"""
+        output_format = self.output_format if output_format is None else output_format
         if isinstance(output_format, str):
             try:
                 output_format = enums.OutputFormat(output_format.lower())
             except ValueError:
                 raise exc.Bai2ReaderException(f"Unsupported write format: {output_format}")
+        return output_format
 
-        flat_df = self.to_flat_dataframe()
-        output_path = Path(output_dir)
+    def _output_path(
+        self,
+        output_dir: str | Path | None,
+        output_file_name: str | None,
+        output_format: enums.OutputFormat,
+        layout: enums.Layout = enums.Layout.flat,
+    ) -> Path:
+        """The path of the output file, the output directory is created if it doesn't exist.
+        The normalized tables, except for Excel, are written to the path without its extension, a directory.
+        """
+        output_path = Path(self.output_dir if output_dir is None else output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         if output_file_name:
             output_abs = Path(output_path, output_file_name)
         else:
             output_abs = Path(
-                output_path, f"{self.source_filename.stem}_{datetime.now(tz=timezone.utc)}.{output_format.value}"
+                output_path, f"{self.source_filename.stem}_{datetime.now(tz=timezone.utc)}.{output_format.extension}"
             )
+        if layout == enums.Layout.normalized and output_format != enums.OutputFormat.EXCEL:
+            return output_abs.with_suffix("")
+        return output_abs
 
+    def _write_rows(
+        self,
+        rows: Callable[..., Iterator[List[Tuple]]],
+        output_abs: Path | TextIO,
+        output_format: enums.OutputFormat,
+        writer_args: Dict | None = None,
+    ) -> int:
+        """Writes the chunks of flat rows with the streaming writer of the output format, see `writers`
+        :param rows: Makes the chunks of flat rows, `flat.model_rows` or `flat.record_rows` without the `keyed` arg
+        :param output_abs: The path of the output file, or an open text stream for the `TEXT_FORMATS`
+        """
+        writer_args = writer_args or {}
+        if output_format == enums.OutputFormat.CSV:
+            return writers.write_csv(output_abs, rows(), **writer_args)
+        if output_format == enums.OutputFormat.JSONL:
+            return writers.write_jsonl(output_abs, rows(), **writer_args)
+        if output_format == enums.OutputFormat.PARQUET:
+            schema = writers.parquet_schema(self.amount_mode)
+            return writers.write_parquet(output_abs, rows(), schema=schema, **writer_args)
+        if output_format == enums.OutputFormat.EXCEL:
+            return writers.write_excel(output_abs, rows(keyed=True), **writer_args)
+        raise exc.Bai2ReaderException(f"Unsupported streaming format: {output_format}")
+
+    def _write_tables(
+        self,
+        chunks: Callable[[], Iterator[tables.TableChunk]],
+        output_abs: Path,
+        output_format: enums.OutputFormat,
+        writer_args: Dict | None = None,
+    ) -> Dict[str, int]:
+        """Writes the chunks of the normalized tables with the streaming writers of the output format, see
+        `writers.write_tables`
+        :param chunks: Makes the chunks of the tables, `tables.model_tables` or `tables.record_tables`
+        :param output_abs: The output directory, or the path of the Excel file
+        """
+        writer_args = {"amount_mode": self.amount_mode, **(writer_args or {})}
+        return writers.write_tables(output_abs, chunks(), output_format, **writer_args)
+
+    def _write_table_dataframes(
+        self, output_abs: Path, output_format: enums.OutputFormat, write_args: Dict | None
+    ) -> None:
+        """Writes the normalized tables with pandas, a file per table in the output directory or a sheet per table
+        of the Excel file, the write args are passed to every to_csv, to_json, to_parquet or to_excel
+        """
+        table_dfs = self.to_table_dataframes()
+        if output_format != enums.OutputFormat.EXCEL:
+            output_abs.mkdir(parents=True, exist_ok=True)
+            for table, table_df in table_dfs.items():
+                table_abs = Path(output_abs, f"{table}.{output_format.extension}")
+                self._write_dataframe(table_df, table_abs, output_format, write_args)
+            return
+
+        import pandas as pd
+
+        start = perf_counter()
+        if write_args is None:
+            write_args = {"index": False}
+        with pd.ExcelWriter(output_abs, engine="xlsxwriter") as excel_writer:
+            for table, table_df in table_dfs.items():
+                table_df.to_excel(excel_writer, sheet_name=table, **write_args)
+        self.stats.seconds["write"] += perf_counter() - start
+
+    def _write_dataframe(
+        self, flat_df: "pd.DataFrame", output_abs: Path, output_format: enums.OutputFormat, write_args: Dict | None
+    ) -> None:
+        """Writes the flat DataFrame with pandas, the write args are passed to its to_csv, to_json or to_parquet"""
+        start = perf_counter()
         if output_format == enums.OutputFormat.CSV:
             if write_args is None:
                 write_args = {"index": False}
@@ -266,27 +821,73 @@ class BAI2Reader:
             if write_args is None:
                 write_args = {"orient": "records", "indent": 2, "index": False}
             flat_df.to_json(output_abs, **write_args)
+        elif output_format == enums.OutputFormat.JSONL:
+            if write_args is None:
+                write_args = {"orient": "records", "lines": True, "index": False}
+            flat_df.to_json(output_abs, **write_args)
         elif output_format == enums.OutputFormat.PARQUET:
             if write_args is None:
                 write_args = {"index": False}
             flat_df.to_parquet(output_abs, **write_args)
+        elif output_format == enums.OutputFormat.EXCEL:
+            if write_args is None:
+                write_args = {"index": False, "engine": "xlsxwriter"}
+            flat_df.to_excel(output_abs, **write_args)
         else:
             raise exc.Bai2ReaderException(f"Unsupported write format: {output_format}")
-
-        log.info(f"Exported input file: {self.source_filename} to: {output_abs}")
-        log.debug(f"Write args: {write_args}")
+        self.stats.seconds["write"] += perf_counter() - start
 
     def to_json(self) -> List:
         """BAI2 data into a list of dictionaries"""
         return bai_to_json(self.bai_data)
 
-    def to_flat_dataframe(self) -> pd.DataFrame:
+    def to_flat_dataframe(self, tags: Sequence[str] | None = None) -> "pd.DataFrame":
         """Flattens the nested structure of the BAI2 data into a list of dictionaries, where each dictionary represents
         a single transaction with all relevant information from the file, group, account, and transaction levels.
+        :param tags: Tags of the continuation records to be extracted into 'transaction_summary_{tag}' columns,
+        e.g. `continuations.DEFAULT_TAGS`, by default no tag is extracted.
         :return: A list of dictionaries, where each dictionary represents a single transaction with all
         relevant information from the file, group, account, and transaction levels.
         """
-        return bai_to_flat_dataframe(self.bai_data)
+        start = perf_counter()
+        df = bai_to_flat_dataframe(self.bai_data, tags=tags)
+        self.stats.seconds["flatten"] += perf_counter() - start
+        return df
+
+    def to_table_dataframes(self) -> Dict[str, "pd.DataFrame"]:
+        """The normalized tables of the BAI2 data, a DataFrame per record level linked by integer keys, see `tables`
+        :return: The DataFrames of the tables by table name, in the order of `tables.TABLE_COLUMNS`
+        """
+        start = perf_counter()
+        table_dfs = bai_to_table_dataframes(self.bai_data)
+        self.stats.seconds["flatten"] += perf_counter() - start
+        return table_dfs
+
+    def to_balances_dataframe(self, pivot: bool = False, major_units: bool = False) -> "pd.DataFrame":
+        """Balances table of the status and summary fields of the account identifier records, see `balances`
+        :param pivot: Whether to return one row per account with one column per type code, e.g. 'opening_ledger'
+        :param major_units: Whether to scale the amounts by the exponent of their currency, see `amounts`
+        :return: The balances, one row per account per status or summary type code unless pivoted
+        """
+        return bai_to_balances_dataframe(self.bai_data, delimiter=self.delimiter, pivot=pivot, major_units=major_units)
+
+    def _emit_stats(self, event: str) -> None:
+        """Logs the statistics as a structured summary event, and sends them to the stats hook.
+        The event and the statistics are in the `event` and `stats` attributes of the log record, for log handlers
+        that ship structured logs. A failing hook is logged and doesn't fail the read or export.
+        :param event: What the statistics are of, "read" or "write"
+        """
+        stats = self.stats
+        log.info(
+            f"Stats of {event}: {stats.lines} lines, {stats.bytes_read} bytes, {stats.total_seconds:.3f}s",
+            extra={"event": event, "stats": stats.to_dict()},
+        )
+        if self.stats_hook is None:
+            return
+        try:
+            self.stats_hook(self.stats)
+        except Exception as e:
+            log.warning(f"Stats hook failed: {type(e).__name__}: {e}")
 
 
 def bai_to_json(bai_data: models.Bai2Model) -> List[Dict]:
@@ -301,7 +902,7 @@ def bai_to_json(bai_data: models.Bai2Model) -> List[Dict]:
             for transaction in account.transactions:
                 json_data.append(
                     {
-                        "file_header": bai_data.header.model_dump(),
+                        "file_header": bai_data.header.model_dump() if bai_data.header else {},
                         "group_header": group.group_header.model_dump(),
                         "account_identifier": account.account_identifier.model_dump(),
                         "account_summary": " ".join([summary.record for summary in account.summary]),
@@ -309,22 +910,43 @@ def bai_to_json(bai_data: models.Bai2Model) -> List[Dict]:
                         "transaction_summary": " ".join([summary.record for summary in transaction.summary]),
                         "account_trailer": account.account_trailer.model_dump() if account.account_trailer else {},
                         "group_trailer": group.group_trailer.model_dump() if group.group_trailer else {},
-                        "file_trailer": bai_data.file_trailer.model_dump(),
+                        "file_trailer": bai_data.file_trailer.model_dump() if bai_data.file_trailer else {},
                     }
                 )
     return json_data
 
 
-def bai_to_flat_dataframe(bai_data: models.Bai2Model) -> pd.DataFrame:
+def bai_to_flat_dataframe(bai_data: models.Bai2Model, tags: Sequence[str] | None = None) -> "pd.DataFrame":
     """Flattens the nested structure of the BAI2 data into a list of dictionaries, where each dictionary represents
     a single transaction with all relevant information from the file, group, account, and transaction levels.
     :param bai_data: input data that is generated using Bai2Model
+    :param tags: Tags of the continuation records to be extracted into 'transaction_summary_{tag}' columns,
+    e.g. `continuations.DEFAULT_TAGS`, by default no tag is extracted.
     :return: A list of dictionaries, where each dictionary represents a single transaction with all
     relevant information from the file, group, account, and transaction levels.
     """
+    import pandas as pd
+
+    from bai2_reader.src import continuations
+
     flat_data = bai_to_json(bai_data)
     df = pd.json_normalize(flat_data, sep="_")
 
+    if tags:
+        records, rows = [], []
+        transactions = (
+            transaction
+            for group in bai_data.groups
+            for account in group.accounts
+            for transaction in account.transactions
+        )
+        for row, transaction in enumerate(transactions):
+            records.extend(summary.record for summary in transaction.summary)
+            rows.extend([row] * len(transaction.summary))
+
+        tag_columns = continuations.extract_tags(records, rows, len(df), tags)
+        df[[f"transaction_summary_{column}" for column in tag_columns.columns]] = tag_columns.to_numpy()
+
     order = [
         "file_header",
         "group_header",
@@ -343,3 +965,112 @@ def bai_to_flat_dataframe(bai_data: models.Bai2Model) -> pd.DataFrame:
                 ordered_columns.append(column)
 
     return df[ordered_columns]
+
+
+def bai_to_table_dataframes(bai_data: models.Bai2Model) -> Dict[str, "pd.DataFrame"]:
+    """The normalized tables of the BAI2 data, a DataFrame per record level linked by integer keys, see `tables`.
+    The keys are nullable integers, the transaction key of the continuations of an account identifier is missing.
+    :param bai_data: input data that is generated using Bai2Model
+    :return: The DataFrames of the tables by table name, in the order of `tables.TABLE_COLUMNS`
+    """
+    import pandas as pd
+
+    rows: Dict[str, List[Tuple]] = {table: [] for table in tables.TABLE_COLUMNS}
+    for table, chunk in tables.model_tables(bai_data):
+        rows[table].extend(chunk)
+
+    table_dfs = {}
+    for table, columns in tables.TABLE_COLUMNS.items():
+        table_df = pd.DataFrame.from_records(rows[table], columns=list(columns))
+        keys = [column for column in columns if column in tables.KEY_COLUMNS]
+        table_df[keys] = table_df[keys].astype("Int64")
+        table_dfs[table] = table_df
+    return table_dfs
+
+
+def bai_to_balances_dataframe(
+    bai_data: models.Bai2Model, delimiter: str = ",", pivot: bool = False, major_units: bool = False
+) -> "pd.DataFrame":
+    """Balances table of the status and summary fields of the account identifier records, see `balances`
+    :param bai_data: input data that is generated using Bai2Model
+    :param delimiter: The field delimiter of the file, used to split the rest of the '03' and '88' records
+    :param pivot: Whether to return one row per account with one column per type code, e.g. 'opening_ledger'
+    :param major_units: Whether to scale the amounts by the exponent of their currency, see `amounts`
+    :return: The balances, one row per account per status or summary type code unless pivoted
+    """
+    from bai2_reader.src import balances
+
+    status_fields, group_index, account_number, currency_code = [], [], [], []
+
+    for position, group in enumerate(bai_data.groups):
+        for account in group.accounts:
+            identifier = account.account_identifier
+            fields = [identifier.type_code, identifier.opening_balance, identifier.item_count, identifier.fund_type]
+            if identifier.rest_of_record:
+                fields.extend(identifier.rest_of_record.split(delimiter))
+            for continuation in account.summary:
+                fields.extend(continuation.record.split(delimiter))
+
+            status_fields.append(fields)
+            group_index.append(position)
+            account_number.append(identifier.account_number)
+            currency_code.append(identifier.currency_code or (group.group_header and group.group_header.currency_code))
+
+    df = balances.balances_dataframe(status_fields, group_index, account_number, currency_code, major_units)
+    return balances.pivot_balances(df) if pivot else df
+
+
+def _read_bai_data(
+    file_path: str | Path,
+    run_validation: bool,
+    encoding: str,
+    trusted: bool,
+    delimiter: str,
+    amount_mode: enums.AmountMode,
+    stats_sample_every: int = 64,
+    pause_gc: bool = False,
+    workers: int | None = None,
+    member: str | None = None,
+    on_error: enums.OnError = enums.OnError.raise_,
+    log_every: int = 100_000,
+) -> Tuple[models.Bai2Model, parse_stats.ParseStats, models.ErrorReport | None]:
+    """Reads a BAI2 file into a Bai2Model, its statistics and its error report, a module level function so it can be
+    run in a process pool
+    """
+    reader = BAI2Reader(
+        run_validation=run_validation,
+        encoding=encoding,
+        delimiter=delimiter,
+        trusted=trusted,
+        amount_mode=amount_mode,
+        stats_sample_every=stats_sample_every,
+        log_every=log_every,
+        on_error=on_error,
+        pause_gc=pause_gc,
+    )
+    reader.read_file(file_path, workers=workers, member=member)
+    return reader.bai_data, reader.stats, reader.error_report
+
+
+def _remove_output(output_abs: Path, output_format: enums.OutputFormat) -> None:
+    """Removes the output file of a failed export, or the table files and their directory if it is left empty"""
+    if not output_abs.is_dir():
+        output_abs.unlink(missing_ok=True)
+        return
+    for table in tables.TABLE_COLUMNS:
+        Path(output_abs, f"{table}.{output_format.extension}").unlink(missing_ok=True)
+    with suppress(OSError):
+        output_abs.rmdir()
+
+
+def _next_chunk(iterator: Iterator, chunk_size: int) -> List:
+    """Takes the next `chunk_size` items of an iterator, an empty list once it is exhausted"""
+    return list(islice(iterator, chunk_size))
+
+
+def _position(file: Any) -> int:
+    """Number of (decompressed) bytes read from a text stream, 0 if its binary stream can't tell"""
+    try:
+        return file.buffer.tell()
+    except (AttributeError, OSError, ValueError):
+        return 0
@@ -0,0 +1,217 @@
+"""Reading of a BAI2 file that collects the errors of its records instead of raising on the first one.
+
+A bad record, one that fails to parse or comes before the header of its section, takes its section out of the file:
+the account it belongs to (from its '03' up to and including its '49' record), the group for a bad group header or
+trailer, or only the record itself for a file header or trailer.
+The lines of the skipped section after the bad record are not parsed, only counted, so the trailer counts of the
+sections around it are still validated. The records of the section that were already parsed are removed from the
+Bai2Model once it is built, with `ErrorCollector.prune`.
+Every error is reported with its line number, its text and the line range of the skipped section, so the bad
+sections can be fixed and read again without reading the rest of the file.
+"""
+
+__all__ = ["ErrorCollector"]
+
+from typing import List, Set, Tuple
+
+from bai2_reader.src.logger import log
+from bai2_reader.src import enums, exceptions as exc, models, parser
+
+# the records that end the skipping of a section whose trailer is missing, they are parsed again
+ACCOUNT_BOUNDARIES = (parser.GROUP_HEADER, parser.ACCOUNT_IDENTIFIER, parser.GROUP_TRAILER, parser.FILE_TRAILER)
+GROUP_BOUNDARIES = (parser.GROUP_HEADER, parser.FILE_TRAILER)
+
+GROUP_RECORDS = (parser.GROUP_HEADER, parser.GROUP_TRAILER)
+ACCOUNT_RECORDS = (parser.ACCOUNT_IDENTIFIER, parser.TRANSACTION, parser.CONTINUATION, parser.ACCOUNT_TRAILER)
+
+
+class ErrorCollector:
+    """Parses the lines of a BAI2 file like `parser.parse_line`, skipping the section of a bad record"""
+
+    def __init__(self):
+        """Initializer"""
+        self.errors: List[models.ParseError] = []
+        self.line_number = 0
+
+        # positions of the open group and account in the Bai2Model, and the line numbers of their first record
+        self.group_index = -1
+        self.account_index = -1
+        self.group_open = False
+        self.account_open = False
+        self.group_first_line = 0
+        self.account_first_line = 0
+
+        self.skipping: enums.Section | None = None
+        self.dropped_groups: Set[int] = set()
+        self.dropped_accounts: Set[Tuple[int, int]] = set()
+
+    def parse_line(self, state: parser.ParserState, line: str) -> models.Record | None:
+        """Parses a single line of a BAI2 file, see `parser.parse_line`
+        :param state: The parser state that is carried from one line to the next
+        :param line: A single line of the BAI2 file, every line of the file has to be passed in order
+        :return: The parsed record, or None if the line is empty, bad or in a skipped section
+        """
+        self.line_number += 1
+        if self.skipping is not None and self._skip(state, line):
+            return None
+
+        try:
+            record = parser.parse_line(state, line)
+        except exc.Bai2ReaderException as e:
+            self._collect(state, line, e)
+            return None
+
+        if record is None:
+            return None
+
+        # a record before the header of its section can't be placed in the Bai2Model, it is a bad record too
+        header = parser.missing_section_header(record.record_code, self.group_index + 1, self.account_index + 1)
+        if header is not None:
+            error = exc.Bai2ReaderException(f"No '{header}' record before the '{record.record_code}' record")
+            self._collect(state, line, error)
+            return None
+
+        self._track(record.record_code)
+        return record
+
+    def _track(self, record_code: str) -> None:
+        """Follows the groups and accounts that are opened and closed by a parsed record"""
+        if record_code == parser.GROUP_HEADER:
+            self.group_index += 1
+            self.account_index = -1
+            self.group_open = True
+            self.group_first_line = self.line_number
+        elif record_code == parser.ACCOUNT_IDENTIFIER:
+            self.account_index += 1
+            self.account_open = True
+            self.account_first_line = self.line_number
+        elif record_code == parser.ACCOUNT_TRAILER:
+            self.account_open = False
+        elif record_code == parser.GROUP_TRAILER:
+            self.group_open = False
+            self.account_open = False
+
+    def _collect(self, state: parser.ParserState, line: str, error: exc.Bai2ReaderException) -> None:
+        """Records the error of a bad line, and starts skipping its section"""
+        record_code = line[:2]
+
+        if record_code in (parser.FILE_HEADER, parser.FILE_TRAILER):
+            section = enums.Section.file
+        elif record_code in GROUP_RECORDS:
+            section = enums.Section.group
+        elif record_code in ACCOUNT_RECORDS:
+            section = enums.Section.account
+        else:
+            # an unknown record code belongs to the innermost open section
+            section = (
+                enums.Section.account
+                if self.account_open
+                else enums.Section.group
+                if self.group_open
+                else enums.Section.file
+            )
+
+        # a header opens a new section, the one before it is not part of the error
+        if record_code in (parser.GROUP_HEADER, parser.ACCOUNT_IDENTIFIER):
+            self.account_open = False
+            self.group_open = self.group_open and record_code == parser.ACCOUNT_IDENTIFIER
+
+        first_line = self.line_number
+        if section is enums.Section.account and self.account_open:
+            self.dropped_accounts.add((self.group_index, self.account_index))
+            first_line = self.account_first_line
+        elif section is enums.Section.group and self.group_open:
+            self.dropped_groups.add(self.group_index)
+            first_line = self.group_first_line
+        if section is enums.Section.group:
+            self.group_open = False
+        if section is not enums.Section.file:
+            self.account_open = False
+
+        # the handlers wrap the original error, which has the short message
+        cause = error.__cause__ or error
+        self.errors.append(
+            models.ParseError(
+                line_number=self.line_number,
+                record_code=record_code,
+                raw=line.strip(),
+                error_type=type(cause).__name__,
+                message=str(cause),
+                section=section,
+                first_line=first_line,
+                last_line=self.line_number,
+            )
+        )
+        log.warning(f"Skipping the {section.value} of line {self.line_number}: {type(cause).__name__}: {cause}")
+
+        # a bad trailer closes its own section, otherwise the rest of the section is skipped
+        if section is enums.Section.account and record_code == parser.ACCOUNT_TRAILER:
+            self._end_skip(state, section)
+        elif section is enums.Section.group and record_code == parser.GROUP_TRAILER:
+            state.group_record_counter = 0
+            state.account_record_counter = 0
+        elif section is not enums.Section.file:
+            self.skipping = section
+
+    def _skip(self, state: parser.ParserState, line: str) -> bool:
+        """Counts a line of the skipped section without parsing it
+        :return: Whether the line was skipped, False once the section is over and the line has to be parsed
+        """
+        if not line.strip():
+            return True
+
+        record_code = line[:2]
+        boundaries = ACCOUNT_BOUNDARIES if self.skipping is enums.Section.account else GROUP_BOUNDARIES
+        if record_code in boundaries:
+            # the trailer of the section is missing, the record belongs to the next section
+            self._end_skip(state, self.skipping)
+            return False
+
+        state.total_records_counter += 1
+        state.group_record_counter += 1
+        self.errors[-1].last_line = self.line_number
+
+        if (self.skipping is enums.Section.account and record_code == parser.ACCOUNT_TRAILER) or (
+            self.skipping is enums.Section.group and record_code == parser.GROUP_TRAILER
+        ):
+            self._end_skip(state, self.skipping)
+        return True
+
+    def _end_skip(self, state: parser.ParserState, section: enums.Section) -> None:
+        """Resets the counters of the skipped section, as its trailer would have done. The records of an account
+        outside of any group, e.g. before the first '02' record, are not counted in the next group either.
+        """
+        if section is enums.Section.group or not self.group_open:
+            state.group_record_counter = 0
+        state.account_record_counter = 0
+        self.skipping = None
+
+    def prune(self, bai_data: models.Bai2Model) -> models.Bai2Model:
+        """Removes the groups and accounts of the skipped sections that were already built into the Bai2Model
+        :param bai_data: The Bai2Model built from the records returned by `parse_line`
+        :return: The same Bai2Model, without the skipped sections
+        """
+        for group_index, account_index in sorted(self.dropped_accounts, reverse=True):
+            del bai_data.groups[group_index].accounts[account_index]
+        for group_index in sorted(self.dropped_groups, reverse=True):
+            del bai_data.groups[group_index]
+        return bai_data
+
+    def report(self) -> models.ErrorReport:
+        """The report of the errors collected so far
+        :return: The errors and the number of skipped records, accounts and groups
+        """
+        # the line ranges of the skipped sections can overlap, e.g. a bad account within a bad group
+        skipped_records = 0
+        last_line = 0
+        for first, last in sorted((error.first_line, error.last_line) for error in self.errors):
+            if last > last_line:
+                skipped_records += last - max(first, last_line + 1) + 1
+                last_line = last
+
+        return models.ErrorReport(
+            errors=list(self.errors),
+            skipped_records=skipped_records,
+            skipped_accounts=sum(error.section is enums.Section.account for error in self.errors),
+            skipped_groups=sum(error.section is enums.Section.group for error in self.errors),
+        )
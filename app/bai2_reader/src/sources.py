@@ -0,0 +1,92 @@
+"""Transparent decompression of BAI2 input files.
+
+The compression of a file is detected from its magic bytes, not from its extension, and the file is decompressed
+while it is read, line by line, without writing the decompressed file to disk. Zip archives are read member by member
+straight from the archive.
+"""
+
+__all__ = ["Compression", "archive_members", "detect_compression", "open_text"]
+
+import bz2
+import gzip
+import io
+import lzma
+import zipfile
+
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from typing import Iterator, List, TextIO
+
+from bai2_reader.src import exceptions as exc
+
+
+class Compression(Enum):
+    """Compression formats of the input files, with their magic bytes"""
+
+    gzip = b"\x1f\x8b"
+    bz2 = b"BZh"
+    xz = b"\xfd7zXZ\x00"
+    zip = b"PK\x03\x04"
+
+
+def detect_compression(file_path: str | Path) -> Compression | None:
+    """Detects the compression of a file from its first bytes
+    :param file_path: The path to the file
+    :return: The compression format, or None if the file is not compressed
+    """
+    with open(file_path, "rb") as file:
+        magic = file.read(6)
+
+    for compression in Compression:
+        if magic.startswith(compression.value):
+            return compression
+    return None
+
+
+def archive_members(file_path: str | Path) -> List[str] | None:
+    """Lists the files in a zip archive
+    :param file_path: The path to the file
+    :return: The names of the files in the archive, or None if the file is not a zip archive
+    """
+    if not Path(file_path).is_file() or detect_compression(file_path) is not Compression.zip:
+        return None
+
+    with zipfile.ZipFile(file_path) as archive:
+        return [info.filename for info in archive.infolist() if not info.is_dir()]
+
+
+@contextmanager
+def open_text(file_path: str | Path, encoding: str = "utf-8", member: str | None = None) -> Iterator[TextIO]:
+    """Opens a plain, gzip, bz2, xz or zip compressed file for reading as text, decompressing it while it is read
+    :param file_path: The path to the file
+    :param encoding: The encoding of the decompressed text, defaults to "utf-8".
+    :param member: The file to read from a zip archive, only needed if the archive has more than one file.
+    :return: The text stream of the (decompressed) file
+    """
+    compression = detect_compression(file_path)
+
+    if compression is None:
+        with open(file_path, encoding=encoding) as file:
+            yield file
+    elif compression is Compression.gzip:
+        with gzip.open(file_path, "rt", encoding=encoding) as file:
+            yield file
+    elif compression is Compression.bz2:
+        with bz2.open(file_path, "rt", encoding=encoding) as file:
+            yield file
+    elif compression is Compression.xz:
+        with lzma.open(file_path, "rt", encoding=encoding) as file:
+            yield file
+    else:
+        with zipfile.ZipFile(file_path) as archive:
+            if member is None:
+                members = [info.filename for info in archive.infolist() if not info.is_dir()]
+                if len(members) != 1:
+                    raise exc.InvalidFileFormatException(
+                        f"Zip archive {file_path} has {len(members)} files, pass the one to read: {members}"
+                    )
+                member = members[0]
+
+            with archive.open(member) as binary_file, io.TextIOWrapper(binary_file, encoding=encoding) as file:
+                yield file
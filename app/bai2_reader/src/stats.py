@@ -0,0 +1,60 @@
+"""Statistics of the parsing and the exports of a BAI2 file, collected by `BAI2Reader` on every read.
+
+The statistics are cheap enough to be left on: the records are counted per record code, and the timers are read on
+the first `sample_every` lines and then on one line out of `sample_every`. On the sampled lines the reading of the line
+from the file (I/O and decoding), its tokenizing and its parsing are timed on their own, and the per phase times are
+scaled up to all the lines.
+The trailer count checks (validation), the flattening to a DataFrame and the writing of the output file are few and
+long, so they are timed on every call. The model construction is what remains of the wall time of the read.
+"""
+
+__all__ = ["PHASES", "ParseStats", "RECORD_NAMES"]
+
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict
+
+from bai2_reader.src import enums
+
+PHASES = ("io", "tokenize", "model", "validation", "flatten", "write")
+
+# record code -> record name, e.g. '16' -> 'transaction'
+RECORD_NAMES = {record.value: record.name for record in enums.Record}
+
+
+@dataclass
+class ParseStats:
+    """Statistics of the last file read by a `BAI2Reader`, and of the exports of its data"""
+
+    record_counts: Dict[str, int] = field(default_factory=dict)
+    bytes_read: int = 0
+    lines: int = 0
+    seconds: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    # peak of `sys.getallocatedblocks()` over the sampled lines, a cheap proxy of the number of live objects
+    peak_allocated_blocks: int = 0
+    sample_every: int = 64
+
+    def count(self, record_code: str, count: int = 1) -> None:
+        """Adds to the count of a record code, the counts are keyed by record name e.g. 'transaction'
+        :param record_code: The two character record code
+        :param count: The number of records to add
+        """
+        name = RECORD_NAMES.get(record_code, record_code)
+        self.record_counts[name] = self.record_counts.get(name, 0) + count
+
+    @property
+    def total_seconds(self) -> float:
+        """Time spent in all the phases"""
+        return sum(self.seconds.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat dictionary of the statistics, e.g. for a metrics system: 'records.transaction', 'seconds.io', ...
+        :return: The statistics, with dotted keys for the per record code counts and the per phase times
+        """
+        values = asdict(self)
+        flat = {f"records.{name}": count for name, count in values.pop("record_counts").items()}
+        flat.update({f"seconds.{phase}": seconds for phase, seconds in values.pop("seconds").items()})
+        flat.update(values)
+        return flat
+
+
+StatsHook = Callable[[ParseStats], None]
@@ -0,0 +1,226 @@
+"""Normalized tables of a BAI2 file, without pandas.
+
+The flat rows of `flat` repeat the values of the file, group and account of a transaction on every row. The normalized
+layout writes every record once instead, in five tables linked by integer surrogate keys, which number the rows of
+every table from 1 in file order:
+
+- files: the file header and trailer, with its `file_key`
+- groups: the group header and trailer, with its `group_key` and the `file_key` of its file
+- accounts: the account identifier and trailer, with its `account_key` and the `group_key` of its group
+- transactions: the transaction record, with its `transaction_key` and the `account_key` of its account
+- continuations: the '88' records, with their `continuation_key`, the `account_key` of their account and the
+  `transaction_key` of their transaction, null for the continuations of the account identifier
+
+The other columns have the names of `flat.FLAT_COLUMNS`. Like a Bai2Model, the files table has a single row, with the
+last file header of the files that were concatenated into one.
+The rows are made in chunks per table, either from a Bai2Model (`model_tables`) or straight from the records of a file
+while it is parsed (`record_tables`). A group or account row is made once its trailer is read, so unlike the flat rows
+a single pass over the file is enough.
+"""
+
+__all__ = [
+    "COLUMN_KINDS",
+    "DICTIONARY_COLUMNS",
+    "KEY_COLUMNS",
+    "TABLE_COLUMNS",
+    "TableChunk",
+    "model_tables",
+    "record_tables",
+]
+
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from bai2_reader.src import flat, models, parser
+
+# the surrogate keys of the rows of the tables, and of their parents
+KEY_COLUMNS = ("file_key", "group_key", "account_key", "transaction_key", "continuation_key")
+
+# the columns of every table, in the order the tables are written
+TABLE_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "files": (
+        "file_key",
+        *(f"file_header_{name}" for name in flat.FILE_HEADER_FIELDS),
+        *(f"file_trailer_{name}" for name in flat.FILE_TRAILER_FIELDS),
+    ),
+    "groups": (
+        "group_key",
+        "file_key",
+        *(f"group_header_{name}" for name in flat.GROUP_HEADER_FIELDS),
+        *(f"group_trailer_{name}" for name in flat.GROUP_TRAILER_FIELDS),
+    ),
+    "accounts": (
+        "account_key",
+        "group_key",
+        *(f"account_identifier_{name}" for name in flat.ACCOUNT_IDENTIFIER_FIELDS),
+        *(f"account_trailer_{name}" for name in flat.ACCOUNT_TRAILER_FIELDS),
+    ),
+    "transactions": (
+        "transaction_key",
+        "account_key",
+        *(f"transaction_{name}" for name in flat.TRANSACTION_FIELDS),
+    ),
+    "continuations": ("continuation_key", "account_key", "transaction_key", "continuation_record"),
+}
+
+# the kind of the values of every column of the tables, see `flat.COLUMN_KINDS`
+COLUMN_KINDS: Dict[str, str] = {
+    **flat.COLUMN_KINDS,
+    **dict.fromkeys(KEY_COLUMNS, "count"),
+    "continuation_record": "text",
+}
+
+# the codes of the transactions, the other texts are not repeated once the tables are normalized
+DICTIONARY_COLUMNS = ("transaction_type_code", "transaction_funds_type", "transaction_transaction_type")
+
+# a chunk of rows of one table, the rows in the order of its `TABLE_COLUMNS`
+TableChunk = Tuple[str, List[flat.Row]]
+
+
+def model_tables(bai_data: models.Bai2Model, chunk_size: int = flat.CHUNK_SIZE) -> Iterator[TableChunk]:
+    """The rows of the normalized tables of a Bai2Model, in chunks
+    :param bai_data: input data that is generated using Bai2Model
+    :param chunk_size: Number of rows per chunk, defaults to `flat.CHUNK_SIZE`
+    :return: Iterator of (table name, list of rows) pairs, the chunks of the tables are interleaved
+    """
+    groups: List[flat.Row] = []
+    accounts: List[flat.Row] = []
+    transactions: List[flat.Row] = []
+    continuations: List[flat.Row] = []
+    account_key = transaction_key = continuation_key = 0
+
+    for group_key, group in enumerate(bai_data.groups, start=1):
+        groups.append(
+            (group_key, 1)
+            + flat.record_values(group.group_header, flat.GROUP_HEADER_FIELDS)
+            + flat.record_values(group.group_trailer, flat.GROUP_TRAILER_FIELDS)
+        )
+
+        for account in group.accounts:
+            account_key += 1
+            accounts.append(
+                (account_key, group_key)
+                + flat.record_values(account.account_identifier, flat.ACCOUNT_IDENTIFIER_FIELDS)
+                + flat.record_values(account.account_trailer, flat.ACCOUNT_TRAILER_FIELDS)
+            )
+            for continuation in account.summary:
+                continuation_key += 1
+                continuations.append((continuation_key, account_key, None, continuation.record))
+
+            for transaction in account.transactions:
+                transaction_key += 1
+                transactions.append((transaction_key, account_key) + flat.transaction_values(transaction.transaction))
+                for continuation in transaction.summary:
+                    continuation_key += 1
+                    continuations.append((continuation_key, account_key, transaction_key, continuation.record))
+
+                if len(transactions) >= chunk_size:
+                    yield "transactions", transactions
+                    transactions = []
+                if len(continuations) >= chunk_size:
+                    yield "continuations", continuations
+                    continuations = []
+
+            if len(accounts) >= chunk_size:
+                yield "accounts", accounts
+                accounts = []
+        if len(groups) >= chunk_size:
+            yield "groups", groups
+            groups = []
+
+    yield from _last_chunks(
+        [_file_row(bai_data.header, bai_data.file_trailer)], groups, accounts, transactions, continuations
+    )
+
+
+def record_tables(records: Iterable[models.Record], chunk_size: int = flat.CHUNK_SIZE) -> Iterator[TableChunk]:
+    """The rows of the normalized tables of a stream of records, in chunks, a group or account is a row once its
+    trailer is read, or once the next section starts if it has none
+    :param records: The parsed records, as returned by `BAI2Reader.iter_records`
+    :param chunk_size: Number of rows per chunk, defaults to `flat.CHUNK_SIZE`
+    :return: Iterator of (table name, list of rows) pairs, the chunks of the tables are interleaved
+    """
+    groups: List[flat.Row] = []
+    accounts: List[flat.Row] = []
+    transactions: List[flat.Row] = []
+    continuations: List[flat.Row] = []
+    group_key = account_key = transaction_key = continuation_key = 0
+    file_header = file_trailer = None
+
+    # the header values of the group and account without their trailer yet, and the last transaction of the account
+    group_values = account_values = None
+    last_transaction_key = None
+
+    for record in records:
+        record_code = record.record_code
+        if record_code == parser.TRANSACTION:
+            transaction_key += 1
+            last_transaction_key = transaction_key
+            transactions.append((transaction_key, account_key) + flat.transaction_values(record))
+            if len(transactions) >= chunk_size:
+                yield "transactions", transactions
+                transactions = []
+            continue
+
+        if record_code == parser.CONTINUATION:
+            continuation_key += 1
+            continuations.append((continuation_key, account_key, last_transaction_key, record.record))
+            if len(continuations) >= chunk_size:
+                yield "continuations", continuations
+                continuations = []
+            continue
+
+        # a header or trailer closes the account that has no trailer, and a group or file record its group
+        if account_values is not None and record_code != parser.ACCOUNT_TRAILER:
+            accounts.append(account_values + flat.record_values(None, flat.ACCOUNT_TRAILER_FIELDS))
+            account_values = None
+        if group_values is not None and record_code in (parser.GROUP_HEADER, parser.FILE_TRAILER):
+            groups.append(group_values + flat.record_values(None, flat.GROUP_TRAILER_FIELDS))
+            group_values = None
+
+        if record_code == parser.ACCOUNT_IDENTIFIER:
+            account_key += 1
+            last_transaction_key = None
+            account_values = (account_key, group_key) + flat.record_values(record, flat.ACCOUNT_IDENTIFIER_FIELDS)
+        elif record_code == parser.ACCOUNT_TRAILER and account_values is not None:
+            accounts.append(account_values + flat.record_values(record, flat.ACCOUNT_TRAILER_FIELDS))
+            account_values = None
+        elif record_code == parser.GROUP_HEADER:
+            group_key += 1
+            group_values = (group_key, 1) + flat.record_values(record, flat.GROUP_HEADER_FIELDS)
+        elif record_code == parser.GROUP_TRAILER and group_values is not None:
+            groups.append(group_values + flat.record_values(record, flat.GROUP_TRAILER_FIELDS))
+            group_values = None
+        elif record_code == parser.FILE_HEADER:
+            file_header = record
+        elif record_code == parser.FILE_TRAILER:
+            file_trailer = record
+
+        if len(accounts) >= chunk_size:
+            yield "accounts", accounts
+            accounts = []
+        if len(groups) >= chunk_size:
+            yield "groups", groups
+            groups = []
+
+    if account_values is not None:
+        accounts.append(account_values + flat.record_values(None, flat.ACCOUNT_TRAILER_FIELDS))
+    if group_values is not None:
+        groups.append(group_values + flat.record_values(None, flat.GROUP_TRAILER_FIELDS))
+
+    yield from _last_chunks([_file_row(file_header, file_trailer)], groups, accounts, transactions, continuations)
+
+
+def _file_row(header: models.FileHeader | None, trailer: models.FileTrailer | None) -> flat.Row:
+    """The row of the files table"""
+    return (
+        (1,)
+        + flat.record_values(header, flat.FILE_HEADER_FIELDS)
+        + flat.record_values(trailer, flat.FILE_TRAILER_FIELDS)
+    )
+
+
+def _last_chunks(*chunks: List[flat.Row]) -> Iterator[TableChunk]:
+    """The rows left of every table, in the order of `TABLE_COLUMNS`"""
+    for table, rows in zip(TABLE_COLUMNS, chunks):
+        if rows:
+            yield table, rows
@@ -0,0 +1,166 @@
+"""Compact lookup table of the BAI2 type codes, and bulk enrichment of type code columns.
+
+A single type code is looked up in a dictionary of interned details, which only needs the type code file, so the
+first lookup doesn't import numpy or pandas.
+For the bulk enrichment, type codes are three digit numbers, so the table is also a set of arrays indexed by the code
+itself, '000' to '999', built on the first enrichment. The transaction type, level and description of every code are
+stored as small integer codes into their interned values, which makes the enrichment of a column one `numpy.take` per
+attribute: the column is factorized, the few distinct codes are looked up, and the results are broadcast back to the
+rows as pandas Categoricals, without creating a Python object per row.
+"""
+
+__all__ = ["NUM_TYPE_CODES", "TypeCodeTable", "enrich", "enrich_dataframe", "get_table"]
+
+from functools import cache, cached_property
+from typing import TYPE_CHECKING, Dict, Mapping, Sequence, Tuple
+
+from bai2_reader.src import enums
+from bai2_reader.src.logger import log
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+NUM_TYPE_CODES = 1000
+
+
+class TypeCodeTable:
+    """Type code details by three digit code, and their attributes in arrays indexed by the code for the enrichment"""
+
+    def __init__(self, type_codes: Mapping[str, Mapping]):
+        """Initializer
+        :param type_codes: The details of every type code, as returned by `enums.load_type_codes`
+        """
+        self.transaction_types = list(enums.TransactionType)
+        self.levels = list(enums.TypeCodeLevel)
+        self.descriptions = sorted({details["description"] for details in type_codes.values()})
+
+        # the descriptions are interned, every code with the same description shares the same string
+        description_index = {value: value for value in self.descriptions}
+        self._details: Dict[int, enums.TypeCodes.TypeCode] = {
+            int(type_code): enums.TypeCodes.TypeCode(
+                transaction_type=details["transaction_type"],
+                type_level_code=details["type_level_code"],
+                description=description_index[details["description"]],
+            )
+            for type_code, details in type_codes.items()
+        }
+
+    def __len__(self) -> int:
+        """Number of known type codes"""
+        return len(self._details)
+
+    @cached_property
+    def _arrays(self) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+        """The known codes and the transaction type, level and description codes of every type code, as arrays
+        indexed by the type code, built on the first enrichment
+        """
+        import numpy as np
+
+        # -1 marks a missing attribute, `known` tells the codes of the table from the unknown ones
+        known = np.zeros(NUM_TYPE_CODES, dtype=np.bool_)
+        transaction_type_codes = np.full(NUM_TYPE_CODES, -1, dtype=np.int8)
+        level_codes = np.full(NUM_TYPE_CODES, -1, dtype=np.int8)
+        description_codes = np.full(NUM_TYPE_CODES, -1, dtype=np.int16)
+
+        transaction_type_index = {value: code for code, value in enumerate(self.transaction_types)}
+        level_index = {value: code for code, value in enumerate(self.levels)}
+        description_index = {value: code for code, value in enumerate(self.descriptions)}
+
+        for position, details in self._details.items():
+            known[position] = True
+            transaction_type_codes[position] = transaction_type_index.get(details.transaction_type, -1)
+            level_codes[position] = level_index.get(details.type_level_code, -1)
+            description_codes[position] = description_index[details.description]
+
+        return known, transaction_type_codes, level_codes, description_codes
+
+    def get(self, type_code: str | None) -> enums.TypeCodes.TypeCode | None:
+        """Details of a type code, the same instance is returned for every lookup of a code
+        :param type_code: The three digit type code
+        :return: The details, or None if the type code is unknown
+        """
+        position = _position(type_code)
+        return self._details.get(position) if position >= 0 else None
+
+    def enrich(self, type_codes: "Sequence[str | None] | pd.Series") -> Tuple["pd.DataFrame", Dict[str, int]]:
+        """Transaction type, level and description of every value of a type code column
+        :param type_codes: The type code column
+        :return: The `transaction_type`, `type_level_code` and `type_code_description` columns as Categoricals,
+        with nulls for the unknown codes, and the number of rows of every unknown code
+        """
+        import numpy as np
+        import pandas as pd
+
+        known, transaction_type_codes, level_codes, description_codes = self._arrays
+        codes, uniques = _factorize(type_codes)
+        # the last entry is the position of the nulls, code -1, and points to the extra slot of the attributes
+        unique_positions = np.array([_position(type_code) for type_code in uniques] + [-1], dtype=np.int64)
+
+        # the attributes are looked up once per distinct code, one extra slot at the end holds those of the rows
+        # that are not in the table, then a single take per attribute broadcasts them to the rows
+        columns = {}
+        for name, attribute_codes, categories in (
+            ("transaction_type", transaction_type_codes, [value.value for value in self.transaction_types]),
+            ("type_level_code", level_codes, [value.value for value in self.levels]),
+            ("type_code_description", description_codes, self.descriptions),
+        ):
+            unique_codes = np.append(attribute_codes, -1)[unique_positions]
+            columns[name] = pd.Categorical.from_codes(unique_codes[codes], categories=categories, validate=False)
+
+        enriched = pd.DataFrame(columns, index=type_codes.index if isinstance(type_codes, pd.Series) else None)
+
+        unique_known = np.append(known, False)[unique_positions[:-1]]
+        counts = np.bincount(codes + 1, minlength=len(uniques) + 1)[1:]
+        unknown = {str(uniques[position]): int(counts[position]) for position in np.flatnonzero(~unique_known)}
+        return enriched, unknown
+
+
+def _factorize(type_codes: "Sequence[str | None] | pd.Series") -> Tuple["np.ndarray", Sequence]:
+    """Codes and distinct values of a column, categorical columns are already factorized"""
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(type_codes, pd.Series) and isinstance(type_codes.dtype, pd.CategoricalDtype):
+        return type_codes.cat.codes.to_numpy(dtype=np.int64), type_codes.cat.categories
+    if not isinstance(type_codes, pd.Series):
+        type_codes = pd.Series(type_codes, dtype=object)
+    return pd.factorize(type_codes, use_na_sentinel=True)
+
+
+def _position(type_code: str | None) -> int:
+    """Index of a type code in the table, -1 for anything that is not a three digit code"""
+    if isinstance(type_code, str) and len(type_code) == 3 and type_code.isdigit():
+        return int(type_code)
+    return -1
+
+
+@cache
+def get_table() -> TypeCodeTable:
+    """The type code table, built once per process on first use"""
+    return TypeCodeTable(enums.load_type_codes())
+
+
+def enrich(type_codes: "Sequence[str | None] | pd.Series") -> Tuple["pd.DataFrame", Dict[str, int]]:
+    """Transaction type, level and description of every value of a type code column, see `TypeCodeTable.enrich`
+    :param type_codes: The type code column
+    :return: The enriched columns, and the number of rows of every unknown code
+    """
+    enriched, unknown = get_table().enrich(type_codes)
+    if unknown:
+        log.warning(f"{sum(unknown.values())} rows with {len(unknown)} unknown type codes: {unknown}")
+    return enriched, unknown
+
+
+def enrich_dataframe(
+    df: "pd.DataFrame", column: str = "type_code", prefix: str = ""
+) -> Tuple["pd.DataFrame", Dict[str, int]]:
+    """Adds the transaction type, level and description of a type code column to a DataFrame
+    :param df: The DataFrame, e.g. from `ColumnarData.to_dataframe` or `BAI2Reader.to_flat_dataframe`
+    :param column: The type code column, defaults to "type_code"
+    :param prefix: Prefix of the added columns, e.g. "transaction_" for the flat DataFrame
+    :return: A copy of the DataFrame with the `{prefix}transaction_type`, `{prefix}type_level_code` and
+    `{prefix}type_code_description` columns set, and the number of rows of every unknown code
+    """
+    enriched, unknown = enrich(df[column])
+    return df.assign(**{f"{prefix}{name}": values for name, values in enriched.items()}), unknown
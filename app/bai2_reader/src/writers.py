@@ -0,0 +1,516 @@
+"""Streaming writers of the flat rows of `flat` and the normalized tables of `tables`, one chunk of rows at a time.
+
+The writers never hold more than the chunk they are given, so the memory of an export is constant when the rows are
+made while the file is parsed (`flat.record_rows`). Every writer is a sink that takes the columns (their names, or
+the schema of the Parquet file), is written one chunk at a time and counts the rows, so the normalized tables are
+written side by side, one sink per table (`write_tables`). The `write_*` functions write all the chunks of an
+iterable to a single sink. The text formats, CSV and JSON Lines, are written to a file or to an open text stream such
+as stdout.
+
+The Parquet writer has an explicit schema instead of the one pandas infers from object columns: the amounts are
+float64 or int64 by the amount mode, the counts int64, and the texts that repeat on every row of an account (its
+file, group and account columns, and the codes of the transactions) are dictionary encoded. Its chunks are buffered
+until they fill a row group, so a row group is the most it holds.
+
+The Excel writer uses the constant memory mode of xlsxwriter, where every row is flushed to disk once the next one is
+written. It takes keyed rows (`flat.record_rows(keyed=True)`), to start a new sheet for every group or account when
+asked to, and a sheet that is full rolls over to a new one with the same name and a number.
+"""
+
+__all__ = [
+    "CsvSink",
+    "ExcelSheet",
+    "ExcelWorkbook",
+    "JsonLinesSink",
+    "ParquetSink",
+    "Sink",
+    "CSV_BUFFER_SIZE",
+    "DICTIONARY_COLUMNS",
+    "EXCEL_MAX_ROWS",
+    "PARQUET_COMPRESSION",
+    "ROW_GROUP_SIZE",
+    "TRANSACTION_TEXT_COLUMNS",
+    "parquet_schema",
+    "write_csv",
+    "write_excel",
+    "write_jsonl",
+    "write_parquet",
+    "write_tables",
+]
+
+import csv
+import json
+import re
+
+from abc import ABC, abstractmethod
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, TextIO
+
+from bai2_reader.src import enums, exceptions as exc, flat, tables
+
+# the csv module writes a row at a time, a big buffer turns them into few large writes
+CSV_BUFFER_SIZE = 1 << 20
+
+_encode_json = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+ROW_GROUP_SIZE = 65_536
+PARQUET_COMPRESSION = "zstd"
+
+# the texts of every transaction, the other text columns repeat on every row of an account or are codes
+TRANSACTION_TEXT_COLUMNS = (
+    "transaction_summary",
+    "transaction_bank_reference_number",
+    "transaction_customer_reference_number",
+    "transaction_description",
+    "transaction_rest_of_record",
+)
+DICTIONARY_COLUMNS = tuple(
+    column for column, kind in flat.COLUMN_KINDS.items() if kind == "text" and column not in TRANSACTION_TEXT_COLUMNS
+)
+
+# the rows of an Excel sheet, the header row included
+EXCEL_MAX_ROWS = 1_048_576
+EXCEL_SHEET_NAME_LENGTH = 31
+EXCEL_SHEET_NAME_INVALID = re.compile(r"[\[\]:*?/\\]")
+
+
+def _pyarrow():
+    """The pyarrow module, the Parquet writer needs `pyarrow` to be installed"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet  # noqa: F401
+    except ModuleNotFoundError:
+        raise exc.Bai2ReaderException("pyarrow is required to export to parquet, install it with `pip install pyarrow`")
+    return pa
+
+
+def parquet_schema(
+    amount_mode: enums.AmountMode = enums.AmountMode.float,
+    columns: Sequence[str] = flat.FLAT_COLUMNS,
+    kinds: Dict[str, str] = flat.COLUMN_KINDS,
+    dictionary_columns: Sequence[str] = DICTIONARY_COLUMNS,
+):
+    """The Arrow schema of the flat rows, or of a normalized table, needs `pyarrow` to be installed
+    :param amount_mode: How the amounts were parsed, floats or integer minor units, defaults to floats
+    :param columns: The column names, defaults to `flat.FLAT_COLUMNS`
+    :param kinds: The kinds of the values of the columns, defaults to `flat.COLUMN_KINDS`
+    :param dictionary_columns: The text columns that are dictionary encoded, defaults to `DICTIONARY_COLUMNS`
+    :return: The pyarrow Schema
+    """
+    pa = _pyarrow()
+    types = {
+        "amount": pa.int64() if enums.AmountMode(amount_mode) == enums.AmountMode.minor_units else pa.float64(),
+        "count": pa.int64(),
+        "text": pa.string(),
+    }
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema(
+        [(column, dictionary if column in dictionary_columns else types[kinds[column]]) for column in columns]
+    )
+
+
+class Sink(ABC):
+    """A streaming writer, that is written one chunk of rows at a time and closed once all chunks are written"""
+
+    rows = 0
+
+    @abstractmethod
+    def write(self, chunk: List[flat.Row]) -> None:
+        """Writes a chunk of rows"""
+
+    def close(self) -> None:
+        """Writes what is left and closes the output"""
+
+    def write_all(self, chunks: Iterable[List[flat.Row]]) -> int:
+        """Writes all chunks and closes the sink, even if a chunk fails
+        :return: The number of rows written
+        """
+        with self:
+            for chunk in chunks:
+                self.write(chunk)
+        return self.rows
+
+    def __enter__(self) -> "Sink":
+        """The sink itself, it is closed when the block is left"""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Closes the sink, also when the block raised"""
+        self.close()
+
+
+class _TextSink(Sink):
+    """A sink of a text file, or of an open text stream that is left open"""
+
+    def __init__(self, output: str | Path | TextIO, encoding: str):
+        self._owned = not hasattr(output, "write")
+        self.file = (
+            open(output, "w", newline="", encoding=encoding, buffering=CSV_BUFFER_SIZE) if self._owned else output
+        )
+
+    def close(self) -> None:
+        """Closes the file, a stream that was passed in is left open"""
+        if self._owned:
+            self.file.close()
+
+
+class CsvSink(_TextSink):
+    """Writes the rows to a CSV file, with a header row of the column names.
+    The values are written as they are parsed: None as an empty field, floats as `repr` does, the same as
+    `DataFrame.to_csv`, and integers without a decimal part.
+    """
+
+    def __init__(
+        self, output: str | Path | TextIO, columns: Sequence[str] = flat.FLAT_COLUMNS, encoding: str = "utf-8"
+    ):
+        """Initializer
+        :param output: The path of the CSV file, or an open text stream, e.g. `sys.stdout`
+        :param columns: The column names, defaults to `flat.FLAT_COLUMNS`
+        :param encoding: The encoding of the CSV file, defaults to "utf-8". Not used for a stream.
+        """
+        super().__init__(output, encoding)
+        self.writer = csv.writer(self.file, lineterminator="\n")
+        self.writer.writerow(columns)
+
+    def write(self, chunk: List[flat.Row]) -> None:
+        """Writes a chunk of rows as CSV lines"""
+        self.writer.writerows(chunk)
+        self.rows += len(chunk)
+
+
+class JsonLinesSink(_TextSink):
+    """Writes the rows to a JSON Lines file, one compact JSON object per row on its own line.
+    The values are written as they are parsed: None as null, and the amounts and counts as numbers.
+    """
+
+    def __init__(
+        self, output: str | Path | TextIO, columns: Sequence[str] = flat.FLAT_COLUMNS, encoding: str = "utf-8"
+    ):
+        """Initializer
+        :param output: The path of the JSON Lines file, or an open text stream, e.g. `sys.stdout`
+        :param columns: The keys of the objects, defaults to `flat.FLAT_COLUMNS`
+        :param encoding: The encoding of the JSON Lines file, defaults to "utf-8". Not used for a stream.
+        """
+        super().__init__(output, encoding)
+        self.columns = columns
+
+    def write(self, chunk: List[flat.Row]) -> None:
+        """Writes a chunk of rows as JSON lines"""
+        # a whole chunk is one write, a stream such as a pipe gets few large writes
+        self.file.write("".join([_encode_json(dict(zip(self.columns, row))) + "\n" for row in chunk]))
+        self.rows += len(chunk)
+
+
+class ParquetSink(Sink):
+    """Writes the rows to a Parquet file, a row group at a time, needs `pyarrow` to be installed"""
+
+    def __init__(
+        self,
+        output_path: str | Path,
+        schema=None,
+        row_group_size: int = ROW_GROUP_SIZE,
+        compression: str = PARQUET_COMPRESSION,
+        delta_columns: Sequence[str] = (),
+    ):
+        """Initializer
+        :param output_path: The path of the Parquet file
+        :param schema: The Arrow schema of the rows, defaults to `parquet_schema()` of all the flat columns
+        :param row_group_size: Number of rows per row group, defaults to `ROW_GROUP_SIZE`
+        :param compression: The compression codec, one of "zstd", "snappy", "gzip", "brotli", "lz4" or "none",
+        defaults to "zstd"
+        :param delta_columns: The integer columns that are delta encoded instead of dictionary encoded, for the
+        increasing keys of the normalized tables, which are then almost free
+        """
+        self.pa = _pyarrow()
+        self.schema = parquet_schema() if schema is None else schema
+        if row_group_size < 1:
+            raise exc.Bai2ReaderException(f"The row group size has to be positive: {row_group_size}")
+        try:
+            available = compression.lower() == "none" or self.pa.Codec.is_available(compression)
+        except ValueError:
+            available = False
+        if not available:
+            raise exc.Bai2ReaderException(f"Unsupported parquet compression: {compression}")
+
+        self.row_group_size = row_group_size
+        encoding_args = {}
+        if delta_columns:
+            encoding_args = {
+                "use_dictionary": [name for name in self.schema.names if name not in delta_columns],
+                "column_encoding": dict.fromkeys(delta_columns, "DELTA_BINARY_PACKED"),
+            }
+        self.writer = self.pa.parquet.ParquetWriter(output_path, self.schema, compression=compression, **encoding_args)
+        self.pending: List = []
+        self.pending_rows = 0
+
+    def write(self, chunk: List[flat.Row]) -> None:
+        """Adds a chunk of rows to the pending rows, and writes the row groups that are full"""
+        if not chunk:
+            return
+        pa = self.pa
+        self.pending.append(
+            pa.record_batch(
+                [pa.array(values, type=column.type) for values, column in zip(zip(*chunk), self.schema)],
+                schema=self.schema,
+            )
+        )
+        self.pending_rows += len(chunk)
+        self.rows += len(chunk)
+
+        # only full row groups are written, the rows past the last one are kept for the next
+        while self.pending_rows >= self.row_group_size:
+            table = pa.Table.from_batches(self.pending, schema=self.schema)
+            self.writer.write_table(table.slice(0, self.row_group_size), row_group_size=self.row_group_size)
+            rest = table.slice(self.row_group_size)
+            self.pending, self.pending_rows = rest.to_batches(), rest.num_rows
+
+    def close(self) -> None:
+        """Writes the pending rows as the last row group and closes the Parquet file"""
+        try:
+            if self.pending_rows:
+                table = self.pa.Table.from_batches(self.pending, schema=self.schema)
+                self.writer.write_table(table, row_group_size=self.row_group_size)
+                self.pending, self.pending_rows = [], 0
+        finally:
+            self.writer.close()
+
+
+def _xlsxwriter():
+    """The xlsxwriter module, the Excel writer needs the `excel` extra to be installed"""
+    try:
+        import xlsxwriter
+    except ModuleNotFoundError:
+        raise exc.Bai2ReaderException(
+            "xlsxwriter is required to export to excel, install it with `pip install 'bai2-reader[excel]'`"
+        )
+    return xlsxwriter
+
+
+def _sheet_name(name: str, used: Dict[str, int]) -> str:
+    """A valid sheet name that is not used yet, a name that is taken gets a ' (n)' suffix"""
+    name = EXCEL_SHEET_NAME_INVALID.sub("_", name).strip("'")[:EXCEL_SHEET_NAME_LENGTH] or "sheet"
+    count = used.get(name.lower(), 0)
+    used[name.lower()] = count + 1
+    if count == 0:
+        return name
+    suffix = f" ({count + 1})"
+    return _sheet_name(name[: EXCEL_SHEET_NAME_LENGTH - len(suffix)] + suffix, used)
+
+
+class ExcelWorkbook:
+    """An Excel file in the constant memory mode of xlsxwriter, its texts are written as they are, never as formulas
+    or links, and its sheets get unique valid names
+    """
+
+    def __init__(self, output_path: str | Path):
+        """Initializer
+        :param output_path: The path of the Excel file
+        """
+        self.workbook = _xlsxwriter().Workbook(
+            str(output_path), {"constant_memory": True, "strings_to_formulas": False, "strings_to_urls": False}
+        )
+        self.header = self.workbook.add_format({"bold": True})
+        self.used: Dict[str, int] = {}
+
+    def add_sheet(self, name: str, columns: Sequence[str]):
+        """Adds a sheet with a header row of the column names, which stays in view when scrolling
+        :return: The xlsxwriter Worksheet
+        """
+        worksheet = self.workbook.add_worksheet(_sheet_name(name, self.used))
+        worksheet.write_row(0, 0, columns, self.header)
+        worksheet.freeze_panes(1, 0)
+        return worksheet
+
+    def close(self) -> None:
+        """Writes the Excel file"""
+        self.workbook.close()
+
+
+class ExcelSheet(Sink):
+    """Writes the rows to a sheet of an Excel workbook, a sheet that is full rolls over to a new one with the same
+    name and a number
+    """
+
+    def __init__(
+        self,
+        workbook: ExcelWorkbook,
+        name: str,
+        columns: Sequence[str] = flat.FLAT_COLUMNS,
+        max_rows: int = EXCEL_MAX_ROWS,
+        skip: int = 0,
+    ):
+        """Initializer
+        :param workbook: The workbook of the sheet, it is closed by its owner
+        :param name: The name of the sheet
+        :param columns: The column names, defaults to `flat.FLAT_COLUMNS`
+        :param max_rows: Number of rows of a sheet before it rolls over to the next one, defaults to the Excel limit
+        :param skip: Number of values at the start of every row that are not written, e.g. the keys of keyed rows
+        """
+        if max_rows < 2:
+            raise exc.Bai2ReaderException(f"A sheet needs room for the header and a row: {max_rows}")
+        self.workbook, self.name, self.columns, self.max_rows, self.skip = workbook, name, columns, max_rows, skip
+        self.worksheet = workbook.add_sheet(name, columns)
+        self.sheet_rows = 1
+
+    def write_row(self, row: flat.Row) -> None:
+        """Writes a single row"""
+        if self.sheet_rows >= self.max_rows:
+            self.worksheet = self.workbook.add_sheet(self.name, self.columns)
+            self.sheet_rows = 1
+        self.worksheet.write_row(self.sheet_rows, 0, row[self.skip :] if self.skip else row)
+        self.sheet_rows += 1
+        self.rows += 1
+
+    def write(self, chunk: List[flat.Row]) -> None:
+        """Writes a chunk of rows, see `write_row`"""
+        for row in chunk:
+            self.write_row(row)
+
+
+def write_csv(
+    output: str | Path | TextIO,
+    chunks: Iterable[List[flat.Row]],
+    columns: Sequence[str] = flat.FLAT_COLUMNS,
+    encoding: str = "utf-8",
+) -> int:
+    """Writes the rows to a CSV file, see `CsvSink`
+    :param output: The path of the CSV file, or an open text stream, e.g. `sys.stdout`
+    :param chunks: The chunks of rows, e.g. from `flat.record_rows`
+    :param columns: The column names, defaults to `flat.FLAT_COLUMNS`
+    :param encoding: The encoding of the CSV file, defaults to "utf-8". Not used for a stream.
+    :return: The number of rows written
+    """
+    return CsvSink(output, columns, encoding).write_all(chunks)
+
+
+def write_jsonl(
+    output: str | Path | TextIO,
+    chunks: Iterable[List[flat.Row]],
+    columns: Sequence[str] = flat.FLAT_COLUMNS,
+    encoding: str = "utf-8",
+) -> int:
+    """Writes the rows to a JSON Lines file, see `JsonLinesSink`
+    :param output: The path of the JSON Lines file, or an open text stream, e.g. `sys.stdout`
+    :param chunks: The chunks of rows, e.g. from `flat.record_rows`
+    :param columns: The keys of the objects, defaults to `flat.FLAT_COLUMNS`
+    :param encoding: The encoding of the JSON Lines file, defaults to "utf-8". Not used for a stream.
+    :return: The number of rows written
+    """
+    return JsonLinesSink(output, columns, encoding).write_all(chunks)
+
+
+def write_parquet(
+    output_path: str | Path,
+    chunks: Iterable[List[flat.Row]],
+    schema=None,
+    row_group_size: int = ROW_GROUP_SIZE,
+    compression: str = PARQUET_COMPRESSION,
+) -> int:
+    """Writes the rows to a Parquet file, see `ParquetSink`
+    :param output_path: The path of the Parquet file
+    :param chunks: The chunks of rows, e.g. from `flat.record_rows`
+    :param schema: The Arrow schema of the rows, defaults to `parquet_schema()` of all the flat columns
+    :param row_group_size: Number of rows per row group, defaults to `ROW_GROUP_SIZE`
+    :param compression: The compression codec, one of "zstd", "snappy", "gzip", "brotli", "lz4" or "none",
+    defaults to "zstd"
+    :return: The number of rows written
+    """
+    return ParquetSink(output_path, schema, row_group_size, compression).write_all(chunks)
+
+
+def write_excel(
+    output_path: str | Path,
+    chunks: Iterable[List[flat.Row]],
+    columns: Sequence[str] = flat.FLAT_COLUMNS,
+    split_by: enums.Section | str | None = None,
+    max_rows: int = EXCEL_MAX_ROWS,
+) -> int:
+    """Writes the keyed rows to an Excel file, with a header row of the column names on every sheet, see `ExcelSheet`
+    :param output_path: The path of the Excel file
+    :param chunks: The chunks of keyed rows, e.g. from `flat.record_rows(keyed=True)`
+    :param columns: The column names, defaults to `flat.FLAT_COLUMNS`
+    :param split_by: Start a new sheet for every group ("group 1", ...) or every account (its account number),
+    by default all rows are written to the "transactions" sheet
+    :param max_rows: Number of rows of a sheet before it rolls over to the next one, defaults to the Excel limit
+    :return: The number of rows written
+    """
+    split_by = None if split_by is None else enums.Section(split_by)
+    if split_by is enums.Section.file:
+        split_by = None
+    account_number = len(flat.KEY_COLUMNS) + list(columns).index("account_identifier_account_number")
+    skip = len(flat.KEY_COLUMNS)
+
+    rows = 0
+    workbook = ExcelWorkbook(output_path)
+    try:
+        sheet = None if split_by is not None else ExcelSheet(workbook, "transactions", columns, max_rows, skip)
+        key = None
+        for chunk in chunks:
+            for row in chunk:
+                # a new section starts, its rows go on a new sheet
+                if split_by is not None and row[0 if split_by is enums.Section.group else 1] != key:
+                    key = row[0 if split_by is enums.Section.group else 1]
+                    name = f"group {row[0] + 1}" if split_by is enums.Section.group else str(row[account_number])
+                    sheet = ExcelSheet(workbook, name, columns, max_rows, skip)
+                sheet.write_row(row)
+            rows += len(chunk)
+
+        if sheet is None:
+            ExcelSheet(workbook, "transactions", columns, max_rows, skip)
+    finally:
+        workbook.close()
+    return rows
+
+
+def write_tables(
+    output: str | Path,
+    chunks: Iterable[tables.TableChunk],
+    output_format: enums.OutputFormat,
+    amount_mode: enums.AmountMode = enums.AmountMode.float,
+    encoding: str = "utf-8",
+    row_group_size: int = ROW_GROUP_SIZE,
+    compression: str = PARQUET_COMPRESSION,
+    max_rows: int = EXCEL_MAX_ROWS,
+) -> Dict[str, int]:
+    """Writes the normalized tables side by side, one sink per table, see `tables`.
+    Every table is a file named after it in the output directory, e.g. 'transactions.csv', or a sheet of the output
+    file for Excel.
+    :param output: The output directory, or the path of the Excel file
+    :param chunks: The chunks of the tables, e.g. from `tables.record_tables`
+    :param output_format: The format of the tables, CSV, JSON Lines, Parquet or Excel
+    :param amount_mode: How the amounts were parsed, for the Parquet schema, defaults to floats
+    :param encoding: The encoding of the CSV and JSON Lines files, defaults to "utf-8".
+    :param row_group_size: Number of rows per row group of the Parquet files, defaults to `ROW_GROUP_SIZE`
+    :param compression: The compression codec of the Parquet files, defaults to "zstd"
+    :param max_rows: Number of rows of an Excel sheet before it rolls over to the next one, defaults to the Excel limit
+    :return: The number of rows written per table
+    """
+    with ExitStack() as stack:
+        if output_format == enums.OutputFormat.EXCEL:
+            workbook = ExcelWorkbook(output)
+            stack.callback(workbook.close)
+            sinks = {
+                table: ExcelSheet(workbook, table, columns, max_rows) for table, columns in tables.TABLE_COLUMNS.items()
+            }
+        else:
+            Path(output).mkdir(parents=True, exist_ok=True)
+            paths = {table: Path(output, f"{table}.{output_format.extension}") for table in tables.TABLE_COLUMNS}
+            sinks = {}
+            for table, columns in tables.TABLE_COLUMNS.items():
+                if output_format == enums.OutputFormat.CSV:
+                    sink = CsvSink(paths[table], columns, encoding)
+                elif output_format == enums.OutputFormat.JSONL:
+                    sink = JsonLinesSink(paths[table], columns, encoding)
+                elif output_format == enums.OutputFormat.PARQUET:
+                    schema = parquet_schema(amount_mode, columns, tables.COLUMN_KINDS, tables.DICTIONARY_COLUMNS)
+                    keys = [column for column in columns if column in tables.KEY_COLUMNS]
+                    sink = ParquetSink(paths[table], schema, row_group_size, compression, delta_columns=keys)
+                else:
+                    raise exc.Bai2ReaderException(f"Unsupported streaming format: {output_format}")
+                sinks[table] = stack.enter_context(sink)
+
+        for table, chunk in chunks:
+            sinks[table].write(chunk)
+
+    return {table: sink.rows for table, sink in sinks.items()}
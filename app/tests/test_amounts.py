@@ -0,0 +1,80 @@
+"""Testcases to validate the minor-unit amount mode and the currency exponent table"""
+
+import numpy as np
+import pytest
+from decimal import Decimal
+from pathlib import Path
+
+from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src import amounts, enums
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_1 = Path(SAMPLE_DIR, "sample_1.bai")
+
+
+class TestMinorUnits:
+    """Test cases for the minor-unit amount mode"""
+
+    @pytest.mark.parametrize("trusted", [False, True])
+    def test_read_file_minor_units(self, trusted):
+        """Test that the amounts and control totals are kept as the integers of the file"""
+        float_data = BAI2Reader(run_validation=False).read_file(SAMPLE_1).bai_data
+        reader = BAI2Reader(run_validation=False, trusted=trusted, amount_mode=enums.AmountMode.minor_units)
+        int_data = reader.read_file(SAMPLE_1).bai_data
+
+        transactions = [
+            (section.transaction.amount, float_section.transaction.amount)
+            for group, float_group in zip(int_data.groups, float_data.groups)
+            for account, float_account in zip(group.accounts, float_group.accounts)
+            for section, float_section in zip(account.transactions, float_account.transactions)
+        ]
+        assert transactions
+        assert all(isinstance(amount, int) and amount == float_amount for amount, float_amount in transactions)
+        assert isinstance(int_data.groups[0].group_trailer.group_control_total, int)
+        assert isinstance(int_data.groups[0].accounts[0].account_trailer.account_control_total, int)
+        assert isinstance(int_data.file_trailer.file_control_total, int)
+
+    def test_flat_dataframe_minor_units(self):
+        """Test that the exported amounts are int64 columns"""
+        reader = BAI2Reader(run_validation=False, amount_mode="minor_units")
+        df = reader.read_file(SAMPLE_1).to_flat_dataframe()
+
+        assert df["transaction_amount"].dtype == np.int64
+        assert df["account_trailer_account_control_total"].dtype == np.int64
+
+
+class TestCurrencyExponents:
+    """Test cases for the vectorized scaling by currency"""
+
+    def test_currency_exponents(self):
+        """Test the exponent lookup, with the default for unknown and missing currencies"""
+        exponents = amounts.currency_exponents(["USD", "JPY", "KWD", None, "usd", "XXX"])
+
+        assert exponents.tolist() == [2, 0, 3, 2, 2, 2]
+        assert amounts.currency_exponents(["XXX"], exponents={"XXX": 0}).tolist() == [0]
+
+    def test_to_major_units(self):
+        """Test the scaling of a column to float major units"""
+        scaled = amounts.to_major_units([123456, 500, None, 1234], ["USD", "JPY", "USD", "BHD"])
+
+        assert scaled[0] == 1234.56
+        assert scaled[1] == 500
+        assert np.isnan(scaled[2])
+        assert scaled[3] == 1.234
+
+    def test_to_decimals(self):
+        """Test the exact conversion to Decimals"""
+        decimals = amounts.to_decimals([123456, None, -5], ["USD", "USD", "KWD"])
+
+        assert decimals == [Decimal("1234.56"), None, Decimal("-0.005")]
+
+    def test_columnar_major_units(self):
+        """Test the amounts of the columnar engine in major units"""
+        columns = BAI2Reader(run_validation=False).read_columns(SAMPLE_1)
+        df = columns.to_dataframe()
+        scaled = columns.to_dataframe(major_units=True)
+
+        assert scaled["amount"].dtype == np.float64
+        assert np.allclose(scaled["amount"], df["amount"].astype(float) / 100)
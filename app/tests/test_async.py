@@ -0,0 +1,140 @@
+"""Testcases to validate the async API of the BAI2 reader"""
+
+import asyncio
+import tempfile
+import zipfile
+import pytest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src import exceptions as exc
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_1 = Path(SAMPLE_DIR, "sample_1.bai")
+SAMPLE_2 = Path(SAMPLE_DIR, "sample_2.bai")
+SAMPLE_3 = Path(SAMPLE_DIR, "sample_3.bai")
+SAMPLE_4 = Path(SAMPLE_DIR, "sample_4.bai")
+
+
+class TestAsyncReader:
+    """Test cases for the async methods of the reader"""
+
+    def test_aread_file(self):
+        """Test that the async read builds the same model as the sync read"""
+        expected = BAI2Reader(run_validation=False).read_file(SAMPLE_1).bai_data
+
+        reader = asyncio.run(BAI2Reader(run_validation=False).aread_file(SAMPLE_1))
+
+        assert reader.bai_data == expected
+        assert reader.source_filename == SAMPLE_1
+
+    def test_aread_file_process_pool(self):
+        """Test that the parsing can be moved to a process pool"""
+        expected = BAI2Reader(run_validation=False).read_file(SAMPLE_1).bai_data
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            reader = asyncio.run(BAI2Reader(run_validation=False, executor=executor).aread_file(SAMPLE_1))
+
+        assert reader.bai_data == expected
+
+    def test_aread_file_zip_member_and_workers(self):
+        """Test that the async read takes a zip member and parses in worker processes like the sync read"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            archive = Path(tmpdir, "daily.zip")
+            with zipfile.ZipFile(archive, "w") as zip_file:
+                zip_file.write(SAMPLE_1, SAMPLE_1.name)
+                zip_file.write(SAMPLE_2, SAMPLE_2.name)
+
+            reader = asyncio.run(BAI2Reader(run_validation=False).aread_file(archive, member=SAMPLE_2.name))
+            assert reader.bai_data == BAI2Reader(run_validation=False).read_file(SAMPLE_2).bai_data
+
+        reader = asyncio.run(BAI2Reader(run_validation=False).aread_file(SAMPLE_4, workers=2))
+        assert reader.bai_data == BAI2Reader(run_validation=False).read_file(SAMPLE_4).bai_data
+
+    @pytest.mark.parametrize("executor", [None, ProcessPoolExecutor])
+    def test_aread_file_collect_errors(self, executor):
+        """Test that the async read collects the errors into the error report, also on a process pool"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir, "input.bai")
+            path.write_text(SAMPLE_3.read_text().replace("49,6835,34/", "49,6835,35/"))
+            expected = BAI2Reader(on_error="collect").read_file(path)
+
+            if executor is None:
+                reader = asyncio.run(BAI2Reader().aread_file(path, on_error="collect"))
+            else:
+                with executor(max_workers=1) as pool:
+                    reader = asyncio.run(BAI2Reader(executor=pool, on_error="collect").aread_file(path))
+
+        assert reader.error_report is not None
+        assert reader.error_report == expected.error_report
+        assert len(reader.error_report.errors) == 1
+        assert reader.bai_data == expected.bai_data
+
+    def test_concurrency_limit(self):
+        """Test that many files can be read at once with a semaphore shared by the readers"""
+
+        async def read_all():
+            limit = asyncio.Semaphore(2)
+            readers = [BAI2Reader(run_validation=False, concurrency_limit=limit) for _ in range(6)]
+            return await asyncio.gather(*[reader.aread_file(SAMPLE_2) for reader in readers])
+
+        readers = asyncio.run(read_all())
+
+        assert len(readers) == 6
+        assert all(reader.bai_data == readers[0].bai_data for reader in readers)
+
+    def test_awrite_data(self):
+        """Test that the async write writes the same file as the sync write"""
+
+        async def read_and_write(output_dir):
+            reader = BAI2Reader(run_validation=False, executor=ThreadPoolExecutor(max_workers=2), concurrency_limit=1)
+            await reader.aread_file(SAMPLE_1)
+            await reader.awrite_data(output_dir=output_dir, output_file_name="async.csv")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            asyncio.run(read_and_write(tmpdir))
+            BAI2Reader(run_validation=False).read_file(SAMPLE_1).write_data(tmpdir, output_file_name="sync.csv")
+
+            assert Path(tmpdir, "async.csv").read_text() == Path(tmpdir, "sync.csv").read_text()
+
+    def test_awrite_data_process_pool(self):
+        """Test that a process pool executor is rejected by the async write, and no file is written"""
+
+        async def write(reader, output_dir):
+            await reader.awrite_data(output_dir=output_dir, output_file_name="async.csv")
+
+        reader = BAI2Reader(run_validation=False).read_file(SAMPLE_1)
+        with tempfile.TemporaryDirectory() as tmpdir, ProcessPoolExecutor(max_workers=1) as executor:
+            reader.executor = executor
+            with pytest.raises(exc.Bai2ReaderException, match="process pool"):
+                asyncio.run(write(reader, tmpdir))
+
+            assert not Path(tmpdir, "async.csv").exists()
+
+    def test_aiter_transactions(self):
+        """Test that the async iterator yields the same transactions as the sync iterator, across chunks"""
+        reader = BAI2Reader(run_validation=False)
+        expected = list(reader.iter_transactions(SAMPLE_1))
+
+        async def collect():
+            return [transaction async for transaction in reader.aiter_transactions(SAMPLE_1, chunk_size=3)]
+
+        assert asyncio.run(collect()) == expected
+
+    def test_aiter_transactions_process_pool(self):
+        """Test that a process pool executor is rejected by the async iterator"""
+
+        async def collect(reader):
+            return [transaction async for transaction in reader.aiter_transactions(SAMPLE_1)]
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(exc.Bai2ReaderException):
+                asyncio.run(collect(BAI2Reader(executor=executor)))
+
+    def test_aread_file_not_found(self):
+        """Test that a missing file raises an error"""
+        with pytest.raises(exc.Bai2ReaderException):
+            asyncio.run(BAI2Reader().aread_file("/nonexistent/path/file.bai"))
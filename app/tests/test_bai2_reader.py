@@ -1,5 +1,6 @@
 """Testcases to validate BAI2 reader"""
 
+import gc
 import json
 import tempfile
 import pytest
@@ -7,13 +8,14 @@ import pandas as pd
 from pathlib import Path
 
 from bai2_reader.src.reader import BAI2Reader
-from bai2_reader.src import exceptions as exc
+from bai2_reader.src import enums, exceptions as exc, models, parser
 
 
 # Test data paths
 SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
 SAMPLE_1 = Path(SAMPLE_DIR, "sample_1.bai")
 SAMPLE_2 = Path(SAMPLE_DIR, "sample_2.bai")
+SAMPLE_3 = Path(SAMPLE_DIR, "sample_3.bai")
 
 
 class TestBAI2Reader:
@@ -253,11 +255,42 @@ class TestBAI2Reader:
         reader = BAI2Reader(run_validation=False)
         assert reader.run_validation is False
 
+    def test_account_trailer_count(self):
+        """Test that the record count of an account trailer includes the '03' and the '49' records"""
+        reader = BAI2Reader(run_validation=True).read_file(SAMPLE_3)
+
+        account = reader.bai_data.groups[0].accounts[0]
+        assert account.account_trailer.num_of_records == 2 + len(account.summary) + sum(
+            1 + len(section.summary) for section in account.transactions
+        )
+
+    def test_account_trailer_count_without_trailer(self):
+        """Test that a '49' record count that leaves out the '49' record itself fails the validation"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".bai", delete=False) as f:
+            f.write(SAMPLE_3.read_text().replace("49,6835,34/", "49,6835,33/"))
+            temp_path = f.name
+
+        try:
+            with pytest.raises(exc.Bai2ReaderException) as exc_info:
+                BAI2Reader(run_validation=True).read_file(temp_path)
+
+            assert "Account trailer record count mismatch" in str(exc_info)
+        finally:
+            Path(temp_path).unlink()
+
     def test_custom_encoding(self):
         """Test reading file with custom encoding"""
         reader = BAI2Reader(encoding="utf-8")
         assert reader.encoding == "utf-8"
 
+    def test_trusted_matches_validated(self):
+        """Test that the trusted mode builds the same model as the validated mode"""
+        validated = BAI2Reader(run_validation=False).read_file(SAMPLE_1)
+        trusted = BAI2Reader(run_validation=False, trusted=True).read_file(SAMPLE_1)
+
+        assert trusted.bai_data.model_dump() == validated.bai_data.model_dump()
+        assert trusted.to_json() == validated.to_json()
+
     def test_read_file_with_validation_disabled(self):
         """Test reading file with validation disabled"""
         reader = BAI2Reader(run_validation=False)
@@ -372,6 +405,62 @@ class TestBAI2Reader:
         assert len(reader.bai_data.groups) > 0
 
 
+class TestBAI2ReaderStreaming:
+    """Test cases for the streaming record and transaction iterators"""
+
+    def test_iter_records_matches_read_file(self):
+        """Test that iter_records yields every record that read_file parses"""
+        reader = BAI2Reader(run_validation=False)
+        records = list(reader.iter_records(SAMPLE_1))
+
+        assert records[0].record_code == "01"
+        assert records[-1].record_code == "99"
+        assert records[-1].record_counter == len(records)
+
+    def test_iter_transactions(self):
+        """Test that iter_transactions yields every transaction with its account and continuation records"""
+        reader = BAI2Reader(run_validation=False)
+        pairs = list(reader.iter_transactions(SAMPLE_1))
+
+        reader.read_file(SAMPLE_1)
+        expected = [
+            (account.account_identifier.account_number, txn)
+            for group in reader.bai_data.groups
+            for account in group.accounts
+            for txn in account.transactions
+        ]
+
+        assert len(pairs) == len(expected)
+        for (account, txn), (account_number, expected_txn) in zip(pairs, expected):
+            assert account.account_number == account_number
+            assert txn == expected_txn
+
+    def test_iter_records_validation(self):
+        """Test that iter_records validates the trailer record counts"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".bai", delete=False) as f:
+            f.write("01,GSBI,cont001,210706,1249,1,,,2/\n")
+            f.write("02,cont001,026015079,1,230906,2000,,/\n")
+            f.write("03,107049924,USD,,,,,060,13053325440,,,100,000,0,,400,000,0,/\n")
+            f.write("49,13053325440,5/\n")
+            temp_path = f.name
+
+        try:
+            reader = BAI2Reader(run_validation=True)
+            with pytest.raises(exc.Bai2ReaderException) as exc_info:
+                list(reader.iter_records(temp_path))
+
+            assert "Account trailer record count mismatch" in str(exc_info)
+        finally:
+            Path(temp_path).unlink()
+
+    def test_iter_records_file_not_found(self):
+        """Test that iter_records raises for non-existent files"""
+        reader = BAI2Reader(run_validation=False)
+
+        with pytest.raises(exc.Bai2ReaderException):
+            list(reader.iter_records("/nonexistent/path/file.bai"))
+
+
 class TestBAI2ReaderValidation:
     """Test cases for validation functionality"""
 
@@ -443,6 +532,94 @@ class TestBAI2ReaderContinuation:
         finally:
             Path(temp_path).unlink()
 
+    @pytest.mark.parametrize(
+        "records, record_code, header",
+        [
+            (["03,107049924,USD,,,,/\n", "49,0,2/\n"], "03", "02"),
+            (["02,cont001,026015079,1,230906,2000,,/\n", "16,447,60000,,SPB2322984714570,1111,ACH/\n"], "16", "03"),
+            (["98,0,1,1/\n"], "98", "02"),
+        ],
+        ids=["account_without_group", "transaction_without_account", "group_trailer_without_group"],
+    )
+    def test_record_without_section_header(self, records, record_code, header):
+        """Test that a record before the header of its section raises a reader error naming the record"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".bai", delete=False) as f:
+            f.write("01,GSBI,cont001,210706,1249,1,,,2/\n")
+            f.writelines(records)
+            f.write("99,0,1,6/\n")
+            temp_path = f.name
+
+        try:
+            reader = BAI2Reader(run_validation=False)
+            with pytest.raises(exc.Bai2ReaderException) as exc_info:
+                reader.read_file(temp_path)
+
+            assert str(exc_info.value).startswith(f"Error parsing record: {record_code},")
+            assert f"No '{header}' record before the '{record_code}' record" in str(exc_info.value)
+        finally:
+            Path(temp_path).unlink()
+
+
+class TestRecordHandlers:
+    """Test cases for the record handler table"""
+
+    def test_handler_for_every_record_code(self):
+        """Test that every record code has a handler"""
+        assert set(parser.RECORD_HANDLERS) == {record.value for record in enums.Record}
+
+    def test_parse_line(self):
+        """Test that a single line is parsed by the handler of its record code"""
+        state = parser.ParserState(run_validation=False)
+        record = parser.parse_line(state, "16,447,60000,,SPB2322984714570,1111,ACH Credit Payment/\n")
+
+        assert record.type_code == "447"
+        assert record.amount == 60000.0
+        assert state.total_records_counter == 1
+        assert parser.parse_line(state, "  \n") is None
+
+    def test_build_model_trusted(self):
+        """Test that trusted models are built without validation"""
+        fields = {"record_code": "88", "record_counter": "not a number", "record": "EREF: 1111"}
+
+        with pytest.raises(ValueError):
+            parser.build_model(False, models.Continuation, dict(fields))
+
+        record = parser.build_model(True, models.Continuation, dict(fields))
+        assert record.record_counter == "not a number"
+        assert record.model_dump() == {"record": "EREF: 1111"}
+
+    def test_gc_paused(self):
+        """Test that the garbage collector is enabled again after the model tree is built"""
+        with parser.gc_paused():
+            assert not gc.isenabled()
+        assert gc.isenabled()
+
+    @pytest.mark.parametrize("pause_gc", [False, True])
+    def test_read_file_pause_gc(self, pause_gc, monkeypatch):
+        """Test that a read only pauses the garbage collector of the process when asked to"""
+        build_bai2_model = parser.build_bai2_model
+        enabled = []
+
+        def build(records, trusted=False):
+            enabled.append(gc.isenabled())
+            return build_bai2_model(records, trusted=trusted)
+
+        monkeypatch.setattr(parser, "build_bai2_model", build)
+
+        BAI2Reader(run_validation=False, pause_gc=pause_gc).read_file(SAMPLE_1)
+
+        assert enabled == [not pause_gc]
+        assert gc.isenabled()
+
+    def test_unknown_record_code(self):
+        """Test that an unknown record code raises an error"""
+        state = parser.ParserState()
+
+        with pytest.raises(exc.UnknownValueException) as exc_info:
+            parser.parse_line(state, "42,something/\n")
+
+        assert "Unknown record code" in str(exc_info)
+
 
 class TestBAI2ReaderEdgeCases:
     """Test edge cases and error handling"""
@@ -0,0 +1,85 @@
+"""Testcases to validate the balances table of the account status and summary fields"""
+
+import pandas as pd
+import pytest
+from pathlib import Path
+
+from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src import balances
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_1 = Path(SAMPLE_DIR, "sample_1.bai")
+SAMPLE_2 = Path(SAMPLE_DIR, "sample_2.bai")
+
+
+class TestBalances:
+    """Test cases for the balances table"""
+
+    def test_balances_dataframe(self):
+        """Test that every status and summary type code of an account is a row, with numeric amounts"""
+        df = BAI2Reader(run_validation=False).read_file(SAMPLE_2).to_balances_dataframe()
+        first_account = df[df["account_index"] == 0]
+
+        assert first_account["type_code"].tolist() == ["010", "015", "040", "045", "100", "400"]
+        assert first_account["amount"].tolist() == [
+            66441091944,
+            66376440399,
+            66442037444,
+            66377385899,
+            312155,
+            64963700,
+        ]
+        assert first_account["item_count"].tolist()[-2:] == [9, 18]
+        assert str(df["amount"].dtype) == "Int64"
+        assert set(df["account_number"]) == {"10001193"}
+
+    def test_pivot(self):
+        """Test the wide table, one row per account with the type codes named after their description"""
+        df = BAI2Reader(run_validation=False).read_file(SAMPLE_2).to_balances_dataframe(pivot=True)
+
+        assert len(df) == 2
+        assert df.loc[0, "opening_ledger"] == 66441091944
+        assert df.loc[0, "closing_ledger"] == 66376440399
+        assert df.loc[0, "total_credits"] == 312155
+        assert df.loc[0, "total_debits"] == 64963700
+
+    def test_major_units(self):
+        """Test the amounts scaled by the exponent of the currency"""
+        df = BAI2Reader(run_validation=False).read_file(SAMPLE_2).to_balances_dataframe(major_units=True)
+
+        assert df.loc[0, "amount"] == pytest.approx(664410919.44)
+
+    @pytest.mark.parametrize("sample", [SAMPLE_1, SAMPLE_2])
+    def test_columnar_balances(self, sample):
+        """Test that the columnar engine gives the same balances as the Bai2Model"""
+        reader = BAI2Reader(run_validation=False)
+
+        pd.testing.assert_frame_equal(
+            reader.read_columns(sample).to_balances_dataframe(pivot=True),
+            reader.read_file(sample).to_balances_dataframe(pivot=True),
+        )
+
+    def test_availability_fields(self):
+        """Test that the availability fields after an 'S', 'V' or 'D' funds type are skipped"""
+        columns = balances.balance_columns(
+            [
+                ["010", "100", "", "S", "1", "2", "3", "015", "200", "4", "V", "260101", "0800", "/"],
+                ["040", "300", "", "D", "2", "0", "10", "1", "20", "045", "400", "", "Z", "", "", "", ""],
+                ["", "", "", ""],
+            ]
+        )
+
+        assert columns["account_index"] == [0, 0, 1, 1]
+        assert columns["type_code"] == ["010", "015", "040", "045"]
+        assert columns["amount"] == ["100", "200", "300", "400"]
+        assert columns["funds_type"] == ["S", "V", "D", "Z"]
+
+    def test_balance_names(self):
+        """Test the column names of known, unknown and duplicated type codes"""
+        assert balances.balance_names(["010", "100", "999"]) == {
+            "010": "opening_ledger",
+            "100": "total_credits",
+            "999": "type_code_999",
+        }
@@ -0,0 +1,87 @@
+"""Testcases to validate the batch export of BAI2 files"""
+
+import tempfile
+import pytest
+from pathlib import Path
+
+from bai2_reader.src import batch, enums, exceptions as exc
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_1 = Path(SAMPLE_DIR, "sample_1.bai")
+SAMPLE_2 = Path(SAMPLE_DIR, "sample_2.bai")
+SAMPLE_3 = Path(SAMPLE_DIR, "sample_3.bai")
+
+
+class TestBatchExport:
+    """Test cases for the batch export"""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_export_files(self, workers):
+        """Test that every file is exported, and a failed file does not stop the others"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_files = [str(SAMPLE_1), "/nonexistent/path/file.bai", str(SAMPLE_2)]
+            summary = batch.export_files(
+                input_files,
+                output_file_names=["one.csv", "missing.csv", "two.csv"],
+                workers=workers,
+                output_dir=tmpdir,
+                run_validation=False,
+            )
+
+            assert [result.input_file for result in summary.results] == input_files
+            assert summary.files == 3
+            assert len(summary.failures) == 1
+            assert "File not found" in summary.failures[0].error
+            assert summary.records == sum(result.records for result in summary.results) > 0
+            assert sorted(path.name for path in Path(tmpdir).iterdir()) == ["one.csv", "two.csv"]
+            assert "failures: 1" in str(summary)
+
+    def test_default_output_file_names(self):
+        """Test that the default output names follow the input order and don't collide"""
+        names = batch.output_file_names_for(["a/sample.bai", "b/sample.bai", "other.bai"], enums.OutputFormat.JSON)
+
+        timestamp = names[0].removeprefix("sample_").removesuffix(".json")
+        assert names == [f"sample_{timestamp}.json", f"sample_1_{timestamp}.json", f"other_{timestamp}.json"]
+
+    def test_output_file_names_count_mismatch(self):
+        """Test that the count of output names has to match the count of input files"""
+        with pytest.raises(exc.Bai2ReaderException):
+            batch.output_file_names_for(["a.bai", "b.bai"], enums.OutputFormat.CSV, ["a.csv"])
+
+    def test_cli_export(self):
+        """Test the summary and the exit code of the export command"""
+        typer_testing = pytest.importorskip("typer.testing")
+        from bai2_reader.src.cli import app
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = typer_testing.CliRunner().invoke(
+                app,
+                [
+                    "export",
+                    "--input-files",
+                    f"{SAMPLE_1},/nonexistent/path/file.bai",
+                    "--no-run-validation",
+                    "--output-dir",
+                    tmpdir,
+                    "--workers",
+                    "2",
+                ],
+            )
+
+            assert result.exit_code == 1
+            assert "Summary: files: 2" in result.output
+            assert "Failed: /nonexistent/path/file.bai" in result.output
+            assert len(list(Path(tmpdir).iterdir())) == 1
+
+    def test_cli_validate(self):
+        """Test the messages and the exit code of the validate command"""
+        typer_testing = pytest.importorskip("typer.testing")
+        from bai2_reader.src.cli import app
+
+        result = typer_testing.CliRunner().invoke(app, ["validate", "--input-files", f"{SAMPLE_3},{SAMPLE_2}"])
+
+        assert result.exit_code == 1
+        assert f"Valid: {SAMPLE_3}" in result.output
+        assert f"Invalid: {SAMPLE_2} | Bai2ReaderException" in result.output
@@ -0,0 +1,124 @@
+"""Testcases to validate the columnar parse engine"""
+
+import tempfile
+import pytest
+import pandas as pd
+from pathlib import Path
+
+from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src import columnar, exceptions as exc
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_1 = Path(SAMPLE_DIR, "sample_1.bai")
+
+
+class TestColumnar:
+    """Test cases for the columnar parse engine"""
+
+    def test_matches_flat_dataframe(self):
+        """Test that the columnar engine reads the same transactions as the Bai2Model"""
+        reader = BAI2Reader(run_validation=False)
+        df = reader.read_columns(SAMPLE_1).to_dataframe()
+        flat_df = reader.read_file(SAMPLE_1).to_flat_dataframe()
+
+        assert len(df) == len(flat_df)
+        assert df["amount"].dtype == "Int64"
+        assert list(df["amount"].astype(float)) == list(flat_df["transaction_amount"])
+        assert list(df["type_code"]) == list(flat_df["transaction_type_code"])
+        assert list(df["bank_reference_number"]) == list(flat_df["transaction_bank_reference_number"])
+        assert list(df["transaction_summary"].fillna("")) == list(flat_df["transaction_summary"])
+        assert list(df["account_number"]) == list(flat_df["account_identifier_account_number"])
+
+    def test_to_arrow(self):
+        """Test the conversion of the columns to an arrow table"""
+        pytest.importorskip("pyarrow")
+        data = columnar.read_columns(SAMPLE_1, run_validation=False)
+        table = data.to_arrow()
+
+        assert table.num_rows == len(data)
+        assert str(table.schema.field("amount").type) == "int64"
+
+    def test_missing_amount_and_funds_type(self):
+        """Test that an empty amount is null, and the availability fields of the funds type are skipped"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".bai", delete=False) as f:
+            f.write("01,GSBI,cont001,210706,1249,1,,,2/\n")
+            f.write("02,cont001,026015079,1,230906,2000,EUR,/\n")
+            f.write("03,107049924,,,,,/\n")
+            f.write("16,447,,V,230906,1200,BANKREF,CUSTREF,Some text, with a comma/\n")
+            f.write("88,EREF: 1111\n")
+            f.write("49,0,4/\n")
+            temp_path = f.name
+
+        try:
+            df = columnar.read_columns(temp_path, run_validation=False).to_dataframe()
+
+            assert pd.isna(df["amount"][0])
+            assert df["currency_code"][0] == "EUR"
+            assert df["bank_reference_number"][0] == "BANKREF"
+            assert df["customer_reference_number"][0] == "CUSTREF"
+            assert df["description"][0] == "Some text, with a comma"
+            assert df["transaction_summary"][0] == "EREF: 1111"
+        finally:
+            Path(temp_path).unlink()
+
+    def test_validation(self):
+        """Test that the trailer record counts are validated"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".bai", delete=False) as f:
+            f.write("01,GSBI,cont001,210706,1249,1,,,2/\n")
+            f.write("02,cont001,026015079,1,230906,2000,,/\n")
+            f.write("03,107049924,USD,,,,/\n")
+            f.write("16,447,60000,,SPB2322984714570,1111,ACH Credit Payment/\n")
+            f.write("49,60000,99/\n")
+            temp_path = f.name
+
+        try:
+            with pytest.raises(exc.Bai2ReaderException) as exc_info:
+                columnar.read_columns(temp_path, run_validation=True)
+
+            assert "Account trailer record count mismatch" in str(exc_info)
+        finally:
+            Path(temp_path).unlink()
+
+    def test_continuation_invalid_placement(self):
+        """Test that continuation without preceding record raises error"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".bai", delete=False) as f:
+            f.write("01,GSBI,cont001,210706,1249,1,,,2/\n")
+            f.write("02,cont001,026015079,1,230906,2000,,/\n")
+            f.write("88,Some continuation data\n")
+            temp_path = f.name
+
+        try:
+            with pytest.raises(exc.Bai2ReaderException) as exc_info:
+                columnar.read_columns(temp_path, run_validation=False)
+
+            assert "Continuation record found without" in str(exc_info)
+        finally:
+            Path(temp_path).unlink()
+
+    def test_transaction_after_group_header(self):
+        """Test that a transaction right after a group header is not added to the last account of the previous group"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".bai", delete=False) as f:
+            f.write("01,GSBI,cont001,210706,1249,1,,,2/\n")
+            f.write("02,cont001,026015079,1,230906,2000,USD,/\n")
+            f.write("03,107049924,USD,,,,/\n")
+            f.write("16,447,60000,,SPB2322984714570,1111,ACH Credit Payment/\n")
+            f.write("49,60000,3/\n")
+            f.write("98,60000,1,5/\n")
+            f.write("02,cont001,026015079,1,230907,2000,USD,/\n")
+            f.write("16,195,100,,SPB2322984714571,2222,Incoming Wire/\n")
+            temp_path = f.name
+
+        try:
+            with pytest.raises(exc.Bai2ReaderException, match="without a preceding account identifier record"):
+                columnar.read_columns(temp_path, run_validation=False)
+            with pytest.raises(exc.Bai2ReaderException, match="No '03' record before the '16' record"):
+                BAI2Reader(run_validation=False).read_file(temp_path)
+        finally:
+            Path(temp_path).unlink()
+
+    def test_file_not_found(self):
+        """Test that a missing file raises an error"""
+        with pytest.raises(exc.Bai2ReaderException):
+            columnar.read_columns("/nonexistent/path/file.bai")
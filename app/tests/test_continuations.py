@@ -0,0 +1,65 @@
+"""Testcases to validate the extraction of the tagged fields of the continuation records"""
+
+import pandas as pd
+import pytest
+from pathlib import Path
+
+from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src import continuations, exceptions as exc
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_2 = Path(SAMPLE_DIR, "sample_2.bai")
+
+
+class TestExtractTags:
+    """Test cases for the extraction of the tags into columns"""
+
+    def test_extract_tags(self):
+        """Test the tags of every row, with untagged records continuing the previous tag"""
+        df = continuations.extract_tags(
+            ["REMI: Invoice 1", "and 2", "EREF: REF-1", "CRNM: ABC", "REMI: Invoice 3", "CACT:"],
+            [0, 0, 0, 0, 2, 2],
+            num_rows=3,
+        )
+
+        assert df.columns.tolist() == ["eref", "dbnm", "cact", "remi"]
+        assert df.to_dict("records") == [
+            {"eref": "REF-1", "dbnm": None, "cact": None, "remi": "Invoice 1 and 2"},
+            {"eref": None, "dbnm": None, "cact": None, "remi": None},
+            {"eref": None, "dbnm": None, "cact": None, "remi": "Invoice 3"},
+        ]
+
+    def test_repeated_and_custom_tags(self):
+        """Test that a tag repeated in a row is joined, and that the tags are configurable"""
+        df = continuations.extract_tags(["CRNM: A", "EREF: B", "CRNM: C"], [1, 1, 1], num_rows=2, tags=["CRNM"])
+
+        assert df["crnm"].tolist() == [None, "A C"]
+
+    def test_no_records(self):
+        """Test the columns of rows without any continuation record"""
+        df = continuations.extract_tags([], [], num_rows=2)
+
+        assert df.shape == (2, 4)
+        assert df.isna().all().all()
+
+    def test_mismatched_rows(self):
+        """Test that every record needs a row"""
+        with pytest.raises(exc.Bai2ReaderException):
+            continuations.extract_tags(["EREF: A"], [], num_rows=1)
+
+    def test_flat_dataframe_tags(self):
+        """Test the tag columns of the flat DataFrame and of the columnar engine"""
+        reader = BAI2Reader(run_validation=False)
+        df = reader.read_file(SAMPLE_2).to_flat_dataframe(tags=continuations.DEFAULT_TAGS)
+        columns = reader.read_columns(SAMPLE_2).to_dataframe(tags=continuations.DEFAULT_TAGS)
+
+        assert df.loc[0, "transaction_summary_eref"] == "GS0DGZ0KMJ4QQPH"
+        assert df.loc[0, "transaction_summary_dbnm"] == "XYZ Limited"
+        assert df.loc[0, "transaction_summary_cact"] == "33257762"
+        assert df.loc[0, "transaction_summary_remi"] == "Test Remit Info"
+        tag_columns = [f"transaction_summary_{tag}" for tag in ("eref", "dbnm", "cact", "remi")]
+        pd.testing.assert_frame_equal(
+            df[tag_columns].astype(object).fillna("-"), columns[tag_columns].astype(object).fillna("-")
+        )
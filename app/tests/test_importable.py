@@ -1,7 +1,11 @@
 """Test Importable of BAI2 Reader"""
 
 import importlib
+import os
+import subprocess
+import sys
 import pytest
+from pathlib import Path
 
 
 def test_src_importable():
@@ -11,3 +15,59 @@ def test_src_importable():
     except ModuleNotFoundError:
         pytest.fail("Failed to Import BAI2 Reader")
     assert importlib.import_module("bai2_reader.ui"), "Failed to Import BAI2 Reader UI"
+
+
+# self time of the bai2_reader modules when `import bai2_reader` runs in a fresh interpreter
+IMPORT_BUDGET_SECONDS = 0.15
+
+
+def run_python(code: str, *args: str) -> subprocess.CompletedProcess:
+    """Runs python code in a fresh interpreter, with the same import paths as the tests"""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(path for path in sys.path if path)}
+    return subprocess.run([sys.executable, *args, "-c", code], capture_output=True, text=True, env=env, check=True)
+
+
+def test_import_time_budget():
+    """Test that the modules of bai2_reader import within the budget, third party modules excluded"""
+    stderr = run_python("import bai2_reader", "-X", "importtime").stderr
+
+    # lines of '-X importtime' are 'import time: {self us} | {cumulative us} | {module}'
+    self_times = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "self" not in line:
+            self_us, _, module = line.removeprefix("import time:").split("|")
+            self_times[module.strip()] = int(self_us)
+
+    own_seconds = sum(us for module, us in self_times.items() if module.startswith("bai2_reader")) / 1e6
+    assert "bai2_reader.src.enums" in self_times
+    assert own_seconds < IMPORT_BUDGET_SECONDS
+
+
+def test_type_codes_loaded_on_first_use():
+    """Test that the type code table is not loaded by the import, only by its first lookup, which doesn't import
+    pandas or numpy
+    """
+    run_python(
+        "import sys\n"
+        "import bai2_reader\n"
+        "from bai2_reader.src import enums\n"
+        "assert enums.load_type_codes.cache_info().currsize == 0\n"
+        "assert enums.TypeCodes().get_type_code('010').description == 'Opening Ledger'\n"
+        "assert enums.load_type_codes.cache_info().currsize == 1\n"
+        "assert not {'pandas', 'numpy'} & set(sys.modules)\n"
+    )
+
+
+def test_pandas_imported_on_demand():
+    """Test that reading and validating a file doesn't import pandas, only building a DataFrame does"""
+    sample = Path(Path(__file__).parent.parent, "bai2_reader", "samples", "sample_1.bai")
+    pytest.importorskip("typer")
+    run_python(
+        "import sys\n"
+        "from bai2_reader import BAI2Reader\n"
+        "from bai2_reader.src import cli\n"
+        f"reader = BAI2Reader(run_validation=False).read_file({str(sample)!r})\n"
+        "assert not {'pandas', 'numpy', 'pyarrow', 'xlsxwriter'} & set(sys.modules)\n"
+        "reader.to_flat_dataframe()\n"
+        "assert 'pandas' in sys.modules\n"
+    )
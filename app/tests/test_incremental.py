@@ -0,0 +1,136 @@
+"""Testcases to validate the incremental reader of growing BAI2 files"""
+
+import tempfile
+import pytest
+from pathlib import Path
+
+from bai2_reader.src.incremental import IncrementalReader
+from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src import exceptions as exc, models
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_1 = Path(SAMPLE_DIR, "sample_1.bai")
+
+LINES = [
+    "01,GSBI,cont001,210706,1249,1,,,2/\n",
+    "02,cont001,026015079,1,230906,2000,USD,/\n",
+    "03,107049924,USD,,,,/\n",
+    "16,447,60000,,SPB2322984714570,1111,ACH Credit Payment/\n",
+    "88,EREF: 1111\n",
+    "88,DBNM: SOMEONE\n",
+    "16,195,100,,SPB2322984714571,2222,Incoming Wire/\n",
+    "49,60100,6/\n",
+    "98,60100,1,8/\n",
+    "99,60100,1,10/\n",
+]
+
+
+@pytest.fixture
+def growing_file():
+    """An empty file that the test appends to"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".bai", delete=False) as f:
+        temp_path = f.name
+    yield Path(temp_path)
+    Path(temp_path).unlink()
+
+
+def append(path: Path, text: str) -> None:
+    """Appends text to the file"""
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(text)
+
+
+class TestIncrementalReader:
+    """Test cases for the incremental reader"""
+
+    def test_poll_appended_records(self, growing_file):
+        """Test that every poll yields only the transactions completed by the appended records"""
+        reader = IncrementalReader(growing_file)
+
+        append(growing_file, "".join(LINES[:5]))
+        assert list(reader.poll()) == []
+        assert reader.account_identifier.account_number == "107049924"
+
+        # the second '88' of the first transaction arrives with the next poll
+        append(growing_file, "".join(LINES[5:7]))
+        [(account, transaction)] = list(reader.poll())
+        assert account.account_number == "107049924"
+        assert transaction.transaction.amount == 60000
+        assert [continuation.record for continuation in transaction.summary] == ["EREF: 1111", "DBNM: SOMEONE"]
+
+        append(growing_file, "".join(LINES[7:]))
+        [(account, transaction)] = list(reader.poll())
+        assert transaction.transaction.bank_reference_number == "SPB2322984714571"
+        assert reader.checkpoint.offset == growing_file.stat().st_size
+        assert reader.account_identifier is None
+        assert list(reader.poll()) == []
+
+    def test_resume_from_checkpoint(self, growing_file):
+        """Test that a new reader resumes from a saved checkpoint, with the open account and record counters"""
+        append(growing_file, "".join(LINES[:6]))
+        reader = IncrementalReader(growing_file)
+        list(reader.poll())
+        saved = reader.checkpoint.model_dump_json()
+        assert reader.checkpoint.offset == len("".join(LINES[:3]))
+
+        append(growing_file, "".join(LINES[6:]))
+        resumed = IncrementalReader(growing_file, checkpoint=models.Checkpoint.model_validate_json(saved))
+        transactions = list(resumed.poll())
+
+        expected = list(BAI2Reader().iter_transactions(growing_file))
+        assert transactions == expected
+        assert resumed.state.total_records_counter == len(LINES)
+
+    def test_partial_line_and_early_stop(self, growing_file):
+        """Test that a line without its line ending is left for the next poll, and stopping early loses nothing"""
+        append(growing_file, "".join(LINES[:7]) + "49,60100")
+        reader = IncrementalReader(growing_file)
+
+        for _ in reader.poll():
+            break
+        assert reader.checkpoint.offset == len("".join(LINES[:6]))
+
+        append(growing_file, ",6/\n")
+        [(account, transaction)] = list(reader.poll())
+        assert transaction.transaction.bank_reference_number == "SPB2322984714571"
+
+    def test_validation(self, growing_file):
+        """Test that the trailer counts are validated across polls"""
+        append(growing_file, "".join(LINES[:7]))
+        reader = IncrementalReader(growing_file)
+        list(reader.poll())
+
+        append(growing_file, "49,60100,99/\n")
+        with pytest.raises(exc.Bai2ReaderException) as exc_info:
+            list(reader.poll())
+
+        assert "Account trailer record count mismatch" in str(exc_info)
+
+    def test_poll_again_after_error(self, growing_file):
+        """Test that a line that failed is not counted twice once it is fixed and polled again"""
+        append(growing_file, "".join(LINES[:8]) + "98,60100,1,99/\n")
+        reader = IncrementalReader(growing_file)
+        with pytest.raises(exc.Bai2ReaderException, match="Group trailer record count mismatch"):
+            list(reader.poll())
+        assert reader.checkpoint.offset == len("".join(LINES[:8]))
+        assert reader.state.total_records_counter == 8
+
+        growing_file.write_text("".join(LINES))
+        assert list(reader.poll()) == []
+        assert reader.checkpoint.offset == growing_file.stat().st_size
+        assert reader.state.total_records_counter == len(LINES)
+
+    def test_matches_iter_transactions(self):
+        """Test that a single poll of a complete file yields the same transactions as `iter_transactions`"""
+        transactions = list(IncrementalReader(SAMPLE_1, run_validation=False).poll())
+
+        assert transactions == list(BAI2Reader(run_validation=False).iter_transactions(SAMPLE_1))
+
+    def test_truncated_file(self, growing_file):
+        """Test that a file that is shorter than the checkpoint raises an error"""
+        with pytest.raises(exc.Bai2ReaderException) as exc_info:
+            list(IncrementalReader(growing_file, checkpoint=models.Checkpoint(offset=100)).poll())
+
+        assert "truncated" in str(exc_info)
@@ -0,0 +1,135 @@
+"""Testcases to validate the byte offset index and the random access to accounts"""
+
+import os
+import shutil
+import tempfile
+import pytest
+from pathlib import Path
+
+from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src import exceptions as exc, index
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_1 = Path(SAMPLE_DIR, "sample_1.bai")
+SAMPLE_4 = Path(SAMPLE_DIR, "sample_4.bai")
+
+
+@pytest.fixture
+def sample_copy():
+    """A copy of sample 4 in a temporary directory, so the sidecar index is not written next to the samples"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(shutil.copy(SAMPLE_4, tmpdir))
+
+
+class TestIndex:
+    """Test cases for the index of groups and accounts"""
+
+    def test_build_index(self):
+        """Test the offsets, lengths and record counts of the groups and accounts"""
+        file_index = index.build_index(SAMPLE_1)
+        data = SAMPLE_1.read_bytes()
+
+        [group] = file_index.groups
+        assert data[group.offset : group.offset + group.length].startswith(b"02,")
+        assert data[group.offset : group.offset + group.length].rstrip().endswith(b"98,13060195162,4,16/")
+        assert group.num_of_records == 122
+        assert [account.num_of_records for account in group.accounts] == [2, 18, 96, 2, 2]
+
+        for account in group.accounts:
+            account_data = data[account.offset : account.offset + account.length]
+            assert account_data.startswith(f"03,{account.account_number},".encode())
+            assert account_data.rstrip().splitlines()[-1].startswith(b"49,")
+            assert account.currency_code == "USD"
+
+    def test_read_account(self):
+        """Test that every account read from the index is the same as in the whole file"""
+        reader = BAI2Reader(run_validation=False)
+        bai_data = reader.read_file(SAMPLE_4).bai_data
+        file_index = index.build_index(SAMPLE_4)
+
+        for group, group_index in zip(bai_data.groups, file_index.groups, strict=True):
+            for account, account_index in zip(group.accounts, group_index.accounts, strict=True):
+                section = index.read_account(SAMPLE_4, group_index, account_index, run_validation=False)
+                assert section == account
+
+    def test_reader_read_account(self, sample_copy):
+        """Test the read of a single account with a sidecar index"""
+        index.build_index(sample_copy, save=True)
+        assert index.load_index(sample_copy) is not None
+
+        reader = BAI2Reader(run_validation=False)
+        section = reader.read_account(sample_copy, "10001193")
+
+        assert section.account_identifier.account_number == "10001193"
+        accounts = [account for group in reader.read_file(sample_copy).bai_data.groups for account in group.accounts]
+        expected = next(account for account in accounts if account.account_identifier.account_number == "10001193")
+        assert section == expected
+
+    def test_read_account_keeps_index(self, sample_copy, monkeypatch):
+        """Test that the reader keeps the index of a file until it changes, without writing a sidecar index"""
+        build_index = index.build_index
+        calls = []
+        monkeypatch.setattr(
+            index, "build_index", lambda *args, **kwargs: calls.append(args) or build_index(*args, **kwargs)
+        )
+        reader = BAI2Reader(run_validation=False)
+
+        first = reader.read_account(sample_copy, "10001193")
+        second = reader.read_account(sample_copy, "10001193")
+
+        assert len(calls) == 1
+        assert first == second
+        assert not index.index_path(sample_copy).exists()
+
+        stat = os.stat(sample_copy)
+        os.utime(sample_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        reader.read_account(sample_copy, "10001193")
+
+        assert len(calls) == 2
+
+    def test_read_account_saves_index(self, sample_copy, monkeypatch):
+        """Test that the index is saved with `save_index=True`, so other readers don't scan the file again"""
+        BAI2Reader(run_validation=False).read_account(sample_copy, "10001193", save_index=True)
+        assert index.load_index(sample_copy) is not None
+
+        monkeypatch.setattr(index, "build_index", None)
+        section = BAI2Reader(run_validation=False).read_account(sample_copy, "10001193")
+
+        assert section.account_identifier.account_number == "10001193"
+
+    def test_read_account_read_only_directory(self, sample_copy, monkeypatch):
+        """Test that an index that can't be saved is still used to read the account"""
+
+        def save_index(file_index, file_path):
+            raise PermissionError(f"Permission denied: {file_path}")
+
+        monkeypatch.setattr(index, "save_index", save_index)
+
+        section = BAI2Reader(run_validation=False).read_account(sample_copy, "10001193", save_index=True)
+
+        assert section.account_identifier.account_number == "10001193"
+        assert not index.index_path(sample_copy).exists()
+
+    def test_stale_index(self, sample_copy):
+        """Test that the sidecar index is ignored once the file has changed"""
+        index.build_index(sample_copy, save=True)
+        stat = os.stat(sample_copy)
+        os.utime(sample_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert index.load_index(sample_copy) is None
+        assert index.get_index(sample_copy).groups
+
+    def test_account_not_found(self):
+        """Test that an unknown account number raises an error, and that no sidecar index is written by default"""
+        with pytest.raises(exc.Bai2ReaderException) as exc_info:
+            BAI2Reader(run_validation=False).read_account(SAMPLE_1, "unknown")
+
+        assert "Account unknown not found" in str(exc_info)
+        assert not index.index_path(SAMPLE_1).exists()
+
+    def test_file_not_found(self):
+        """Test that a missing file raises an error"""
+        with pytest.raises(exc.Bai2ReaderException):
+            index.build_index("/nonexistent/path/file.bai")
@@ -0,0 +1,122 @@
+"""Testcases to validate the parallel parsing of a single BAI2 file"""
+
+import tempfile
+import pytest
+from pathlib import Path
+
+from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src import exceptions as exc, parallel
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_2 = Path(SAMPLE_DIR, "sample_2.bai")
+SAMPLE_4 = Path(SAMPLE_DIR, "sample_4.bai")
+
+
+def write_two_groups(group_2_records: int = 5) -> str:
+    """Writes a file with two groups, the record count of the second group trailer can be changed"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".bai", delete=False) as f:
+        f.write("01,GSBI,cont001,210706,1249,1,,,2/\n")
+        f.write("02,cont001,026015079,1,230906,2000,USD,/\n")
+        f.write("03,107049924,USD,,,,/\n")
+        f.write("16,447,60000,,SPB2322984714570,1111,ACH Credit Payment/\n")
+        f.write("49,60000,3/\n")
+        f.write("98,60000,1,5/\n")
+        f.write("\n")
+        f.write("02,cont001,026015079,1,230907,2000,USD,/\n")
+        f.write("03,107049925,USD,,,,/\n")
+        f.write("16,195,100,,SPB2322984714571,2222,Incoming Wire/\n")
+        f.write("49,100,3/\n")
+        f.write(f"98,100,1,{group_2_records}/\n")
+        f.write("99,60100,2,12/\n")
+        return f.name
+
+
+class TestParallel:
+    """Test cases for the parallel parsing of a single file"""
+
+    @pytest.mark.parametrize("sample", [SAMPLE_2, SAMPLE_4])
+    def test_matches_sequential_read(self, sample):
+        """Test that the stitched model is the same as the one of a sequential read"""
+        reader = BAI2Reader(run_validation=False)
+        expected = reader.read_file(sample).bai_data
+        result = reader.read_file(sample, workers=2).bai_data
+
+        assert result == expected
+
+    def test_validation(self):
+        """Test that the record counters are carried over the segments, so the trailers are validated"""
+        temp_path = write_two_groups()
+        try:
+            expected = BAI2Reader().read_file(temp_path).bai_data
+            result = parallel.read_file_parallel(temp_path, max_workers=2)
+
+            assert result == expected
+            assert [group.group_header.as_of_date for group in result.groups] == ["230906", "230907"]
+            assert result.file_trailer.record_counter == 12
+        finally:
+            Path(temp_path).unlink()
+
+    def test_validation_error(self):
+        """Test that an error in a worker is raised to the caller"""
+        temp_path = write_two_groups(group_2_records=99)
+        try:
+            with pytest.raises(exc.Bai2ReaderException) as exc_info:
+                parallel.read_file_parallel(temp_path, max_workers=2)
+
+            assert "Group trailer record count mismatch" in str(exc_info)
+        finally:
+            Path(temp_path).unlink()
+
+    @pytest.mark.parametrize("sample", [SAMPLE_2, SAMPLE_4])
+    def test_columns_match_sequential_read(self, sample):
+        """Test that the column buffers appended from the segments are the same as the ones of a sequential read"""
+        reader = BAI2Reader(run_validation=False)
+        expected = reader.read_columns(sample)
+        result = reader.read_columns(sample, workers=2)
+
+        assert result == expected
+        assert result.to_dataframe().equals(expected.to_dataframe())
+
+    def test_columns_validation(self):
+        """Test that the trailers are validated and the indexes point to the rows of their segment"""
+        temp_path = write_two_groups()
+        try:
+            result = parallel.read_columns_parallel(temp_path, max_workers=2)
+
+            assert list(result.accounts["group_index"]) == [0, 1]
+            assert list(result.transactions["account_index"]) == [0, 1]
+            assert list(result.transactions["record_counter"]) == [4, 9]
+            assert result == BAI2Reader().read_columns(temp_path)
+        finally:
+            Path(temp_path).unlink()
+
+    def test_columns_validation_error(self):
+        """Test that an error in a worker of the columnar read is raised to the caller"""
+        temp_path = write_two_groups(group_2_records=99)
+        try:
+            with pytest.raises(exc.Bai2ReaderException, match="Group trailer record count mismatch"):
+                parallel.read_columns_parallel(temp_path, max_workers=2)
+        finally:
+            Path(temp_path).unlink()
+
+    def test_scan_segments(self):
+        """Test that the file is split at the group boundaries"""
+        temp_path = write_two_groups()
+        try:
+            segments = parallel.scan_segments(temp_path)
+            data = Path(temp_path).read_bytes()
+
+            assert [segment.is_group for segment in segments] == [False, True, True, False]
+            assert [segment.total_records for segment in segments] == [0, 1, 6, 11]
+            assert data[segments[1].start : segments[1].end].startswith(b"02,")
+            assert data[segments[1].start : segments[1].end].endswith(b"98,60000,1,5/\n")
+            assert segments[-1].end == len(data)
+        finally:
+            Path(temp_path).unlink()
+
+    def test_file_not_found(self):
+        """Test that a missing file raises an error"""
+        with pytest.raises(exc.Bai2ReaderException):
+            parallel.read_file_parallel("/nonexistent/path/file.bai")
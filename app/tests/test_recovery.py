@@ -0,0 +1,159 @@
+"""Testcases to validate the collect-all-errors reading of BAI2 files"""
+
+import tempfile
+import pytest
+from pathlib import Path
+
+from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src import enums, exceptions as exc
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_3 = Path(SAMPLE_DIR, "sample_3.bai")
+
+# a bad amount in the account '222', and a wrong record count in the trailer of the second group
+BAD_FILE = """01,S,R,250701,0742,1,,,2/
+02,R,S,1,250701,0730,EUR,2/
+03,111,EUR,010,100,,/
+16,495,100,Z,ref1,cref1,text/
+88,EREF: A
+49,100,4/
+03,222,EUR,010,100,,/
+16,495,abc,Z,ref2,cref2,text/
+88,EREF: B
+49,100,4/
+03,333,EUR,010,100,,/
+16,495,300,Z,ref3,,text/
+49,300,3/
+98,400,3,13/
+02,R,S,1,250701,0730,EUR,2/
+03,444,EUR,010,100,,/
+49,100,2/
+98,100,1,5/
+99,500,2,19/
+"""
+
+
+@pytest.fixture
+def write_file():
+    """Writes the text of a BAI2 file to a temporary file"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+
+        def write(text: str) -> Path:
+            path = Path(tmpdir, "input.bai")
+            path.write_text(text)
+            return path
+
+        yield write
+
+
+def account_numbers(reader: BAI2Reader):
+    """The account numbers of every group of the read file"""
+    return [
+        [account.account_identifier.account_number for account in group.accounts] for group in reader.bai_data.groups
+    ]
+
+
+class TestCollectErrors:
+    """Test cases for the `OnError.collect` mode"""
+
+    def test_raise_by_default(self, write_file):
+        """Test that the first bad record fails the read by default"""
+        with pytest.raises(exc.Bai2ReaderException, match="abc"):
+            BAI2Reader(run_validation=True).read_file(write_file(BAD_FILE))
+
+    def test_collect(self, write_file):
+        """Test that the bad account and group are skipped, and their errors reported with their lines"""
+        reader = BAI2Reader(run_validation=True, on_error="collect").read_file(write_file(BAD_FILE))
+
+        assert account_numbers(reader) == [["111", "333"]]
+        assert reader.bai_data.file_trailer.num_of_records == 19
+
+        report = reader.error_report
+        assert [(error.line_number, error.section, error.first_line, error.last_line) for error in report.errors] == [
+            (8, enums.Section.account, 7, 10),
+            (18, enums.Section.group, 15, 18),
+        ]
+        assert report.errors[0].raw == "16,495,abc,Z,ref2,cref2,text/"
+        assert report.errors[0].error_type == "ValueError"
+        assert report.errors[1].message == "Group trailer record count mismatch: expected 4, got 5"
+        assert (report.skipped_records, report.skipped_accounts, report.skipped_groups) == (8, 1, 1)
+
+    def test_read_file_argument(self, write_file):
+        """Test that the mode of `read_file` overrides the one of the reader"""
+        reader = BAI2Reader(run_validation=True, trusted=True)
+
+        reader.read_file(write_file(BAD_FILE), on_error=enums.OnError.collect)
+
+        assert len(reader.error_report.errors) == 2
+        assert reader.to_flat_dataframe()["account_identifier_account_number"].tolist() == ["111", "333"]
+
+    def test_missing_trailer(self, write_file):
+        """Test that the skipping of an account without trailer ends at the next account"""
+        text = BAD_FILE.replace("49,100,4/\n03,333", "03,333").replace("98,400,3,13/", "98,400,3,12/")
+        text = text.replace("99,500,2,19/", "99,500,2,18/")
+
+        reader = BAI2Reader(run_validation=True, on_error="collect").read_file(write_file(text))
+
+        assert account_numbers(reader) == [["111", "333"]]
+        assert reader.error_report.errors[0].last_line == 9
+
+    def test_bad_group_header(self, write_file):
+        """Test that a bad group header skips its whole group"""
+        text = BAD_FILE.replace("02,R,S,1,250701,0730,EUR,2/\n03,444", "02,R,S,X,250701,0730,EUR,2/\n03,444")
+
+        reader = BAI2Reader(run_validation=True, on_error="collect").read_file(write_file(text))
+
+        assert len(reader.bai_data.groups) == 1
+        assert [(error.line_number, error.first_line, error.last_line) for error in reader.error_report.errors] == [
+            (8, 7, 10),
+            (15, 15, 18),
+        ]
+
+    def test_valid_file(self):
+        """Test that a valid file gives an empty report and the same model"""
+        reader = BAI2Reader(run_validation=True, on_error="collect").read_file(SAMPLE_3)
+
+        assert reader.error_report.errors == []
+        assert reader.bai_data == BAI2Reader(run_validation=True).read_file(SAMPLE_3).bai_data
+
+    def test_bad_file_trailer(self, write_file):
+        """Test that the data of a file without its trailer can still be converted and written"""
+        text = SAMPLE_3.read_text().replace("99,6835,1,38/", "99,6835,1,39/")
+
+        input_file = write_file(text)
+        reader = BAI2Reader(run_validation=True, on_error="collect").read_file(input_file)
+
+        assert reader.bai_data.file_trailer is None
+        assert reader.error_report.errors[0].section is enums.Section.file
+        assert [row["file_trailer"] for row in reader.to_json()] == [{}] * 4
+        assert len(reader.to_flat_dataframe()) == 4
+        output = reader.write_data(output_dir=input_file.parent, output_file_name="output.json", output_format="json")
+        assert output.is_file()
+
+    @pytest.mark.parametrize(
+        "text, error",
+        [
+            (
+                "01,S,R,250701,0742,1,,,2/\n03,999,EUR,010,100,,/\n16,495,100,Z,ref0,,text/\n49,100,3/\n"
+                "02,R,S,1,250701,0730,EUR,2/\n03,111,EUR,010,100,,/\n16,495,100,Z,ref1,cref1,text/\n49,100,3/\n"
+                "98,100,1,5/\n99,200,1,10/\n",
+                (2, 2, 4, "No '02' record before the '03' record"),
+            ),
+            (
+                "01,S,R,250701,0742,1,,,2/\n02,R,S,1,250701,0730,EUR,2/\n16,495,100,Z,ref0,,text/\n88,EREF: 0\n"
+                "03,111,EUR,010,100,,/\n16,495,100,Z,ref1,cref1,text/\n49,100,3/\n98,100,1,7/\n99,100,1,9/\n",
+                (3, 3, 4, "No '03' record before the '16' record"),
+            ),
+        ],
+        ids=["account_without_group", "transaction_without_account"],
+    )
+    def test_record_without_section_header(self, write_file, text, error):
+        """Test that a record before the header of its section is collected, and only its section skipped"""
+        reader = BAI2Reader(run_validation=True, on_error="collect").read_file(write_file(text))
+
+        assert account_numbers(reader) == [["111"]]
+        [collected] = reader.error_report.errors
+        assert (collected.line_number, collected.first_line, collected.last_line, collected.message) == error
+        assert collected.section is enums.Section.account
@@ -0,0 +1,97 @@
+"""Testcases to validate the reading of compressed BAI2 files"""
+
+import bz2
+import gzip
+import lzma
+import tempfile
+import zipfile
+import pytest
+from pathlib import Path
+
+from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src import batch, exceptions as exc, index, sources
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_1 = Path(SAMPLE_DIR, "sample_1.bai")
+SAMPLE_2 = Path(SAMPLE_DIR, "sample_2.bai")
+
+
+@pytest.fixture
+def tmpdir_path():
+    """A temporary directory for the compressed files"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def write_zip(path: Path, *samples: Path) -> Path:
+    """Writes the samples into a zip archive"""
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for sample in samples:
+            archive.write(sample, arcname=f"daily/{sample.name}")
+    return path
+
+
+class TestCompressedInput:
+    """Test cases for the compressed input files"""
+
+    @pytest.mark.parametrize("compress", [gzip.compress, bz2.compress, lzma.compress])
+    def test_read_compressed_file(self, tmpdir_path, compress):
+        """Test that a compressed file is detected from its magic bytes, whatever its extension"""
+        path = Path(tmpdir_path, "sample_1.bai")
+        path.write_bytes(compress(SAMPLE_1.read_bytes()))
+
+        reader = BAI2Reader(run_validation=False)
+
+        assert sources.detect_compression(path) is not None
+        assert reader.read_file(path).bai_data == reader.read_file(SAMPLE_1).bai_data
+        assert len(reader.read_columns(path)) == len(reader.read_columns(SAMPLE_1))
+
+    def test_read_zip_members(self, tmpdir_path):
+        """Test that every file of a zip archive is read straight from the archive"""
+        path = write_zip(Path(tmpdir_path, "daily.zip"), SAMPLE_1, SAMPLE_2)
+        reader = BAI2Reader(run_validation=False)
+
+        assert sources.archive_members(path) == ["daily/sample_1.bai", "daily/sample_2.bai"]
+        assert reader.read_file(path, member="daily/sample_2.bai").bai_data == reader.read_file(SAMPLE_2).bai_data
+
+        with pytest.raises(exc.InvalidFileFormatException) as exc_info:
+            reader.read_file(path)
+        assert "has 2 files" in str(exc_info)
+
+    def test_read_zip_single_member(self, tmpdir_path):
+        """Test that the only file of a zip archive is read without naming it"""
+        path = write_zip(Path(tmpdir_path, "daily.zip"), SAMPLE_1)
+        reader = BAI2Reader(run_validation=False)
+
+        assert list(reader.iter_transactions(path)) == list(reader.iter_transactions(SAMPLE_1))
+
+    def test_plain_file(self):
+        """Test that a plain file is not detected as compressed"""
+        assert sources.detect_compression(SAMPLE_1) is None
+        assert sources.archive_members(SAMPLE_1) is None
+
+    def test_parallel_and_index(self, tmpdir_path):
+        """Test that compressed files are parsed in the current process, and can't be indexed"""
+        path = Path(tmpdir_path, "sample_1.bai.gz")
+        path.write_bytes(gzip.compress(SAMPLE_1.read_bytes()))
+        reader = BAI2Reader(run_validation=False)
+
+        assert reader.read_file(path, workers=2).bai_data == reader.read_file(SAMPLE_1).bai_data
+        with pytest.raises(exc.InvalidFileFormatException):
+            index.build_index(path)
+
+    def test_export_zip(self, tmpdir_path):
+        """Test that every file of a zip archive is exported to its own output file"""
+        path = write_zip(Path(tmpdir_path, "daily.zip"), SAMPLE_1, SAMPLE_2)
+        output_dir = Path(tmpdir_path, "output")
+
+        summary = batch.export_files([str(path)], ["daily.csv"], output_dir=str(output_dir), run_validation=False)
+
+        assert not summary.failures
+        assert summary.results[0].output_files == [
+            str(Path(output_dir, "daily_sample_1.csv")),
+            str(Path(output_dir, "daily_sample_2.csv")),
+        ]
+        assert sorted(file.name for file in output_dir.iterdir()) == ["daily_sample_1.csv", "daily_sample_2.csv"]
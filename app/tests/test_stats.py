@@ -0,0 +1,150 @@
+"""Testcases to validate the parse statistics of the reader"""
+
+import gzip
+import logging
+import tempfile
+import pytest
+from pathlib import Path
+
+from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src import parser, stats
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_2 = Path(SAMPLE_DIR, "sample_2.bai")
+SAMPLE_3 = Path(SAMPLE_DIR, "sample_3.bai")
+
+
+@pytest.fixture
+def tmpdir_path():
+    """A temporary directory for the output files"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+class TestParseStats:
+    """Test cases for the statistics of the reads and exports"""
+
+    def test_read_file_stats(self):
+        """Test the record counts, bytes and per phase times of a read"""
+        reader = BAI2Reader(run_validation=True).read_file(SAMPLE_3)
+
+        assert reader.stats.record_counts == {
+            "file_header": 1,
+            "group_header": 1,
+            "account_identifier": 1,
+            "transaction": 4,
+            "continuation": 28,
+            "account_trailer": 1,
+            "group_trailer": 1,
+            "file_trailer": 1,
+        }
+        assert reader.stats.lines == 38
+        assert reader.stats.bytes_read == SAMPLE_3.stat().st_size
+        assert reader.stats.seconds["io"] > 0
+        assert reader.stats.seconds["tokenize"] > 0
+        assert reader.stats.seconds["model"] > 0
+        assert reader.stats.seconds["validation"] > 0
+        assert reader.stats.peak_allocated_blocks > 0
+
+    def test_sampled_lines(self):
+        """Test that the times are scaled up from the sampled lines, and the counts are still exact"""
+        reader = BAI2Reader(run_validation=False, stats_sample_every=4).read_file(SAMPLE_2)
+
+        assert sum(reader.stats.record_counts.values()) == reader.stats.lines
+        assert reader.stats.seconds["io"] > 0
+        assert reader.stats.seconds["tokenize"] > 0
+
+    def test_lines_split_once(self, monkeypatch):
+        """Test that the sampled lines are not split a second time to time their tokenizing"""
+        split_record = parser.split_record
+        calls = []
+        monkeypatch.setattr(parser, "split_record", lambda *args: calls.append(args) or split_record(*args))
+
+        reader = BAI2Reader(run_validation=True, stats_sample_every=4).read_file(SAMPLE_3)
+
+        assert len(calls) == reader.stats.lines
+        assert reader.stats.seconds["tokenize"] > 0
+
+    def test_compressed_bytes_read(self, tmpdir_path):
+        """Test that the bytes read of a compressed file are the decompressed bytes"""
+        path = Path(tmpdir_path, "sample_3.bai.gz")
+        path.write_bytes(gzip.compress(SAMPLE_3.read_bytes()))
+
+        reader = BAI2Reader(run_validation=True).read_file(path)
+
+        assert reader.stats.bytes_read == SAMPLE_3.stat().st_size
+
+    def test_stats_hook(self, tmpdir_path):
+        """Test that the hook gets the statistics after the read and after the export, a CSV export streams the rows
+        without flattening a DataFrame
+        """
+        calls = []
+        reader = BAI2Reader(run_validation=True, stats_hook=lambda s: calls.append(s.to_dict()))
+
+        reader.read_file(SAMPLE_3)
+        reader.write_data(output_dir=tmpdir_path, output_file_name="sample_3.csv")
+
+        assert len(calls) == 2
+        assert calls[0]["records.transaction"] == 4
+        assert calls[0]["seconds.flatten"] == 0
+        assert calls[1]["seconds.flatten"] == 0
+        assert calls[1]["seconds.write"] > 0
+        assert set(f"seconds.{phase}" for phase in stats.PHASES) <= set(calls[1])
+
+    def test_iter_records_stats(self):
+        """Test that the statistics of a streamed read are sent once the records are exhausted"""
+        calls = []
+        reader = BAI2Reader(run_validation=True, stats_hook=calls.append)
+
+        records = list(reader.iter_records(SAMPLE_3))
+
+        assert len(calls) == 1
+        assert calls[0].lines == len(records)
+        assert calls[0].record_counts["continuation"] == 28
+
+    def test_failing_hook(self, caplog):
+        """Test that a failing hook is logged and doesn't fail the read"""
+
+        def hook(parse_stats):
+            raise RuntimeError("metrics system is down")
+
+        with caplog.at_level(logging.WARNING, logger="bai2-reader"):
+            reader = BAI2Reader(run_validation=True, stats_hook=hook).read_file(SAMPLE_3)
+
+        assert reader.bai_data is not None
+        assert "metrics system is down" in caplog.text
+
+
+class TestParseLogging:
+    """Test cases for the logging of the reads, aggregated instead of per line"""
+
+    def test_no_debug_per_line(self, caplog):
+        """Test that the debug output is one message per account and group trailer, not one per line"""
+        with caplog.at_level(logging.DEBUG, logger="bai2-reader"):
+            BAI2Reader(run_validation=True).read_file(SAMPLE_3)
+
+        debug = [record.getMessage() for record in caplog.records if record.levelno == logging.DEBUG]
+        assert debug == ["Account trailer at line 36: 34 records", "Group trailer at line 37: 36 records"]
+
+    def test_progress(self, caplog):
+        """Test the progress messages every `log_every` lines"""
+        with caplog.at_level(logging.DEBUG, logger="bai2-reader"):
+            BAI2Reader(run_validation=False, stats_sample_every=1, log_every=10).read_file(SAMPLE_3)
+
+        progress = [record.getMessage() for record in caplog.records if record.getMessage().startswith("Read ")]
+        assert progress == [
+            "Read 10 lines, 1 transactions",
+            "Read 20 lines, 2 transactions",
+            "Read 30 lines, 4 transactions",
+        ]
+
+    def test_summary_event(self, caplog):
+        """Test the structured summary event of a read"""
+        with caplog.at_level(logging.INFO, logger="bai2-reader"):
+            BAI2Reader(run_validation=True).read_file(SAMPLE_3)
+
+        (event,) = [record for record in caplog.records if getattr(record, "event", None) == "read"]
+        assert event.stats["records.continuation"] == 28
+        assert event.stats["lines"] == 38
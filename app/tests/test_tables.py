@@ -0,0 +1,244 @@
+"""Testcases to validate the normalized tables of BAI2 files"""
+
+import csv
+import io
+import json
+import re
+import tempfile
+import zipfile
+import pytest
+from collections import defaultdict
+from pathlib import Path
+
+from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src import enums, exceptions as exc, tables
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_1 = Path(SAMPLE_DIR, "sample_1.bai")
+SAMPLE_3 = Path(SAMPLE_DIR, "sample_3.bai")
+SAMPLES = sorted(SAMPLE_DIR.glob("sample_*.bai"))
+
+
+@pytest.fixture
+def tmpdir_path():
+    """A temporary directory for the input and output files"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def collect(chunks):
+    """The rows of every table, from the chunks of `tables`"""
+    rows = defaultdict(list)
+    for table, chunk in chunks:
+        rows[table].extend(chunk)
+    return dict(rows)
+
+
+def read_csv(path: Path):
+    """The header and the rows of a CSV file"""
+    with open(path, newline="") as file:
+        header, *rows = csv.reader(file)
+    return header, rows
+
+
+class TestTables:
+    """Test cases for the rows of the normalized tables"""
+
+    @pytest.mark.parametrize("sample", SAMPLES, ids=lambda path: path.stem)
+    def test_record_tables_match_model_tables(self, sample):
+        """Test that the tables streamed from the parser are the tables of the Bai2Model"""
+        reader = BAI2Reader(run_validation=False)
+
+        streamed = collect(tables.record_tables(reader.iter_records(sample), chunk_size=3))
+        built = collect(tables.model_tables(reader.read_file(sample).bai_data, chunk_size=3))
+
+        assert streamed == built
+
+    def test_chunks(self):
+        """Test that no chunk is larger than the chunk size, and that every row has the columns of its table"""
+        reader = BAI2Reader(run_validation=False)
+
+        chunks = list(tables.record_tables(reader.iter_records(SAMPLE_1), chunk_size=3))
+
+        assert all(0 < len(chunk) <= 3 for _, chunk in chunks)
+        assert all(len(row) == len(tables.TABLE_COLUMNS[table]) for table, chunk in chunks for row in chunk)
+
+    def test_keys(self):
+        """Test that the keys number the rows from 1 and link every row to its parent, the accounts without
+        transactions included
+        """
+        rows = collect(tables.model_tables(BAI2Reader(run_validation=False).read_file(SAMPLE_1).bai_data))
+
+        assert [row[:2] for row in rows["groups"]] == [(1, 1)]
+        assert [row[:3] for row in rows["accounts"]] == [
+            (1, 1, "107049924"),
+            (2, 1, "107049932"),
+            (3, 1, "104108339"),
+            (4, 1, "260000033037"),
+            (5, 1, "280000010657"),
+        ]
+        assert [row[0] for row in rows["transactions"]] == list(range(1, 21))
+        assert [row[1] for row in rows["transactions"]] == [2] * 3 + [3] * 17
+
+        transactions = {row[0]: row[1] for row in rows["transactions"]}
+        for _, account_key, transaction_key, _ in rows["continuations"]:
+            assert transaction_key is None or transactions[transaction_key] == account_key
+
+    def test_continuations(self):
+        """Test that the continuations of a transaction have its key, and of an account identifier none"""
+        records = list(BAI2Reader().iter_records(SAMPLE_3))
+        # an '88' right after the account identifier continues the account, not a transaction
+        position = next(i for i, record in enumerate(records) if record.record_code == "03") + 1
+        continuation = next(record for record in records if record.record_code == "88")
+        records.insert(position, continuation.model_copy(update={"record": "ACCOUNT NOTE"}))
+
+        rows = collect(tables.record_tables(records))
+
+        assert rows["continuations"][0][1:] == (1, None, "ACCOUNT NOTE")
+        assert {row[2] for row in rows["continuations"][1:]} == {1, 2, 3, 4}
+
+    def test_missing_trailer(self, tmpdir_path):
+        """Test that an account without its trailer is closed by the next trailer, with null trailer values"""
+        input_file = Path(tmpdir_path, "input.bai")
+        input_file.write_text(SAMPLE_3.read_text().replace("49,6835,34/\n", ""))
+        reader = BAI2Reader(run_validation=False)
+
+        rows = collect(tables.record_tables(reader.iter_records(input_file)))
+
+        columns = tables.TABLE_COLUMNS["accounts"]
+        assert rows["accounts"][0][columns.index("account_identifier_account_number")] == "3000000651"
+        assert rows["accounts"][0][columns.index("account_trailer_num_of_records") :] == (None,)
+        assert len(rows["groups"]) == 1
+
+
+class TestNormalizedExport:
+    """Test cases for the export of the normalized tables in every output format"""
+
+    @pytest.mark.parametrize("sample", SAMPLES, ids=lambda path: path.stem)
+    def test_export_file_matches_write_data(self, sample, tmpdir_path):
+        """Test that the table files streamed from the parser are the ones of the Bai2Model"""
+        reader = BAI2Reader(run_validation=False, layout=enums.Layout.normalized)
+
+        streamed = reader.export_file(sample, output_dir=tmpdir_path, output_file_name="streamed.csv")
+        written = reader.read_file(sample).write_data(output_dir=tmpdir_path, output_file_name="written.csv")
+
+        assert streamed == Path(tmpdir_path, "streamed")
+        for table in tables.TABLE_COLUMNS:
+            assert Path(streamed, f"{table}.csv").read_text() == Path(written, f"{table}.csv").read_text()
+
+    def test_csv(self, tmpdir_path):
+        """Test that every table is a CSV file of the output directory, with its columns"""
+        reader = BAI2Reader(run_validation=False)
+
+        output = reader.export_file(
+            SAMPLE_1, output_dir=tmpdir_path, output_file_name="sample_1.csv", layout=enums.Layout.normalized
+        )
+
+        assert sorted(path.name for path in output.iterdir()) == sorted(
+            f"{table}.csv" for table in tables.TABLE_COLUMNS
+        )
+        counts = {}
+        for table, columns in tables.TABLE_COLUMNS.items():
+            header, rows = read_csv(Path(output, f"{table}.csv"))
+            assert header == list(columns)
+            counts[table] = len(rows)
+        assert counts["files"] == 1 and counts["groups"] == 1
+        assert counts["accounts"] == 5 and counts["transactions"] == 20
+
+    def test_jsonl(self, tmpdir_path):
+        """Test that the keys and amounts of the JSON Lines tables are numbers, a missing key is null"""
+        reader = BAI2Reader(run_validation=True, output_format="jsonl", layout="normalized")
+
+        output = reader.export_file(SAMPLE_3, output_dir=tmpdir_path, output_file_name="sample_3.jsonl")
+
+        transactions = [json.loads(line) for line in Path(output, "transactions.jsonl").read_text().splitlines()]
+        assert [row["transaction_amount"] for row in transactions] == [65.0, 6600.0, 6500.0, 20000.0]
+        assert [row["account_key"] for row in transactions] == [1, 1, 1, 1]
+        accounts = [json.loads(line) for line in Path(output, "accounts.jsonl").read_text().splitlines()]
+        assert accounts[0]["account_trailer_num_of_records"] == 34
+
+    def test_parquet(self, tmpdir_path):
+        """Test the typed and delta encoded keys, amounts and dictionary encoded codes of the Parquet tables"""
+        parquet = pytest.importorskip("pyarrow.parquet")
+        reader = BAI2Reader(run_validation=False, output_format="parquet", amount_mode=enums.AmountMode.minor_units)
+
+        output = reader.export_file(
+            SAMPLE_1, output_dir=tmpdir_path, output_file_name="sample_1.parquet", layout="normalized"
+        )
+
+        schema = parquet.read_schema(Path(output, "transactions.parquet"))
+        assert schema.names == list(tables.TABLE_COLUMNS["transactions"])
+        assert str(schema.field("transaction_key").type) == "int64"
+        assert str(schema.field("transaction_amount").type) == "int64"
+        assert str(schema.field("transaction_type_code").type) == "dictionary<values=string, indices=int32, ordered=0>"
+        assert str(schema.field("transaction_description").type) == "string"
+        assert parquet.read_table(Path(output, "transactions.parquet")).num_rows == 20
+        column = parquet.ParquetFile(Path(output, "transactions.parquet")).metadata.row_group(0).column(0)
+        assert "DELTA_BINARY_PACKED" in column.encodings
+        assert parquet.read_table(Path(output, "files.parquet")).num_rows == 1
+
+    def test_excel(self, tmpdir_path):
+        """Test that every table is a sheet of the Excel file"""
+        pytest.importorskip("xlsxwriter")
+        reader = BAI2Reader(run_validation=False, output_format="excel", layout="normalized")
+
+        output = reader.export_file(SAMPLE_1, output_dir=tmpdir_path, output_file_name="sample_1.xlsx")
+
+        with zipfile.ZipFile(output) as workbook:
+            names = re.findall(r'<sheet name="([^"]+)"', workbook.read("xl/workbook.xml").decode())
+            transactions = workbook.read("xl/worksheets/sheet4.xml").decode().count("<row ")
+        assert names == list(tables.TABLE_COLUMNS)
+        assert transactions == 21
+
+    def test_json_uses_pandas(self, tmpdir_path):
+        """Test that the formats without a streaming writer write the table DataFrames"""
+        reader = BAI2Reader(run_validation=True, output_format="json", layout="normalized")
+
+        output = reader.export_file(SAMPLE_3, output_dir=tmpdir_path, output_file_name="sample_3.json")
+
+        transactions = json.loads(Path(output, "transactions.json").read_text())
+        assert [row["transaction_type_code"] for row in transactions] == ["495", "447", "447", "195"]
+        assert json.loads(Path(output, "files.json").read_text())[0]["file_key"] == 1
+
+    def test_table_dataframes(self):
+        """Test that the table DataFrames have the columns of the tables and nullable integer keys"""
+        table_dfs = BAI2Reader(run_validation=False).read_file(SAMPLE_1).to_table_dataframes()
+
+        assert list(table_dfs) == list(tables.TABLE_COLUMNS)
+        assert all(list(table_dfs[table].columns) == list(columns) for table, columns in tables.TABLE_COLUMNS.items())
+        assert str(table_dfs["continuations"]["transaction_key"].dtype) == "Int64"
+        assert len(table_dfs["transactions"]) == 20
+
+    def test_output_stream_not_supported(self):
+        """Test that the normalized tables can't be written to a stream"""
+        with pytest.raises(exc.Bai2ReaderException, match="normalized tables"):
+            BAI2Reader(layout="normalized").export_file(SAMPLE_3, output_stream=io.StringIO())
+
+    def test_failed_export_removes_tables(self, tmpdir_path):
+        """Test that a validation error leaves no table files and no output directory"""
+        input_file = Path(tmpdir_path, "input.bai")
+        input_file.write_text(SAMPLE_3.read_text().replace("49,6835,34/", "49,6835,35/"))
+
+        with pytest.raises(exc.Bai2ReaderException):
+            BAI2Reader(run_validation=True, layout="normalized").export_file(
+                input_file, output_dir=tmpdir_path, output_file_name="output.csv"
+            )
+
+        assert not Path(tmpdir_path, "output").exists()
+
+    def test_cli(self, tmpdir_path):
+        """Test that `--layout normalized` writes the tables to a directory named after the output file"""
+        typer_testing = pytest.importorskip("typer.testing")
+        from bai2_reader.src.cli import app
+
+        output = Path(tmpdir_path, "sample_3.csv")
+        result = typer_testing.CliRunner().invoke(
+            app, ["export", "--input-files", str(SAMPLE_3), "--output", output, "--layout", "normalized"]
+        )
+
+        assert result.exit_code == 0
+        assert read_csv(Path(tmpdir_path, "sample_3", "transactions.csv"))[0] == list(
+            tables.TABLE_COLUMNS["transactions"]
+        )
@@ -0,0 +1,69 @@
+"""Testcases to validate the type code lookup table and the bulk enrichment"""
+
+import pandas as pd
+import pytest
+from pathlib import Path
+
+from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src import enums, exceptions as exc, type_codes
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_1 = Path(SAMPLE_DIR, "sample_1.bai")
+
+
+class TestTypeCodeTable:
+    """Test cases for the lookup of a single type code"""
+
+    def test_get(self):
+        """Test that the table has every type code, and returns the same instance for every lookup"""
+        table = type_codes.get_table()
+        details = table.get("010")
+
+        assert len(table) == len(enums.TypeCodes().type_codes)
+        assert details.description == "Opening Ledger"
+        assert details.type_level_code == enums.TypeCodeLevel.status
+        assert details.transaction_type is None
+        assert table.get("010") is details
+        assert table.get("999") is None
+        assert table.get("1") is None
+        assert table.get(None) is None
+
+    def test_get_type_code(self):
+        """Test the lookup through `TypeCodes`, for known and unknown codes"""
+        assert enums.TypeCodes().get_type_code("100").transaction_type == enums.TransactionType.credit
+
+        with pytest.warns(UserWarning):
+            assert enums.TypeCodes().get_type_code("999") == enums.TypeCodes.TypeCode()
+        with pytest.raises(exc.UnknownValueException):
+            enums.TypeCodes().get_type_code("999", ignore_if_not_found=False)
+
+
+class TestEnrich:
+    """Test cases for the enrichment of a type code column"""
+
+    @pytest.mark.parametrize("dtype", [object, "category"])
+    def test_enrich(self, dtype):
+        """Test the attributes of every row, with nulls and a report for the unknown codes"""
+        column = pd.Series(["100", "400", "999", None, "100", "ABC", "999"], dtype=dtype)
+        enriched, unknown = type_codes.enrich(column)
+
+        assert enriched["transaction_type"].tolist()[:2] == ["CR", "DB"]
+        assert enriched["type_level_code"].tolist()[:2] == ["summary", "summary"]
+        assert enriched["type_code_description"].tolist()[:2] == ["Total Credits", "Total Debits"]
+        assert enriched.iloc[2:4].isna().all().all()
+        assert unknown == {"999": 2, "ABC": 1}
+
+    def test_enrich_dataframe(self):
+        """Test the enrichment of the transactions of the flat DataFrame and of the columnar engine"""
+        reader = BAI2Reader(run_validation=False)
+        df, unknown = type_codes.enrich_dataframe(
+            reader.read_file(SAMPLE_1).to_flat_dataframe(), column="transaction_type_code", prefix="transaction_"
+        )
+        columns, _ = type_codes.enrich_dataframe(reader.read_columns(SAMPLE_1).to_dataframe())
+
+        assert not unknown
+        assert df["transaction_transaction_type"].notna().all()
+        assert df["transaction_type_level_code"].tolist() == columns["type_level_code"].tolist()
+        assert df["transaction_type_code_description"].tolist() == columns["type_code_description"].tolist()
@@ -0,0 +1,323 @@
+"""Testcases to validate the streaming export of BAI2 files"""
+
+import csv
+import gzip
+import io
+import json
+import re
+import tempfile
+import zipfile
+import pytest
+from pathlib import Path
+
+from bai2_reader.src.reader import BAI2Reader
+from bai2_reader.src import enums, exceptions as exc, flat, writers
+
+
+# Test data paths
+SAMPLE_DIR = Path(Path(__file__).parent.parent, "bai2_reader", "samples")
+SAMPLE_1 = Path(SAMPLE_DIR, "sample_1.bai")
+SAMPLE_3 = Path(SAMPLE_DIR, "sample_3.bai")
+SAMPLES = sorted(SAMPLE_DIR.glob("sample_*.bai"))
+
+
+@pytest.fixture
+def tmpdir_path():
+    """A temporary directory for the input and output files"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+def read_csv(path: Path):
+    """The header and the rows of a CSV file"""
+    with open(path, newline="") as file:
+        header, *rows = csv.reader(file)
+    return header, rows
+
+
+def read_sheets(path: Path):
+    """The names of the sheets of an Excel file, with their number of rows, the header rows included"""
+    with zipfile.ZipFile(path) as workbook:
+        names = re.findall(r'<sheet name="([^"]+)"', workbook.read("xl/workbook.xml").decode())
+        return [
+            (name, workbook.read(f"xl/worksheets/sheet{number}.xml").decode().count("<row "))
+            for number, name in enumerate(names, start=1)
+        ]
+
+
+class TestStreamingCsv:
+    """Test cases for the CSV export without a DataFrame"""
+
+    @pytest.mark.parametrize("sample", SAMPLES, ids=lambda path: path.stem)
+    def test_export_file_matches_write_data(self, sample, tmpdir_path):
+        """Test that the rows streamed from the parser are the rows of the Bai2Model"""
+        reader = BAI2Reader(run_validation=False)
+
+        streamed = reader.export_file(sample, output_dir=tmpdir_path, output_file_name="streamed.csv")
+        written = reader.read_file(sample).write_data(output_dir=tmpdir_path, output_file_name="written.csv")
+
+        assert streamed.read_text() == written.read_text()
+
+    def test_columns(self, tmpdir_path):
+        """Test that the columns are the ones of the flat DataFrame, with the same values"""
+        reader = BAI2Reader(run_validation=False)
+
+        output = reader.export_file(SAMPLE_1, output_dir=tmpdir_path, output_file_name="sample_1.csv")
+
+        header, rows = read_csv(output)
+        df = reader.read_file(SAMPLE_1).to_flat_dataframe()
+        assert header == list(flat.FLAT_COLUMNS) == list(df.columns)
+        assert len(rows) == len(df)
+        assert [row[header.index("transaction_bank_reference_number")] for row in rows] == [
+            value or "" for value in df["transaction_bank_reference_number"]
+        ]
+
+    def test_failed_export_removes_output(self, tmpdir_path):
+        """Test that a validation error stops the export and leaves no partial output file"""
+        input_file = Path(tmpdir_path, "input.bai")
+        input_file.write_text(SAMPLE_3.read_text().replace("49,6835,34/", "49,6835,35/"))
+
+        with pytest.raises(exc.Bai2ReaderException):
+            BAI2Reader(run_validation=True).export_file(
+                input_file, output_dir=tmpdir_path, output_file_name="output.csv"
+            )
+
+        assert not Path(tmpdir_path, "output.csv").exists()
+
+    def test_write_args_use_pandas(self, tmpdir_path):
+        """Test that write args are still passed to pandas"""
+        output = BAI2Reader(run_validation=True).export_file(
+            SAMPLE_3, output_dir=tmpdir_path, output_file_name="sample_3.csv", write_args={"index": False, "sep": ";"}
+        )
+
+        assert output.read_text().startswith("file_header_sender;")
+
+    def test_compressed_input(self, tmpdir_path):
+        """Test that a compressed file is exported like the plain one"""
+        input_file = Path(tmpdir_path, "sample_3.bai.gz")
+        input_file.write_bytes(gzip.compress(SAMPLE_3.read_bytes()))
+        reader = BAI2Reader(run_validation=True)
+
+        compressed = reader.export_file(input_file, output_dir=tmpdir_path, output_file_name="compressed.csv")
+        plain = reader.export_file(SAMPLE_3, output_dir=tmpdir_path, output_file_name="plain.csv")
+
+        assert compressed.read_text() == plain.read_text()
+        assert reader.stats.record_counts["transaction"] == 4
+
+
+class TestStreamingJsonLines:
+    """Test cases for the JSON Lines export, to a file or to a stream"""
+
+    @pytest.mark.parametrize("sample", SAMPLES, ids=lambda path: path.stem)
+    def test_export_file_matches_write_data(self, sample, tmpdir_path):
+        """Test that the lines streamed from the parser are the lines of the Bai2Model"""
+        reader = BAI2Reader(run_validation=False, output_format=enums.OutputFormat.JSONL)
+
+        streamed = reader.export_file(sample, output_dir=tmpdir_path, output_file_name="streamed.jsonl")
+        written = reader.read_file(sample).write_data(output_dir=tmpdir_path, output_file_name="written.jsonl")
+
+        assert streamed.read_text() == written.read_text()
+
+    def test_objects(self, tmpdir_path):
+        """Test that every line is one compact object with all columns, with typed values"""
+        reader = BAI2Reader(run_validation=True, output_format="jsonl")
+
+        output = reader.export_file(SAMPLE_3, output_dir=tmpdir_path)
+
+        lines = output.read_text().splitlines()
+        assert output.suffix == ".jsonl"
+        assert len(lines) == 4
+        assert lines[0].startswith('{"file_header_sender":"GSBI","file_header_receiver":"test1",')
+        objects = [json.loads(line) for line in lines]
+        assert list(objects[0]) == list(flat.FLAT_COLUMNS)
+        assert [obj["transaction_amount"] for obj in objects] == [65.0, 6600.0, 6500.0, 20000.0]
+        assert objects[0]["account_trailer_num_of_records"] == 34
+
+    @pytest.mark.parametrize("output_format", ["jsonl", "csv"])
+    def test_output_stream(self, output_format, tmpdir_path):
+        """Test that the text formats are written to an open stream the same as to a file"""
+        reader = BAI2Reader(run_validation=True, output_format=output_format)
+        stream = io.StringIO()
+
+        assert reader.export_file(SAMPLE_3, output_stream=stream) is None
+
+        output = reader.export_file(SAMPLE_3, output_dir=tmpdir_path, output_file_name="sample_3")
+        assert stream.getvalue() == output.read_text()
+        assert not stream.closed
+
+    @pytest.mark.parametrize("output_format, write_args", [("parquet", None), ("jsonl", {"lines": True})])
+    def test_output_stream_not_supported(self, output_format, write_args):
+        """Test that the binary formats and the pandas writes can't go to a stream"""
+        with pytest.raises(exc.Bai2ReaderException, match="can be written to a stream"):
+            BAI2Reader(output_format=output_format).export_file(
+                SAMPLE_3, output_stream=io.StringIO(), write_args=write_args
+            )
+
+    def test_cli_stdout(self):
+        """Test that `--output -` writes the export to stdout"""
+        typer_testing = pytest.importorskip("typer.testing")
+        from bai2_reader.src.cli import app
+
+        result = typer_testing.CliRunner().invoke(
+            app, ["export", "--input-files", str(SAMPLE_3), "--output-format", "jsonl", "--output", "-"]
+        )
+
+        assert result.exit_code == 0
+        assert [json.loads(line)["transaction_type_code"] for line in result.stdout.splitlines()] == [
+            "495",
+            "447",
+            "447",
+            "195",
+        ]
+
+    def test_cli_output_file(self, tmpdir_path):
+        """Test that `--output` writes a single input file to the given path"""
+        typer_testing = pytest.importorskip("typer.testing")
+        from bai2_reader.src.cli import app
+
+        output = Path(tmpdir_path, "nested", "sample_3.csv")
+        result = typer_testing.CliRunner().invoke(app, ["export", "--input-files", str(SAMPLE_3), "--output", output])
+
+        assert result.exit_code == 0
+        assert read_csv(output)[0] == list(flat.FLAT_COLUMNS)
+
+
+class TestStreamingParquet:
+    """Test cases for the Parquet export in row groups"""
+
+    @pytest.fixture(autouse=True)
+    def parquet(self):
+        """The pyarrow parquet module, the tests are skipped without pyarrow"""
+        return pytest.importorskip("pyarrow.parquet")
+
+    @pytest.mark.parametrize("sample", SAMPLES, ids=lambda path: path.stem)
+    def test_export_file_matches_write_data(self, sample, tmpdir_path, parquet):
+        """Test that the table streamed from the parser is the table of the Bai2Model"""
+        reader = BAI2Reader(run_validation=False, output_format=enums.OutputFormat.PARQUET)
+
+        streamed = reader.export_file(sample, output_dir=tmpdir_path, output_file_name="streamed.parquet")
+        written = reader.read_file(sample).write_data(output_dir=tmpdir_path, output_file_name="written.parquet")
+
+        assert parquet.read_table(streamed).equals(parquet.read_table(written))
+
+    def test_schema(self, tmpdir_path, parquet):
+        """Test the typed amounts and counts, and the dictionary encoded header and code columns"""
+        reader = BAI2Reader(run_validation=True, output_format="parquet")
+
+        output = reader.export_file(SAMPLE_3, output_dir=tmpdir_path, output_file_name="sample_3.parquet")
+
+        schema = parquet.read_schema(output)
+        assert schema.names == list(flat.FLAT_COLUMNS)
+        assert str(schema.field("transaction_amount").type) == "double"
+        assert str(schema.field("account_trailer_num_of_records").type) == "int64"
+        assert str(schema.field("transaction_description").type) == "string"
+        for column in ("file_header_sender", "account_identifier_account_number", "transaction_type_code"):
+            assert str(schema.field(column).type) == "dictionary<values=string, indices=int32, ordered=0>"
+
+        table = parquet.read_table(output)
+        assert table.column("transaction_amount").to_pylist() == [65.0, 6600.0, 6500.0, 20000.0]
+
+    def test_minor_units(self, tmpdir_path, parquet):
+        """Test that the amounts are integers when they are read as minor units"""
+        reader = BAI2Reader(run_validation=True, output_format="parquet", amount_mode=enums.AmountMode.minor_units)
+
+        output = reader.export_file(SAMPLE_3, output_dir=tmpdir_path, output_file_name="sample_3.parquet")
+
+        assert str(parquet.read_schema(output).field("transaction_amount").type) == "int64"
+
+    def test_row_groups_and_compression(self, tmpdir_path, parquet):
+        """Test that the writer args set the row group size and the compression codec"""
+        reader = BAI2Reader(run_validation=False, output_format="parquet")
+
+        output = reader.export_file(
+            SAMPLE_1,
+            output_dir=tmpdir_path,
+            output_file_name="sample_1.parquet",
+            writer_args={"row_group_size": 8, "compression": "gzip"},
+        )
+
+        metadata = parquet.ParquetFile(output).metadata
+        assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [8, 8, 4]
+        assert metadata.row_group(0).column(0).compression == "GZIP"
+
+    def test_unsupported_compression(self, tmpdir_path):
+        """Test that an unknown codec fails the export"""
+        with pytest.raises(exc.Bai2ReaderException, match="Unsupported parquet compression"):
+            writers.write_parquet(Path(tmpdir_path, "output.parquet"), [], compression="zip")
+
+
+class TestStreamingExcel:
+    """Test cases for the Excel export in the constant memory mode of xlsxwriter"""
+
+    @pytest.fixture(autouse=True)
+    def xlsxwriter(self):
+        """The tests are skipped without xlsxwriter"""
+        return pytest.importorskip("xlsxwriter")
+
+    def test_export_file(self, tmpdir_path):
+        """Test that all rows are written to one sheet, the default file name has the xlsx extension"""
+        reader = BAI2Reader(run_validation=False, output_format="excel")
+
+        output = reader.export_file(SAMPLE_1, output_dir=tmpdir_path)
+
+        assert output.suffix == ".xlsx"
+        assert read_sheets(output) == [("transactions", 21)]
+        with zipfile.ZipFile(output) as workbook:
+            sheet = workbook.read("xl/worksheets/sheet1.xml").decode()
+        assert "file_header_sender" in sheet and "<f>" not in sheet
+
+    @pytest.mark.parametrize(
+        "split_by, sheets",
+        [("group", [("group 1", 21)]), (enums.Section.account, [("107049932", 4), ("104108339", 18)])],
+    )
+    def test_split_by(self, split_by, sheets, tmpdir_path):
+        """Test that every group or account gets its own sheet"""
+        reader = BAI2Reader(run_validation=False, output_format="excel").read_file(SAMPLE_1)
+
+        output = reader.write_data(output_dir=tmpdir_path, writer_args={"split_by": split_by})
+
+        assert read_sheets(output) == sheets
+
+    def test_roll_over(self, tmpdir_path):
+        """Test that a full sheet rolls over to a new sheet with a numbered name"""
+        chunks = flat.record_rows(
+            BAI2Reader(run_validation=False).iter_records(SAMPLE_1),
+            flat.scan_envelope(SAMPLE_1.read_text().splitlines()),
+            chunk_size=3,
+            keyed=True,
+        )
+
+        rows = writers.write_excel(Path(tmpdir_path, "output.xlsx"), chunks, max_rows=8)
+
+        assert rows == 20
+        assert read_sheets(Path(tmpdir_path, "output.xlsx")) == [
+            ("transactions", 8),
+            ("transactions (2)", 8),
+            ("transactions (3)", 7),
+        ]
+
+    def test_sheet_names(self):
+        """Test that the sheet names are valid in Excel and unique"""
+        used = {}
+
+        names = [writers._sheet_name(name, used) for name in ["a/b:c", "A_B_C", "x" * 40, "", ""]]
+
+        assert names == ["a_b_c", "A_B_C (2)", "x" * 31, "sheet", "sheet (2)"]
+
+
+class TestSinks:
+    """Test cases for the sinks the streaming writers are built on"""
+
+    def test_sink_is_abstract(self):
+        """Test that a sink has to implement how a chunk is written"""
+        with pytest.raises(TypeError, match="write"):
+            writers.Sink()
+
+    def test_write_all(self):
+        """Test that all chunks are written to a stream that is left open, and the rows counted"""
+        stream = io.StringIO()
+
+        rows = writers.CsvSink(stream, ("a", "b")).write_all([[(1, "x")], [(2, None), (3, "z")]])
+
+        assert rows == 3
+        assert stream.getvalue() == "a,b\n1,x\n2,\n3,z\n"
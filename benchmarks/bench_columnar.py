@@ -0,0 +1,42 @@
+"""Benchmark of the columnar engine against the Bai2Model -> `bai_to_json` -> `json_normalize` path of
+`to_flat_dataframe`, on a synthetic file of ~1M records.
+
+    PYTHONPATH=app python benchmarks/bench_columnar.py
+"""
+
+import tempfile
+import time
+
+from pathlib import Path
+
+from bai2_reader import BAI2Reader
+from synthetic import write_synthetic_file
+
+
+def main():
+    """Runs the benchmark and prints the time and transactions/s of both paths"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = write_synthetic_file(
+            Path(tmpdir, "synthetic.bai"),
+            num_groups=10,
+            accounts_per_group=10,
+            transactions_per_account=3333,
+            continuations_per_transaction=2,
+        )
+        reader = BAI2Reader(run_validation=False)
+
+        start = time.perf_counter()
+        df = reader.read_file(path).to_flat_dataframe()
+        flat_elapsed = time.perf_counter() - start
+        print(f"to_flat_dataframe: {flat_elapsed:.2f}s, {len(df) / flat_elapsed:,.0f} transactions/s")
+
+        start = time.perf_counter()
+        df = reader.read_columns(path).to_dataframe()
+        columnar_elapsed = time.perf_counter() - start
+        print(f"     read_columns: {columnar_elapsed:.2f}s, {len(df) / columnar_elapsed:,.0f} transactions/s")
+
+        print(f"speedup: {flat_elapsed / columnar_elapsed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
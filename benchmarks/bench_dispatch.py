@@ -0,0 +1,71 @@
+"""Micro-benchmark of the per-line record dispatch overhead.
+
+Compares the previous `enums.Record(line[:2])` + if/elif chain with the `parser.RECORD_HANDLERS` table lookup,
+on a synthetic file of ~1M records.
+
+    PYTHONPATH=app python benchmarks/bench_dispatch.py
+"""
+
+import tempfile
+import time
+
+from pathlib import Path
+
+from bai2_reader.src import enums, parser
+from synthetic import write_synthetic_file
+
+
+def dispatch_enum_chain(line: str):
+    """Record dispatch as it was done before the handler table"""
+    record_code = enums.Record(line[:2])
+    if record_code == enums.Record.file_header:
+        return parser.parse_file_header
+    elif record_code == enums.Record.group_header:
+        return parser.parse_group_header
+    elif record_code == enums.Record.account_identifier:
+        return parser.parse_account_identifier
+    elif record_code == enums.Record.transaction:
+        return parser.parse_transaction
+    elif record_code == enums.Record.account_trailer:
+        return parser.parse_account_trailer
+    elif record_code == enums.Record.continuation:
+        return parser.parse_continuation
+    elif record_code == enums.Record.group_trailer:
+        return parser.parse_group_trailer
+    elif record_code == enums.Record.file_trailer:
+        return parser.parse_file_trailer
+
+
+def dispatch_table(line: str):
+    """Record dispatch using the handler table"""
+    return parser.RECORD_HANDLERS[line[:2]]
+
+
+def main():
+    """Runs the benchmark and prints the per-line overhead"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = write_synthetic_file(
+            Path(tmpdir, "synthetic.bai"),
+            num_groups=10,
+            accounts_per_group=10,
+            transactions_per_account=3333,
+            continuations_per_transaction=2,
+        )
+        with open(path, encoding="utf-8") as file:
+            lines = file.readlines()
+
+    print(f"records: {len(lines):,}")
+    results = {}
+    for name, dispatch in [("enum + if/elif", dispatch_enum_chain), ("handler table", dispatch_table)]:
+        start = time.perf_counter()
+        for line in lines:
+            dispatch(line)
+        elapsed = time.perf_counter() - start
+        results[name] = elapsed
+        print(f"{name:>15}: {elapsed:.3f}s, {elapsed / len(lines) * 1e9:.0f} ns/line")
+
+    print(f"speedup: {results['enum + if/elif'] / results['handler table']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
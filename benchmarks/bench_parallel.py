@@ -0,0 +1,87 @@
+"""Benchmark of the parallel parsing of a single file, split at its group boundaries.
+
+Compares the sequential reads with `workers=N` on a synthetic file of ~1M records in 20 groups, for `read_columns`,
+whose workers send back column buffers, and `read_file`, whose workers send back model trees that the parent unpickles
+one after another. The speedup is bound by the number of CPUs of the machine, on a single CPU both parallel reads are
+slower than the sequential ones.
+The work that the parent does on its own (unpickling and stitching the segments) is timed as well, the sequential read
+divided by it is the speedup that no number of CPUs can exceed: about 7x for `read_columns`, 2x for `read_file`.
+
+    PYTHONPATH=app python benchmarks/bench_parallel.py
+"""
+
+import os
+import pickle
+import tempfile
+import time
+
+from pathlib import Path
+
+from bai2_reader.src import columnar, enums, parallel, parser
+from bai2_reader.src.reader import BAI2Reader
+from synthetic import write_synthetic_file
+
+
+def parent_seconds(path: Path) -> dict:
+    """Time the parent spends on the segments of both parallel reads, once they are parsed and pickled by the workers"""
+    args = (False, False, "utf-8", ",", enums.AmountMode.float)
+    segments = parallel.scan_segments(path)
+
+    columns = [
+        pickle.dumps(parallel._parse_segment_columns(path, segment, *args), protocol=pickle.HIGHEST_PROTOCOL)
+        for segment in segments
+    ]
+    start = time.perf_counter()
+    data = columnar.ColumnarData()
+    for segment_data in columns:
+        data.extend(pickle.loads(segment_data))
+    seconds = {"read_columns": time.perf_counter() - start}
+    del columns, data
+
+    models = [parallel._parse_segment(path, segment, *args) for segment in segments]
+    start = time.perf_counter()
+    with parser.gc_paused():
+        groups = [pickle.loads(segment_data) for segment_data in models]
+    seconds["read_file"] = time.perf_counter() - start
+    del models, groups
+
+    return seconds
+
+
+def main():
+    """Runs the benchmark and prints the records per second for every number of workers"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = write_synthetic_file(
+            Path(tmpdir, "synthetic.bai"),
+            num_groups=20,
+            accounts_per_group=10,
+            transactions_per_account=1666,
+            continuations_per_transaction=2,
+        )
+        with open(path, encoding="utf-8") as file:
+            num_records = sum(1 for _ in file)
+
+        print(f"records: {num_records:,}, cpus: {os.cpu_count()}")
+        sequential = {}
+        for name in ("read_columns", "read_file"):
+            results = {}
+            for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+                read = getattr(BAI2Reader(run_validation=False), name)
+                start = time.perf_counter()
+                read(path, workers=workers)
+                elapsed = time.perf_counter() - start
+                results[workers] = elapsed
+                print(f"{name} workers {workers:>2}: {elapsed:.2f}s, {num_records / elapsed:,.0f} records/s")
+
+            for workers, elapsed in results.items():
+                print(f"{name} speedup with {workers} workers: {results[1] / elapsed:.2f}x")
+            sequential[name] = results[1]
+
+        for name, seconds in parent_seconds(path).items():
+            print(
+                f"{name} parent: {seconds:.2f}s, max speedup with any number of CPUs: {sequential[name] / seconds:.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
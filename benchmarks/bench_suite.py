@@ -0,0 +1,211 @@
+"""Benchmark suite of the reading and the exports of a BAI2 file, on a synthetic file of `synthetic.py`.
+
+Every case is timed on its own, best of `--repeat` runs, and reports the records/s and MB/s of the input file and
+the peak memory of its Python allocations, measured with tracemalloc in a separate run (numpy and pandas buffers are
+traced too). The results are compared to the stored baseline, a case that is slower or uses more memory than the
+baseline by more than `--tolerance` is reported as a regression and the exit code is 1. So is a case that fails, or
+that has no result in the baseline.
+
+    PYTHONPATH=app python benchmarks/bench_suite.py                  # run and compare to baseline.json
+    PYTHONPATH=app python benchmarks/bench_suite.py --save-baseline  # run and store the results as the baseline
+    PYTHONPATH=app python benchmarks/bench_suite.py --cases read_file  # run the cases with 'read_file' in their name
+
+The baseline is machine specific, save it again on the machine that runs the comparison.
+"""
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple
+
+from bai2_reader import BAI2Reader
+from bai2_reader.src import enums
+from bai2_reader.src.logger import log
+from bai2_reader.src.reader import STREAMING_FORMATS
+from synthetic import write_synthetic_file
+
+BASELINE_FILE = Path(Path(__file__).parent, "baseline.json")
+
+
+class Case(NamedTuple):
+    """A benchmark case, `setup` runs before the timer starts and returns the input of `run`"""
+
+    name: str
+    setup: Callable[[], object]
+    run: Callable[[object], object]
+
+
+def cases(path: Path, output_dir: Path) -> List[Case]:
+    """The benchmark cases: the read, the flat DataFrame, the export of the read file in every output format, and the
+    streaming export of the file in every streaming format
+    """
+
+    def read_file():
+        return BAI2Reader(run_validation=True).read_file(path)
+
+    def read_file_debug():
+        # the debug records are created but not printed, the console handler is at info level
+        level = log.level
+        log.setLevel(logging.DEBUG)
+        try:
+            return read_file()
+        finally:
+            log.setLevel(level)
+
+    suite = [
+        Case("read_file", lambda: None, lambda _: read_file()),
+        Case("read_file[debug]", lambda: None, lambda _: read_file_debug()),
+        Case("to_flat_dataframe", read_file, lambda reader: reader.to_flat_dataframe()),
+    ]
+    for output_format in enums.OutputFormat:
+
+        def write(reader, output_format=output_format):
+            reader.write_data(
+                output_dir=output_dir, output_file_name=f"output.{output_format.value}", output_format=output_format
+            )
+
+        suite.append(Case(f"write_data[{output_format.value}]", read_file, write))
+
+    for output_format in STREAMING_FORMATS:
+
+        def export(_, output_format=output_format):
+            BAI2Reader(run_validation=True).export_file(
+                path,
+                output_dir=output_dir,
+                output_file_name=f"export.{output_format.value}",
+                output_format=output_format,
+            )
+
+        suite.append(Case(f"export_file[{output_format.value}]", lambda: None, export))
+    return suite
+
+
+def measure(case: Case, repeat: int) -> Dict[str, float]:
+    """Best time of `repeat` runs, and the peak of the Python allocations of one more run"""
+    seconds = []
+    for _ in range(repeat):
+        value = case.setup()
+        gc.collect()
+        start = time.perf_counter()
+        case.run(value)
+        seconds.append(time.perf_counter() - start)
+
+    value = case.setup()
+    gc.collect()
+    tracemalloc.start()
+    case.run(value)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {"seconds": min(seconds), "peak_mb": peak / 2**20}
+
+
+def compare(results: Dict[str, Dict], baseline: Dict, tolerance: float) -> List[str]:
+    """The cases of the results that regressed compared to the baseline. A case that failed, or that has no result in
+    the baseline to compare to, is reported too, so that a stale baseline can't hide the regressions of a case
+    """
+    regressions = []
+    for name, result in results["cases"].items():
+        expected = baseline["cases"].get(name)
+        if "error" in result:
+            regressions.append(f"{name}: failed: {result['error']}")
+            continue
+        if expected is None:
+            regressions.append(f"{name}: not in the baseline, save the baseline again")
+            continue
+        if "error" in expected:
+            regressions.append(f"{name}: failed in the baseline ({expected['error']}), save the baseline again")
+            continue
+        for metric in ("seconds", "peak_mb"):
+            if result[metric] > expected[metric] * (1 + tolerance):
+                regressions.append(f"{name}: {metric} {result[metric]:.2f} > baseline {expected[metric]:.2f}")
+    return regressions
+
+
+def main():
+    """Runs the suite, prints a table of the results and compares them to the baseline"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=5, help="Number of groups of the synthetic file")
+    parser.add_argument("--accounts", type=int, default=10, help="Number of accounts per group")
+    parser.add_argument("--transactions", type=int, default=1000, help="Number of transactions per account")
+    parser.add_argument("--continuations", type=int, default=2, help="Number of continuations per transaction")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs of every case")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown over the baseline")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Path of the baseline results")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the baseline")
+    parser.add_argument("--cases", default="", help="Only run the cases with this text in their name")
+    args = parser.parse_args()
+
+    size = {
+        "num_groups": args.groups,
+        "accounts_per_group": args.accounts,
+        "transactions_per_account": args.transactions,
+        "continuations_per_transaction": args.continuations,
+    }
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = write_synthetic_file(Path(tmpdir, "synthetic.bai"), seed=0, **size)
+        with open(path, "rb") as file:
+            records = sum(1 for _ in file)
+        megabytes = path.stat().st_size / 2**20
+        results = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "size": size,
+            "records": records,
+            "megabytes": round(megabytes, 2),
+            "cases": {},
+        }
+        print(f"synthetic file: {records:,} records, {megabytes:.1f} MB")
+        print(f"{'case':<22} {'seconds':>8} {'records/s':>12} {'MB/s':>8} {'peak MB':>8}")
+
+        for case in cases(path, Path(tmpdir, "output")):
+            if args.cases not in case.name:
+                continue
+            try:
+                result = measure(case, args.repeat)
+            except Exception as e:
+                results["cases"][case.name] = {"error": f"{type(e).__name__}: {e}"}
+                print(f"{case.name:<22} failed: {type(e).__name__}: {e}")
+                continue
+
+            result["records_per_second"] = records / result["seconds"]
+            result["megabytes_per_second"] = megabytes / result["seconds"]
+            results["cases"][case.name] = {metric: round(value, 4) for metric, value in result.items()}
+            print(
+                f"{case.name:<22} {result['seconds']:>8.3f} {result['records_per_second']:>12,.0f} "
+                f"{result['megabytes_per_second']:>8.2f} {result['peak_mb']:>8.1f}"
+            )
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"baseline saved to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}, run with --save-baseline to store one")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline["size"] != size:
+        print(f"the baseline was measured on a file of another size: {baseline['size']}")
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"regression: {regression}")
+    if regressions:
+        sys.exit(1)
+    print(f"no regression over the baseline, tolerance {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark of the validated and the trusted (no pydantic validation) parse modes of `BAI2Reader.read_file`.
+
+Validation is a small part of the per-record cost, expect the trusted mode to be about 10% faster.
+Run it with: PYTHONPATH=app python benchmarks/bench_trusted.py
+"""
+
+import tempfile
+import time
+
+from pathlib import Path
+
+from bai2_reader import BAI2Reader
+from synthetic import write_synthetic_file
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def main():
+    """Runs the benchmark and prints the records/s of both modes for every file size"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for size in SIZES:
+            # every transaction is 3 records: one '16' and two '88'
+            path = write_synthetic_file(
+                Path(tmpdir, f"synthetic_{size}.bai"),
+                num_groups=10,
+                accounts_per_group=10,
+                transactions_per_account=size // 300,
+                continuations_per_transaction=2,
+            )
+
+            # an untimed read first, so that the first timed mode doesn't pay for the warm up (imports, type codes)
+            BAI2Reader(run_validation=False).read_file(path)
+
+            results = {}
+            for name, trusted in [("validated", False), ("trusted", True)]:
+                reader = BAI2Reader(run_validation=False, trusted=trusted)
+                start = time.perf_counter()
+                reader.read_file(path)
+                results[name] = time.perf_counter() - start
+                records = reader.bai_data.file_trailer.num_of_records
+                print(
+                    f"{size:>10,} records | {name:>9}: {results[name]:.2f}s, {records / results[name]:,.0f} records/s"
+                )
+
+            print(f"{size:>10,} records | speedup: {results['validated'] / results['trusted']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Deterministic generator of synthetic BAI2 files, used by the benchmarks
+
+Every account has the status and summary fields of its transactions in its '03' record, every transaction has a
+chain of '88' continuation records, and the trailers have the control totals and record counts of the file.
+
+    python benchmarks/synthetic.py synthetic.bai --groups 10 --accounts 10 --transactions 1000
+"""
+
+import argparse
+import random
+
+from pathlib import Path
+from typing import Iterator
+
+TYPE_CODES = ["115", "142", "165", "175", "195", "257", "266", "275", "447", "451", "475", "495", "698"]
+CONTINUATION_TAGS = ["EREF", "DBNM", "CACT", "REMI"]
+
+
+def generate_lines(
+    num_groups: int = 1,
+    accounts_per_group: int = 10,
+    transactions_per_account: int = 100,
+    continuations_per_transaction: int = 2,
+    seed: int = 0,
+) -> Iterator[str]:
+    """Generates the lines of a valid BAI2 file, the same arguments always generate the same file
+    :param num_groups: Number of '02' groups in the file
+    :param accounts_per_group: Number of '03' accounts in every group
+    :param transactions_per_account: Number of '16' transactions in every account
+    :param continuations_per_transaction: Number of '88' continuation records after every transaction
+    :param seed: Seed of the random generator used for the amounts and references
+    :return: Iterator of the lines, without the line endings
+    """
+    rng = random.Random(seed)
+
+    file_total = 0
+    file_records = 2
+    yield "01,SENDER,RECEIVER,230906,2000,1,,,2/"
+
+    for group_number in range(num_groups):
+        group_total = 0
+        group_records = 2
+        yield "02,RECEIVER,026015079,1,230906,2000,USD,2/"
+
+        for account_number in range(accounts_per_group):
+            # the transactions are drawn first, the status and summary fields of the '03' record are their totals
+            transactions = [
+                (rng.choice(TYPE_CODES), rng.randint(1, 10_000_000)) for _ in range(transactions_per_account)
+            ]
+            credits = [amount for type_code, amount in transactions if type_code < "400"]
+            debits = [amount for type_code, amount in transactions if type_code >= "400"]
+            opening = rng.randint(0, 10**11)
+            closing = opening + sum(credits) - sum(debits)
+
+            account_total = 0
+            account_records = 2
+            yield (
+                f"03,{100000000 + group_number * accounts_per_group + account_number},USD,"
+                f"010,{opening},,,015,{closing},,,040,{opening},,,045,{closing},,,"
+                f"100,{sum(credits)},{len(credits)},,400,{sum(debits)},{len(debits)},/"
+            )
+
+            for transaction_number, (type_code, amount) in enumerate(transactions):
+                account_total += amount
+                account_records += 1 + continuations_per_transaction
+
+                reference = f"REF{group_number:04d}{account_number:05d}{transaction_number:08d}"
+                yield f"16,{type_code},{amount},0,{reference},{rng.randint(1, 10**9)},Synthetic Payment"
+                for continuation_number in range(continuations_per_transaction):
+                    yield f"88,{_continuation(reference, continuation_number)}"
+
+            yield f"49,{account_total},{account_records}/"
+            group_total += account_total
+            group_records += account_records
+
+        yield f"98,{group_total},{accounts_per_group},{group_records}/"
+        file_total += group_total
+        file_records += group_records
+
+    yield f"99,{file_total},{num_groups},{file_records}/"
+
+
+def _continuation(reference: str, continuation_number: int) -> str:
+    """Text of a continuation record, a chain of tagged fields followed by untagged remittance lines"""
+    if continuation_number < len(CONTINUATION_TAGS):
+        return f"{CONTINUATION_TAGS[continuation_number]}: {reference}-{continuation_number}"
+    return f"remittance line {continuation_number} of {reference}"
+
+
+def write_synthetic_file(path: str | Path, **kwargs) -> Path:
+    """Writes a synthetic BAI2 file, see `generate_lines` for the arguments
+    :param path: The path where the file is written
+    :return: The path of the written file
+    """
+    path = Path(path)
+    with open(path, "w", encoding="utf-8") as file:
+        for line in generate_lines(**kwargs):
+            file.write(line + "\n")
+    return path
+
+
+def main():
+    """Writes a synthetic file from the command line arguments"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", help="Path of the file to write")
+    parser.add_argument("--groups", type=int, default=1, help="Number of groups")
+    parser.add_argument("--accounts", type=int, default=10, help="Number of accounts per group")
+    parser.add_argument("--transactions", type=int, default=100, help="Number of transactions per account")
+    parser.add_argument("--continuations", type=int, default=2, help="Number of continuations per transaction")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random generator")
+    args = parser.parse_args()
+
+    write_synthetic_file(
+        args.path,
+        num_groups=args.groups,
+        accounts_per_group=args.accounts,
+        transactions_per_account=args.transactions,
+        continuations_per_transaction=args.continuations,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()